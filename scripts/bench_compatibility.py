@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark: re-checking a library after a profile switch.
+
+Compares, per profile:
+
+* plain:  the full evaluation (format detection, rule checks, messages and
+  plan) for every track, as done before verdicts were memoized;
+* check:  CompatibilityEngine.check with a warm verdict cache (one lookup
+  plus building the CompatibilityResult);
+* lookup: lookup_verdict on keys computed once per track, i.e. what a
+  library that keeps its keys pays to re-check a row.
+
+It then times CompatibilityEngine.recheck, i.e. a GUI profile switch with
+``--switch-tracks`` files loaded (goal: well under 100 ms for 10k).
+
+Usage:
+    python scripts/bench_compatibility.py [--tracks 50000] [--repeat 3]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from bench_library_memory import synthetic_metadata  # noqa: E402
+from dr_cdj.compatibility import (  # noqa: E402
+    CompatibilityEngine,
+    _evaluate,
+    compile_profile,
+    lookup_verdict,
+    verdict_key,
+)
+from dr_cdj.config import CDJ_PROFILES  # noqa: E402
+
+
+def best_of(repeat: int, run) -> float:
+    """Return the fastest of ``repeat`` runs, in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tracks", type=int, default=50_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--switch-tracks", type=int, default=10_000)
+    args = parser.parse_args()
+
+    tracks = synthetic_metadata(args.tracks)
+    keys = [verdict_key(metadata) for metadata in tracks]
+    print(f"Tracks: {len(tracks):,} ({len(set(keys))} distinct keys)")
+    print(f"{'Profile':<16} {'plain':>10} {'check':>10} {'lookup':>10} {'speed-up':>9}")
+    for profile_id, profile in CDJ_PROFILES.items():
+        compiled = compile_profile(profile)
+        engine = CompatibilityEngine(profile_id)
+
+        def plain():
+            for metadata in tracks:
+                _evaluate(compiled, verdict_key(metadata))
+
+        def check():
+            for metadata in tracks:
+                engine.check(metadata)
+
+        def lookup():
+            for key in keys:
+                lookup_verdict(profile_id, key)
+
+        t_plain = best_of(args.repeat, plain)
+        t_check = best_of(args.repeat, check)
+        t_lookup = best_of(args.repeat, lookup)
+        print(f"{profile_id:<16} {t_plain * 1000:>8.1f}ms {t_check * 1000:>8.1f}ms "
+              f"{t_lookup * 1000:>8.1f}ms {t_plain / t_lookup:>8.1f}x")
+
+    engine = CompatibilityEngine()
+    loaded = [engine.check(metadata) for metadata in tracks[:args.switch_tracks]]
+    print(f"\nProfile switch, {len(loaded):,} loaded files:")
+    previous = engine.profile_id
+    for profile_id in CDJ_PROFILES:
+        if profile_id == previous:
+            continue
+        engine.set_profile(profile_id)
+        start = time.perf_counter()
+        loaded, changed = engine.recheck(loaded)
+        elapsed = time.perf_counter() - start
+        print(f"  {previous:<14} → {profile_id:<14} {elapsed * 1000:>7.1f}ms "
+              f"({len(changed):,} rows changed)")
+        previous = profile_id
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
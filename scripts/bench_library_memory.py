@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Memory benchmark: list of CompatibilityResult vs LibraryTable.
+
+Builds a synthetic library (folders of tracks with the codec/rate mix of a
+typical DJ collection), runs it through the compatibility engine and
+measures the memory held by each representation with tracemalloc.
+
+Usage:
+    python scripts/bench_library_memory.py [--tracks 100000]
+"""
+
+import argparse
+import gc
+import random
+import sys
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from dr_cdj.analyzer import AudioMetadata  # noqa: E402
+from dr_cdj.compatibility import CompatibilityEngine  # noqa: E402
+from dr_cdj.library import LibraryTable  # noqa: E402
+
+# (format_name, codec, suffix, sample rate, bit depth, lossy, float, weight)
+TRACK_KINDS = [
+    ("MP3", "mp3", ".mp3", 44100, None, True, False, 45),
+    ("AAC", "aac", ".m4a", 44100, None, True, False, 15),
+    ("WAV", "pcm_s16le", ".wav", 44100, 16, False, False, 15),
+    ("WAV", "pcm_s24le", ".wav", 48000, 24, False, False, 8),
+    ("WAV", "pcm_f32le", ".wav", 96000, 32, False, True, 4),
+    ("AIFF", "pcm_s16be", ".aiff", 44100, 16, False, False, 8),
+    ("FLAC", "flac", ".flac", 96000, 24, False, False, 5),
+]
+
+
+def synthetic_metadata(count: int, seed: int = 1) -> list[AudioMetadata]:
+    """Return ``count`` realistic AudioMetadata spread over ~count/50 folders."""
+    rng = random.Random(seed)
+    weights = [kind[-1] for kind in TRACK_KINDS]
+    folders = [
+        Path("/Users/dj/Music") / f"Crate {i // 20:03d}" / f"Release {i:05d}"
+        for i in range(max(1, count // 50))
+    ]
+    tracks = []
+    for i in range(count):
+        fmt, codec, suffix, rate, depth, lossy, is_float, _ = rng.choices(TRACK_KINDS, weights)[0]
+        path = rng.choice(folders) / f"{i:06d} - Artist {i % 997} - Title {i}{suffix}"
+        tracks.append(
+            AudioMetadata(
+                filepath=path,
+                filename=path.name,
+                format_name=fmt,
+                codec=codec,
+                sample_rate=rate,
+                bit_depth=depth,
+                channels=2,
+                bitrate=320000 if lossy else None,
+                duration=rng.uniform(150, 600),
+                is_lossy=lossy,
+                is_float=is_float,
+            )
+        )
+    return tracks
+
+
+def measure(build) -> tuple[object, int]:
+    """Return (object built, bytes it keeps allocated)."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    built = build()
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return built, after - before
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tracks", type=int, default=100_000)
+    args = parser.parse_args()
+
+    engine = CompatibilityEngine()
+    # Each representation is measured from its own freshly analyzed input,
+    # as the analyzer would produce it (objects, paths and strings included)
+    results, objects_bytes = measure(
+        lambda: [engine.check(m) for m in synthetic_metadata(args.tracks)]
+    )
+    del results
+    table, table_bytes = measure(
+        lambda: LibraryTable.from_results(
+            engine.check(m) for m in synthetic_metadata(args.tracks)
+        )
+    )
+
+    print(f"Tracks:                   {len(table):>10,}")
+    print(f"CompatibilityResult list: {objects_bytes / len(table):>10.0f} bytes/track "
+          f"({objects_bytes / 2**20:.1f} MiB)")
+    print(f"LibraryTable:             {table_bytes / len(table):>10.0f} bytes/track "
+          f"({table_bytes / 2**20:.1f} MiB)")
+    print(f"Reduction:                {objects_bytes / table_bytes:>10.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
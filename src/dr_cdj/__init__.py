@@ -1,17 +1,44 @@
 """CDJ-Check: Audio Compatibility Checker & Converter per Pioneer CDJ-2000 Nexus."""
 
+import importlib
+
 __version__ = "0.1.0"
 __author__ = "CDJ-Check Team"
 
-from dr_cdj.analyzer import AudioAnalyzer
-from dr_cdj.compatibility import CompatibilityEngine, CompatibilityResult
-from dr_cdj.utils import get_ffmpeg_path, get_ffprobe_path, get_resource_path
+# Public names → defining module. Submodules are imported on first attribute
+# access, so ``import dr_cdj`` (CLI, GUI entry point) stays cheap.
+_LAZY_EXPORTS = {
+    "AudioAnalyzer": "dr_cdj.analyzer",
+    "CompatibilityEngine": "dr_cdj.compatibility",
+    "CompatibilityMatrix": "dr_cdj.compatibility",
+    "CompatibilityResult": "dr_cdj.compatibility",
+    "MetadataCache": "dr_cdj.cache",
+    "get_ffmpeg_path": "dr_cdj.utils",
+    "get_ffprobe_path": "dr_cdj.utils",
+    "get_resource_path": "dr_cdj.utils",
+}
 
 __all__ = [
     "AudioAnalyzer",
     "CompatibilityEngine",
+    "CompatibilityMatrix",
     "CompatibilityResult",
+    "MetadataCache",
     "get_ffmpeg_path",
     "get_ffprobe_path",
     "get_resource_path",
 ]
+
+
+def __getattr__(name: str):
+    """Import the module defining ``name`` on first access."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
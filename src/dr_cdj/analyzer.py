@@ -1,13 +1,24 @@
 """AudioAnalyzer: Extracts metadata from audio files using ffprobe."""
 
 import json
+import logging
 import subprocess
-from dataclasses import dataclass
+import time
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, replace
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-from dr_cdj.config import FFPROBE_TIMEOUT
-from dr_cdj.utils import get_ffprobe_path
+from dr_cdj.config import DEFAULT_ANALYSIS_WORKERS, FFPROBE_TIMEOUT, MAX_ANALYSIS_WORKERS
+from dr_cdj.fingerprint import ContentIndex
+from dr_cdj.headers import probe_header
+from dr_cdj.utils import cached_binary_info, get_ffprobe_path, record_binary
+
+if TYPE_CHECKING:
+    from dr_cdj.cache import MetadataCache
+
+logger = logging.getLogger(__name__)
 
 
 @dataclass
@@ -81,19 +92,32 @@ class AudioMetadata:
 
 
 class AudioAnalyzer:
-    """Analyzes audio files using ffprobe."""
+    """Analyzes audio files from their headers, falling back to ffprobe."""
 
-    def __init__(self, ffprobe_path: str | None = None):
+    def __init__(
+        self,
+        ffprobe_path: str | None = None,
+        cache: Optional["MetadataCache"] = None,
+        native: bool = True,
+    ):
         """Initialize analyzer.
         
         Args:
             ffprobe_path: Path to ffprobe executable. If None, uses get_ffprobe_path().
+            cache: Optional persistent metadata cache consulted before ffprobe.
+            native: Read WAV/AIFF/FLAC/MP3/M4A headers directly and only spawn
+                ffprobe for other or malformed files.
         """
         self.ffprobe_path = ffprobe_path or get_ffprobe_path()
+        self.cache = cache
+        self.native = native
+        self.last_batch_stats: dict = {}
         self._check_ffprobe()
 
     def _check_ffprobe(self) -> None:
-        """Verify ffprobe is available."""
+        """Verify ffprobe is available (skipped for already verified binaries)."""
+        if cached_binary_info(self.ffprobe_path) is not None:
+            return
         try:
             result = subprocess.run(
                 [self.ffprobe_path, "-version"],
@@ -103,6 +127,7 @@ class AudioAnalyzer:
             )
             if result.returncode != 0:
                 raise RuntimeError("ffprobe not working")
+            record_binary(self.ffprobe_path, result.stdout)
         except FileNotFoundError:
             raise RuntimeError(
                 f"ffprobe not found: {self.ffprobe_path}\n"
@@ -126,6 +151,49 @@ class AudioAnalyzer:
         if not filepath.exists():
             raise FileNotFoundError(f"File not found: {filepath}")
         
+        if self.cache is not None:
+            cached = self.cache.get(filepath)
+            if cached is not None:
+                return cached
+        
+        metadata = self._read_header(filepath) if self.native else None
+        if metadata is None:
+            metadata = self._run_ffprobe(filepath)
+        
+        if self.cache is not None:
+            self.cache.put(filepath, metadata)
+        
+        return metadata
+
+    def _read_header(self, filepath: Path) -> Optional[AudioMetadata]:
+        """Extract metadata by parsing the container header in-process.
+        
+        Args:
+            filepath: Path to audio file.
+            
+        Returns:
+            AudioMetadata, or None if the file needs ffprobe.
+        """
+        info = probe_header(filepath)
+        if info is None:
+            return None
+        try:
+            return self._parse_metadata(filepath, info.to_ffprobe_dict())
+        except RuntimeError:
+            return None
+
+    def _run_ffprobe(self, filepath: Path) -> AudioMetadata:
+        """Extract metadata by running ffprobe on a file.
+        
+        Args:
+            filepath: Path to audio file.
+            
+        Returns:
+            AudioMetadata parsed from ffprobe output.
+            
+        Raises:
+            RuntimeError: If ffprobe fails.
+        """
         cmd = [
             self.ffprobe_path,
             "-v", "error",
@@ -286,20 +354,171 @@ class AudioAnalyzer:
             is_float=is_float,
         )
 
-    def analyze_batch(self, filepaths: list[Path]) -> list[tuple[Path, Optional[AudioMetadata], Optional[str]]]:
-        """Analyze batch of files.
+    def _analyze_safe(
+        self, filepath: Path
+    ) -> tuple[Path, Optional[AudioMetadata], Optional[str]]:
+        """Analyze a file, turning any failure into an error message.
+
+        Args:
+            filepath: Path to audio file.
+
+        Returns:
+            Tuple (path, metadata, error_message).
+        """
+        try:
+            return filepath, self.analyze(filepath), None
+        except Exception as e:
+            return filepath, None, str(e)
+
+    def iter_analyze(
+        self,
+        filepaths: Iterable[Path],
+        max_workers: Optional[int] = None,
+        dedupe: bool = False,
+        full_hash: bool = False,
+    ) -> Iterator[tuple[int, Path, Optional[AudioMetadata], Optional[str]]]:
+        """Analyze files concurrently, yielding results as they complete.
+
+        Input is consumed lazily and at most ``2 * max_workers`` files are in
+        flight, so ``filepaths`` may be a generator that is still producing
+        paths. Each file is isolated: failures and ffprobe timeouts become
+        error messages and never stop the batch.
+
+        Throughput figures are stored in ``last_batch_stats`` once the
+        iterator is exhausted (or closed early).
+
+        Args:
+            filepaths: Iterable of file paths.
+            max_workers: Number of concurrent ffprobe processes
+                (default: one per CPU core).
+            dedupe: Analyze identical files (see dr_cdj.fingerprint) only
+                once; copies are yielded with the metadata of the first
+                one, under their own path, once it is analyzed.
+            full_hash: Compare whole-file hashes when deduplicating.
+
+        Yields:
+            Tuples (index, path, metadata, error_message), where ``index`` is
+            the position of the path in ``filepaths``.
+        """
+        workers = max_workers or DEFAULT_ANALYSIS_WORKERS
+        workers = max(1, min(workers, MAX_ANALYSIS_WORKERS))
+        max_in_flight = workers * 2
+
+        started = time.perf_counter()
+        done = 0
+        errors = 0
+        duplicates = 0
+        source = enumerate(filepaths)
+        exhausted = False
+        pending: dict = {}
+
+        content = ContentIndex(full_hash) if dedupe else None
+        original_index: dict[Path, int] = {}
+        # Original index → copies waiting for its result / its finished result
+        waiting: dict[int, list[tuple[int, Path]]] = {}
+        analyzed: dict[int, tuple[Optional[AudioMetadata], Optional[str]]] = {}
+
+        executor = ThreadPoolExecutor(max_workers=workers)
+        try:
+            while True:
+                # Keep the pool fed without materializing the whole input
+                while not exhausted and len(pending) < max_in_flight:
+                    try:
+                        index, filepath = next(source)
+                    except StopIteration:
+                        exhausted = True
+                        break
+                    filepath = Path(filepath)
+                    if content is not None:
+                        original = content.add(filepath)
+                        if original is not None:
+                            duplicates += 1
+                            first = original_index[original]
+                            if first in analyzed:
+                                done += 1
+                                errors += analyzed[first][1] is not None
+                                yield _copy_result(index, filepath, *analyzed[first])
+                            else:
+                                waiting.setdefault(first, []).append((index, filepath))
+                            continue
+                        original_index[filepath] = index
+                    future = executor.submit(self._analyze_safe, filepath)
+                    pending[future] = index
+
+                if not pending:
+                    break
+
+                finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    index = pending.pop(future)
+                    filepath, metadata, error = future.result()
+                    done += 1
+                    if error is not None:
+                        errors += 1
+                    yield index, filepath, metadata, error
+                    if content is not None:
+                        analyzed[index] = (metadata, error)
+                        for copy_index, copy_path in waiting.pop(index, ()):
+                            done += 1
+                            errors += error is not None
+                            yield _copy_result(copy_index, copy_path, metadata, error)
+        finally:
+            # No ``with`` block: its shutdown(wait=True) would make closing
+            # the iterator early (GUI cancel) wait for every queued ffprobe
+            executor.shutdown(wait=False, cancel_futures=True)
+
+            elapsed = time.perf_counter() - started
+            self.last_batch_stats = {
+                "files": done,
+                "errors": errors,
+                "workers": workers,
+                "elapsed": elapsed,
+                "files_per_second": done / elapsed if elapsed > 0 else 0.0,
+            }
+            if content is not None:
+                self.last_batch_stats["duplicates"] = duplicates
+            if self.cache is not None:
+                self.last_batch_stats["cache"] = self.cache.stats
+            logger.info(
+                "Analyzed %d files (%d errors) in %.2fs with %d workers: %.1f files/s",
+                done, errors, elapsed, workers, self.last_batch_stats["files_per_second"],
+            )
+
+    def analyze_batch(
+        self,
+        filepaths: list[Path],
+        max_workers: Optional[int] = None,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+    ) -> list[tuple[Path, Optional[AudioMetadata], Optional[str]]]:
+        """Analyze batch of files in parallel.
         
         Args:
             filepaths: List of file paths.
+            max_workers: Number of concurrent ffprobe processes
+                (default: one per CPU core).
+            progress_callback: Callback(current, total).
             
         Returns:
-            List of tuples (path, metadata, error_message).
+            List of tuples (path, metadata, error_message), in input order.
         """
-        results = []
-        for filepath in filepaths:
-            try:
-                metadata = self.analyze(filepath)
-                results.append((filepath, metadata, None))
-            except Exception as e:
-                results.append((filepath, None, str(e)))
+        filepaths = list(filepaths)
+        total = len(filepaths)
+        results: list = [None] * total
+
+        for done, (index, filepath, metadata, error) in enumerate(
+            self.iter_analyze(filepaths, max_workers=max_workers), start=1
+        ):
+            results[index] = (filepath, metadata, error)
+            if progress_callback:
+                progress_callback(done, total)
+
         return results
+
+
+def _copy_result(
+    index: int, path: Path, metadata: Optional[AudioMetadata], error: Optional[str]
+) -> tuple[int, Path, Optional[AudioMetadata], Optional[str]]:
+    """Return the iter_analyze result of a copy of an already analyzed file."""
+    if metadata is not None:
+        metadata = replace(metadata, filepath=path, filename=path.name)
+    return index, path, metadata, error
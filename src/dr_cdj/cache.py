@@ -0,0 +1,329 @@
+"""MetadataCache: Persistent on-disk cache for AudioAnalyzer results."""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import asdict, fields
+from pathlib import Path
+from typing import Optional
+
+from dr_cdj.analyzer import AudioMetadata
+from dr_cdj.config import METADATA_CACHE_MAX_ENTRIES
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = Path.home() / ".dr_cdj" / "metadata_cache.sqlite3"
+
+# Bump when AudioMetadata or the way it is produced changes: old rows are dropped.
+SCHEMA_VERSION = 1
+
+# How many puts between two size checks (COUNT(*) is not free on 100k rows)
+_LIMIT_CHECK_INTERVAL = 256
+
+# How many hits are buffered before their last_used times are written
+_TOUCH_FLUSH_INTERVAL = 256
+
+# How many new entries are buffered before they are written in one transaction
+_PUT_FLUSH_INTERVAL = 64
+
+_METADATA_FIELDS = {f.name for f in fields(AudioMetadata)} - {"filepath", "filename"}
+
+
+class MetadataCache:
+    """SQLite cache of AudioMetadata keyed by resolved path, size, mtime and inode.
+
+    An entry is only served while the file on disk still has the same size,
+    modification time (ns) and inode it had when it was analyzed; anything
+    else counts as a miss and the stale row is dropped. The cache is safe to
+    share between analysis worker threads.
+
+    Neither hits nor new entries commit one by one: last_used times and
+    stored rows are buffered and written in batches (and on close), so
+    parallel workers do not serialize on one commit per file.
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[Path] = None,
+        max_entries: int = METADATA_CACHE_MAX_ENTRIES,
+    ):
+        """Open (or create) the cache database.
+
+        If the database cannot be opened the cache is disabled and every
+        lookup is a miss, so analysis keeps working on read-only homes.
+
+        Args:
+            db_path: SQLite file. If None, uses ~/.dr_cdj/metadata_cache.sqlite3.
+            max_entries: Maximum number of rows kept; least recently used
+                rows are evicted beyond this.
+        """
+        self.db_path = Path(db_path) if db_path else DEFAULT_CACHE_PATH
+        self.max_entries = max(max_entries, 1)
+        self.hits = 0
+        self.misses = 0
+        self._puts_since_check = 0
+        self._touched: dict[str, float] = {}  # path → last_used not yet written
+        self._pending: dict[str, tuple] = {}  # path → row (without path) not yet written
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+        try:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.db_path), timeout=5, check_same_thread=False)
+            self._init_schema()
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Metadata cache disabled ({self.db_path}): {e}")
+            self._conn = None
+
+    def _init_schema(self) -> None:
+        """Create tables, discarding rows written by an older schema."""
+        conn = self._conn
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version != SCHEMA_VERSION:
+            conn.execute("DROP TABLE IF EXISTS metadata")
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS metadata (
+                path TEXT PRIMARY KEY,
+                size INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                inode INTEGER NOT NULL,
+                data TEXT NOT NULL,
+                last_used REAL NOT NULL
+            )
+            """
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_last_used ON metadata (last_used)")
+        conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        conn.commit()
+
+    @property
+    def enabled(self) -> bool:
+        """True if the database is open."""
+        return self._conn is not None
+
+    @staticmethod
+    def _fingerprint(filepath: Path) -> Optional[tuple[str, int, int, int]]:
+        """Return (resolved path, size, mtime_ns, inode) or None if unreadable."""
+        try:
+            resolved = filepath.resolve()
+            st = resolved.stat()
+        except (OSError, RuntimeError):
+            return None
+        return str(resolved), st.st_size, st.st_mtime_ns, st.st_ino
+
+    def get(self, filepath: Path) -> Optional[AudioMetadata]:
+        """Return cached metadata if the file is unchanged since it was stored.
+
+        Args:
+            filepath: Path to audio file.
+
+        Returns:
+            AudioMetadata bound to ``filepath``, or None on a miss.
+        """
+        filepath = Path(filepath)
+        key = self._fingerprint(filepath) if self._conn else None
+        if key is None:
+            with self._lock:
+                self.misses += 1
+            return None
+
+        path, size, mtime_ns, inode = key
+        with self._lock:
+            if self._conn is None:  # Closed meanwhile
+                self.misses += 1
+                return None
+            row = self._pending.get(path)
+            if row is None:
+                row = self._conn.execute(
+                    "SELECT size, mtime_ns, inode, data FROM metadata WHERE path = ?",
+                    (path,),
+                ).fetchone()
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            if row[:3] != (size, mtime_ns, inode):
+                # File changed since analysis: drop the stale row
+                self._forget(path)
+                self._conn.execute("DELETE FROM metadata WHERE path = ?", (path,))
+                self._conn.commit()
+                self.misses += 1
+                return None
+
+            try:
+                data = json.loads(row[3])
+                metadata = AudioMetadata(
+                    filepath=filepath,
+                    filename=filepath.name,
+                    **{k: v for k, v in data.items() if k in _METADATA_FIELDS},
+                )
+            except (ValueError, TypeError):
+                self._forget(path)
+                self._conn.execute("DELETE FROM metadata WHERE path = ?", (path,))
+                self._conn.commit()
+                self.misses += 1
+                return None
+
+            self._touched[path] = time.time()
+            if len(self._touched) >= _TOUCH_FLUSH_INTERVAL:
+                self._flush()
+            self.hits += 1
+            return metadata
+
+    def _forget(self, path: str) -> None:
+        """Drop buffered writes for a path (lock held)."""
+        self._touched.pop(path, None)
+        self._pending.pop(path, None)
+
+    def _flush(self) -> None:
+        """Write buffered entries and last_used times in one transaction (lock held)."""
+        if not self._pending and not self._touched:
+            return
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO metadata "
+            "(path, size, mtime_ns, inode, data, last_used) VALUES (?, ?, ?, ?, ?, ?)",
+            [(path, *row) for path, row in self._pending.items()],
+        )
+        self._conn.executemany(
+            "UPDATE metadata SET last_used = ? WHERE path = ?",
+            [(last_used, path) for path, last_used in self._touched.items()],
+        )
+        self._conn.commit()
+        self._pending.clear()
+        self._touched.clear()
+
+    def put(self, filepath: Path, metadata: AudioMetadata) -> None:
+        """Store metadata for a file.
+
+        Args:
+            filepath: Path to audio file.
+            metadata: Metadata extracted from it.
+        """
+        filepath = Path(filepath)
+        key = self._fingerprint(filepath) if self._conn else None
+        if key is None:
+            return
+
+        data = asdict(metadata)
+        data.pop("filepath", None)
+        data.pop("filename", None)
+
+        path, size, mtime_ns, inode = key
+        with self._lock:
+            if self._conn is None:
+                return
+            self._touched.pop(path, None)
+            self._pending[path] = (size, mtime_ns, inode, json.dumps(data), time.time())
+            if len(self._pending) >= _PUT_FLUSH_INTERVAL:
+                self._flush()
+
+            self._puts_since_check += 1
+            if self._puts_since_check >= _LIMIT_CHECK_INTERVAL:
+                self._puts_since_check = 0
+                self._enforce_limit()
+
+    def _enforce_limit(self) -> int:
+        """Evict least recently used rows beyond max_entries (lock held).
+
+        Returns:
+            Number of evicted rows.
+        """
+        self._flush()  # Count and evict with buffered writes applied
+        count = self._conn.execute("SELECT COUNT(*) FROM metadata").fetchone()[0]
+        excess = count - self.max_entries
+        if excess <= 0:
+            return 0
+        self._conn.execute(
+            "DELETE FROM metadata WHERE path IN "
+            "(SELECT path FROM metadata ORDER BY last_used ASC LIMIT ?)",
+            (excess,),
+        )
+        self._conn.commit()
+        return excess
+
+    def prune(self) -> int:
+        """Remove entries for deleted or modified files and enforce the size bound.
+
+        Returns:
+            Number of removed entries.
+        """
+        if not self._conn:
+            return 0
+
+        with self._lock:
+            if not self._conn:
+                return 0
+            self._flush()
+            rows = self._conn.execute("SELECT path, size, mtime_ns, inode FROM metadata").fetchall()
+
+        stale = []
+        for path, size, mtime_ns, inode in rows:
+            try:
+                st = os.stat(path)
+            except OSError:
+                stale.append((path,))
+                continue
+            if (st.st_size, st.st_mtime_ns, st.st_ino) != (size, mtime_ns, inode):
+                stale.append((path,))
+
+        with self._lock:
+            if not self._conn:
+                return 0
+            self._conn.executemany("DELETE FROM metadata WHERE path = ?", stale)
+            self._conn.commit()
+            evicted = self._enforce_limit()
+
+        if stale or evicted:
+            logger.info(f"Metadata cache pruned: {len(stale)} stale, {evicted} evicted")
+        return len(stale) + evicted
+
+    def clear(self) -> None:
+        """Remove all entries and reset counters."""
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+            self._touched.clear()
+            self._pending.clear()
+            if not self._conn:
+                return
+            self._conn.execute("DELETE FROM metadata")
+            self._conn.commit()
+
+    def __len__(self) -> int:
+        """Return number of cached entries."""
+        if not self._conn:
+            return 0
+        with self._lock:
+            self._flush()
+            return self._conn.execute("SELECT COUNT(*) FROM metadata").fetchone()[0]
+
+    @property
+    def stats(self) -> dict:
+        """Return hit/miss counters and entry count."""
+        with self._lock:
+            hits, misses = self.hits, self.misses
+        lookups = hits + misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / lookups if lookups else 0.0,
+            "entries": len(self),
+        }
+
+    def close(self) -> None:
+        """Flush buffered writes and close the database."""
+        if self._conn:
+            with self._lock:
+                try:
+                    self._flush()
+                except sqlite3.Error as e:
+                    logger.warning(f"Metadata cache: could not save buffered entries: {e}")
+                self._conn.close()
+                self._conn = None
@@ -0,0 +1,39 @@
+"""Cooperative cancellation and watchdog errors for conversion jobs."""
+
+import threading
+
+
+class ConversionCancelledError(Exception):
+    """Raised inside a conversion job whose CancellationToken was cancelled."""
+
+
+class ConversionTimeoutError(Exception):
+    """Raised when the watchdog kills a job (wall-clock or no-progress limit)."""
+
+
+class CancellationToken:
+    """Flag shared between the caller and running conversion jobs.
+
+    ``cancel`` may be called from any thread (e.g. a GUI button or a signal
+    handler). Jobs poll the token: running ffmpeg processes are killed by
+    their watchdog within WATCHDOG_INTERVAL, the native engine stops at the
+    next chunk and queued jobs are never started.
+    """
+
+    def __init__(self):
+        """Initialize an uncancelled token."""
+        self._event = threading.Event()
+
+    def cancel(self) -> None:
+        """Request cancellation."""
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        """True once cancel() was called."""
+        return self._event.is_set()
+
+    def raise_if_cancelled(self) -> None:
+        """Raise ConversionCancelledError if cancellation was requested."""
+        if self._event.is_set():
+            raise ConversionCancelledError()
@@ -0,0 +1,523 @@
+"""Command-line interface: headless scan and convert, no GUI dependencies.
+
+Usage::
+
+    dr-cdj scan ~/Music/Set -r --profile cdj_3000 --format ndjson
+    dr-cdj convert ~/Music/Set -r --output-dir ~/Music/CDJ
+
+Results are written to stdout (or ``--output``) one record at a time as
+files finish, so the output can be piped into other tools while a large
+library is still being processed. The summary goes to stderr.
+
+This module must never import customtkinter or tkinterdnd2.
+"""
+
+import argparse
+import csv
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import IO, Optional
+
+from dr_cdj.analyzer import AudioAnalyzer
+from dr_cdj.compatibility import CompatibilityEngine, CompatibilityResult, CompatibilityStatus
+from dr_cdj.config import (
+    CDJ_PROFILES,
+    CONVERSION_WORKER_CEILING,
+    DEFAULT_MAX_WORKERS,
+    DEFAULT_PROFILE,
+    MAX_ANALYSIS_WORKERS,
+    MAX_MAX_WORKERS,
+)
+from dr_cdj.converter import AudioConverter, ConversionProgress, ConversionResult
+from dr_cdj.discovery import discover
+
+logger = logging.getLogger(__name__)
+
+# Exit codes
+EXIT_OK = 0
+EXIT_ISSUES = 1  # Some files are not playable as-is (scan) or could not be fixed (convert)
+EXIT_USAGE = 2  # argparse default
+EXIT_ERRORS = 3  # Some files could not be analyzed or converted
+EXIT_NO_FFMPEG = 4
+EXIT_INTERRUPTED = 130
+
+SCAN_FIELDS = (
+    "path",
+    "status",
+    "message",
+    "profile",
+    "format",
+    "codec",
+    "sample_rate",
+    "bit_depth",
+    "channels",
+    "bitrate",
+    "duration",
+    "is_lossy",
+    "target_format",
+    "target_sample_rate",
+    "target_bit_depth",
+)
+
+CONVERT_FIELDS = SCAN_FIELDS + ("converted", "cached", "output_path", "conversion_message")
+
+
+# =============================================================================
+# Input collection
+# =============================================================================
+def iter_audio_files(paths: Iterable[Path], recursive: bool = False) -> Iterator[Path]:
+    """Yield audio files from files and directories given on the command line.
+
+    Explicit files are yielded as-is (even with an unknown extension, so the
+    user gets an error record instead of silence); directories are listed
+    for known audio extensions, sorted, descending into subdirectories only
+    if ``recursive``. Files are yielded while the walk is still running
+    (see dr_cdj.discovery). A file given twice (repeated argument, or also
+    inside a listed folder) is yielded once, so it gets one record and one
+    conversion job.
+
+    Args:
+        paths: Files and/or directories.
+        recursive: Walk subdirectories.
+
+    Yields:
+        Paths of files to analyze.
+    """
+    seen: set[str] = set()
+    for path in discover(paths, recursive=recursive):
+        key = os.path.abspath(path)
+        if key not in seen:
+            seen.add(key)
+            yield path
+
+
+# =============================================================================
+# Records and writers
+# =============================================================================
+def result_record(result: CompatibilityResult) -> dict:
+    """Flatten a CompatibilityResult into an output record."""
+    metadata = result.metadata
+    plan = result.conversion_plan
+    return {
+        "path": str(result.filepath),
+        "status": result.status.value,
+        "message": result.message,
+        "profile": result.profile_id,
+        "format": metadata.format_name,
+        "codec": metadata.codec,
+        "sample_rate": metadata.sample_rate,
+        "bit_depth": metadata.bit_depth,
+        "channels": metadata.channels,
+        "bitrate": metadata.bitrate,
+        "duration": metadata.duration,
+        "is_lossy": metadata.is_lossy,
+        "target_format": plan.output_format if plan else None,
+        "target_sample_rate": plan.target_sample_rate if plan else None,
+        "target_bit_depth": plan.target_bit_depth if plan else None,
+    }
+
+
+def error_record(path: Path, message: str, profile_id: str) -> dict:
+    """Build the record for a file that could not be analyzed."""
+    record = dict.fromkeys(SCAN_FIELDS)
+    record.update(
+        path=str(path),
+        status=CompatibilityStatus.ERROR.value,
+        message=message,
+        profile=profile_id,
+    )
+    return record
+
+
+class RecordWriter:
+    """Base class for streaming record writers."""
+
+    def __init__(self, stream: IO[str], fields: tuple[str, ...]):
+        """Initialize writer.
+
+        Args:
+            stream: Text stream to write to.
+            fields: Record keys, in output order.
+        """
+        self.stream = stream
+        self.fields = fields
+        self.count = 0
+
+    def write(self, record: dict) -> None:
+        """Write one record and flush it."""
+        self._write(record)
+        self.count += 1
+        self.stream.flush()
+
+    def _write(self, record: dict) -> None:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Terminate the output (if the format needs it) and flush."""
+        self.stream.flush()
+
+
+class NdjsonWriter(RecordWriter):
+    """One JSON object per line."""
+
+    def _write(self, record: dict) -> None:
+        self.stream.write(json.dumps({k: record.get(k) for k in self.fields}) + "\n")
+
+
+class CsvWriter(RecordWriter):
+    """CSV with a header row; missing values are empty cells."""
+
+    def __init__(self, stream: IO[str], fields: tuple[str, ...]):
+        """Initialize writer and emit the header."""
+        super().__init__(stream, fields)
+        self._writer = csv.DictWriter(stream, fieldnames=fields, extrasaction="ignore")
+        self._writer.writeheader()
+        stream.flush()
+
+    def _write(self, record: dict) -> None:
+        self._writer.writerow(record)
+
+
+class JsonWriter(RecordWriter):
+    """A single JSON array, written element by element."""
+
+    def _write(self, record: dict) -> None:
+        self.stream.write("[\n  " if self.count == 0 else ",\n  ")
+        self.stream.write(json.dumps({k: record.get(k) for k in self.fields}))
+
+    def close(self) -> None:
+        """Close the array."""
+        self.stream.write("[]\n" if self.count == 0 else "\n]\n")
+        super().close()
+
+
+WRITERS = {
+    "ndjson": NdjsonWriter,
+    "csv": CsvWriter,
+    "json": JsonWriter,
+}
+
+
+# =============================================================================
+# Commands
+# =============================================================================
+def build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser."""
+    parser = argparse.ArgumentParser(
+        prog="dr-cdj",
+        description="Check (and fix) audio file compatibility with Pioneer CDJ players.",
+        epilog="Run without arguments to start the graphical interface.",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument(
+        "paths", nargs="+", type=Path, metavar="PATH", help="Audio files or directories"
+    )
+    common.add_argument(
+        "-r", "--recursive", action="store_true", help="Descend into subdirectories"
+    )
+    common.add_argument(
+        "-p",
+        "--profile",
+        choices=sorted(CDJ_PROFILES),
+        default=DEFAULT_PROFILE,
+        help=f"CDJ profile (default: {DEFAULT_PROFILE})",
+    )
+    common.add_argument(
+        "-j",
+        "--workers",
+        type=int,
+        default=None,
+        help=f"Parallel analysis workers (default: one per core, max {MAX_ANALYSIS_WORKERS})",
+    )
+    common.add_argument(
+        "-f",
+        "--format",
+        choices=sorted(WRITERS),
+        default="ndjson",
+        help="Output format (default: ndjson)",
+    )
+    common.add_argument(
+        "-o",
+        "--output",
+        type=Path,
+        default=None,
+        help="Write records to this file instead of stdout",
+    )
+    common.add_argument(
+        "--no-cache", action="store_true", help="Do not read or write the metadata cache"
+    )
+    common.add_argument(
+        "--no-dedupe",
+        action="store_true",
+        help="Analyze and convert every copy of identical files separately",
+    )
+    common.add_argument(
+        "--full-hash",
+        action="store_true",
+        help="Hash whole files to detect copies (default: sampled blocks)",
+    )
+    common.add_argument(
+        "-q", "--quiet", action="store_true", help="Do not print the summary on stderr"
+    )
+    common.add_argument(
+        "-v", "--verbose", action="count", default=0, help="Log to stderr (-v info, -vv debug)"
+    )
+
+    subparsers.add_parser("scan", parents=[common], help="Analyze files and report compatibility")
+
+    convert = subparsers.add_parser(
+        "convert", parents=[common], help="Analyze files and convert the ones that need it"
+    )
+    convert.add_argument(
+        "-d",
+        "--output-dir",
+        type=Path,
+        default=None,
+        help="Directory for converted files (default: next to the source)",
+    )
+    convert.add_argument(
+        "--convert-workers",
+        type=int,
+        default=DEFAULT_MAX_WORKERS,
+        help=f"Parallel conversions (default: {DEFAULT_MAX_WORKERS}, max {MAX_MAX_WORKERS})",
+    )
+    convert.add_argument(
+        "--adaptive",
+        action="store_true",
+        help="Adjust parallel conversions to CPU and disk load, starting from --convert-workers",
+    )
+    convert.add_argument(
+        "--max-convert-workers",
+        type=int,
+        default=CONVERSION_WORKER_CEILING,
+        help=f"Upper bound for --adaptive (default: {CONVERSION_WORKER_CEILING})",
+    )
+    convert.add_argument(
+        "--paranoid-verify", action="store_true", help="Also read every output back with ffprobe"
+    )
+    convert.add_argument(
+        "--force", action="store_true", help="Reconvert files whose output is already up to date"
+    )
+    convert.add_argument(
+        "--stage-dir",
+        type=Path,
+        default=None,
+        help="Write outputs to this local directory first, then copy them "
+        "to --output-dir in large chunks (for USB sticks and SD cards)",
+    )
+    convert.add_argument(
+        "--no-fsync",
+        action="store_true",
+        help="Do not flush each output to disk before renaming it into place",
+    )
+    convert.add_argument(
+        "--hardlink-duplicates",
+        action="store_true",
+        help="Hardlink the outputs of identical sources instead of copying "
+        "them (where the filesystem supports hardlinks)",
+    )
+    return parser
+
+
+def _setup_logging(verbosity: int) -> None:
+    """Send log records to stderr according to -v count."""
+    if verbosity <= 0:
+        return
+    level = logging.INFO if verbosity == 1 else logging.DEBUG
+    handler = logging.StreamHandler(sys.stderr)
+    handler.setLevel(level)
+    handler.setFormatter(logging.Formatter("%(levelname)s %(name)s: %(message)s"))
+    root = logging.getLogger()
+    root.addHandler(handler)
+    if root.level > level:
+        root.setLevel(level)
+
+
+def _build_analyzer(no_cache: bool) -> AudioAnalyzer:
+    """Create the analyzer, with the persistent cache unless disabled."""
+    if no_cache:
+        return AudioAnalyzer()
+    from dr_cdj.cache import MetadataCache
+
+    return AudioAnalyzer(cache=MetadataCache())
+
+
+def run_command(args: argparse.Namespace, stream: IO[str]) -> int:
+    """Run a parsed scan/convert command, writing records to ``stream``.
+
+    Args:
+        args: Parsed arguments.
+        stream: Output stream for records.
+
+    Returns:
+        Process exit code.
+    """
+    converting = args.command == "convert"
+    try:
+        analyzer = _build_analyzer(args.no_cache)
+        converter = (
+            AudioConverter(
+                max_workers=min(args.convert_workers, MAX_MAX_WORKERS),
+                adaptive=args.adaptive,
+                worker_ceiling=args.max_convert_workers,
+                paranoid_verify=args.paranoid_verify,
+                fsync=not args.no_fsync,
+                stage_dir=args.stage_dir,
+            )
+            if converting
+            else None
+        )
+    except RuntimeError as e:
+        print(f"dr-cdj: {e}", file=sys.stderr)
+        return EXIT_NO_FFMPEG
+
+    engine = CompatibilityEngine(args.profile)
+    writer = WRITERS[args.format](stream, CONVERT_FIELDS if converting else SCAN_FIELDS)
+    counts: Counter = Counter()
+    to_convert: list[CompatibilityResult] = []
+    pending_records: dict[Path, dict] = {}
+    start = time.perf_counter()
+
+    try:
+        files = iter_audio_files(args.paths, recursive=args.recursive)
+        analysis = analyzer.iter_analyze(
+            files,
+            max_workers=args.workers,
+            dedupe=not args.no_dedupe,
+            full_hash=args.full_hash,
+        )
+        for _, path, metadata, error in analysis:
+            if metadata is None:
+                counts[CompatibilityStatus.ERROR.value] += 1
+                writer.write(error_record(path, error or "Analysis error", engine.profile_id))
+                continue
+
+            result = engine.check(metadata)
+            counts[result.status.value] += 1
+            record = result_record(result)
+            if converting and result.needs_conversion:
+                to_convert.append(result)
+                pending_records[result.filepath] = record
+            else:
+                writer.write(record)
+
+        if to_convert:
+
+            def on_converted(conversion: ConversionResult) -> None:
+                record = pending_records.pop(conversion.source_path)
+                record.update(
+                    converted=conversion.success,
+                    cached=conversion.cached,
+                    output_path=str(conversion.output_path) if conversion.output_path else None,
+                    conversion_message=conversion.message,
+                )
+                counts["converted" if conversion.success else "conversion_failed"] += 1
+                if conversion.cached:
+                    counts["up_to_date"] += 1
+                writer.write(record)
+
+            show_progress = not args.quiet and sys.stderr.isatty()
+            converter.convert_batch(
+                to_convert,
+                args.output_dir,
+                result_callback=on_converted,
+                force=args.force,
+                job_progress_callback=_progress_printer() if show_progress else None,
+                dedupe=not args.no_dedupe,
+                full_hash=args.full_hash,
+                link_duplicates=args.hardlink_duplicates,
+            )
+            if show_progress:
+                print(file=sys.stderr)
+    finally:
+        if analyzer.cache:
+            analyzer.cache.close()
+        writer.close()
+
+    if not args.quiet:
+        _print_summary(counts, writer.count, time.perf_counter() - start, converting)
+
+    if counts[CompatibilityStatus.ERROR.value] or counts["conversion_failed"]:
+        return EXIT_ERRORS
+    if counts[CompatibilityStatus.INCOMPATIBLE.value]:
+        return EXIT_ISSUES
+    if not converting and (
+        counts[CompatibilityStatus.CONVERTIBLE_LOSSLESS.value]
+        or counts[CompatibilityStatus.CONVERTIBLE_LOSSY.value]
+    ):
+        return EXIT_ISSUES
+    return EXIT_OK
+
+
+def _progress_printer():
+    """Return a job progress callback that redraws one status line on stderr."""
+    lock = threading.Lock()
+
+    def on_progress(event: ConversionProgress) -> None:
+        speed = f" · {event.speed:.1f}x" if event.speed else ""
+        line = f"Converting {event.batch_fraction or 0:6.1%} · {event.source_path.name}{speed}"
+        with lock:
+            print(f"\r{line[:79]:<79}", end="", file=sys.stderr, flush=True)
+
+    return on_progress
+
+
+def _print_summary(counts: Counter, total: int, elapsed: float, converting: bool) -> None:
+    """Print a one-line summary on stderr."""
+    parts = [f"{counts[status.value]} {status.value}" for status in CompatibilityStatus]
+    if converting:
+        parts.append(f"{counts['converted']} converted ({counts['up_to_date']} already up to date)")
+        parts.append(f"{counts['conversion_failed']} conversion failed")
+    print(f"dr-cdj: {total} files in {elapsed:.1f}s — " + ", ".join(parts), file=sys.stderr)
+
+
+def run(argv: Optional[list[str]] = None) -> int:
+    """Parse arguments and run the CLI.
+
+    Args:
+        argv: Arguments without the program name. If None, uses sys.argv[1:].
+
+    Returns:
+        Process exit code.
+    """
+    args = build_parser().parse_args(argv)
+    if args.workers is not None and args.workers < 1:
+        print("dr-cdj: --workers must be at least 1", file=sys.stderr)
+        return EXIT_USAGE
+    if getattr(args, "convert_workers", 1) < 1:
+        print("dr-cdj: --convert-workers must be at least 1", file=sys.stderr)
+        return EXIT_USAGE
+    _setup_logging(args.verbose)
+
+    try:
+        if args.output:
+            with open(args.output, "w", encoding="utf-8", newline="") as stream:
+                return run_command(args, stream)
+        return run_command(args, sys.stdout)
+    except KeyboardInterrupt:
+        print("dr-cdj: interrupted", file=sys.stderr)
+        return EXIT_INTERRUPTED
+    except BrokenPipeError:
+        # Output consumer went away (e.g. `| head`): stop quietly, and keep
+        # the interpreter from failing again when it flushes stdout at exit
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        return EXIT_OK
+
+
+def main() -> None:
+    """Console entry point."""
+    sys.exit(run())
+
+
+if __name__ == "__main__":
+    main()
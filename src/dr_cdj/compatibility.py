@@ -1,9 +1,11 @@
 """CompatibilityEngine: Multi-profile compatibility engine for CDJ."""
 
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
+from functools import lru_cache
 from enum import Enum
 from pathlib import Path
-from typing import Optional
+from typing import NamedTuple, Optional
 
 from dr_cdj.analyzer import AudioMetadata
 from dr_cdj.config import (
@@ -14,6 +16,7 @@ from dr_cdj.config import (
     DEFAULT_SAMPLE_RATE,
     MAX_BIT_DEPTH,
     MAX_SAMPLE_RATE,
+    VERDICT_CACHE_SIZE,
     CDJProfile,
 )
 
@@ -28,9 +31,9 @@ class CompatibilityStatus(Enum):
     ERROR = "error"
 
 
-@dataclass
+@dataclass(frozen=True)
 class ConversionPlan:
-    """Optimal conversion plan."""
+    """Optimal conversion plan (immutable: one plan is shared by many results)."""
 
     output_format: str
     target_sample_rate: int
@@ -150,206 +153,502 @@ class CompatibilityEngine:
         Returns:
             CompatibilityResult with verdict and conversion plan.
         """
-        try:
-            return self._evaluate(metadata)
-        except Exception as e:
-            return CompatibilityResult(
-                filepath=metadata.filepath,
-                metadata=metadata,
-                status=CompatibilityStatus.ERROR,
-                message=f"Error: {str(e)[:50]}",
-                profile_id=self.profile_id,
-                profile_name=self.profile.name,
-            )
+        return check_profile(metadata, self.profile_id, self.profile)
 
-    def _evaluate(self, metadata: AudioMetadata) -> CompatibilityResult:
-        """Compatibility evaluation logic."""
-        filepath = metadata.filepath
-        codec = metadata.codec
-        sample_rate = metadata.sample_rate
-        bit_depth = metadata.bit_depth
-        is_float = metadata.is_float
-        is_lossy = metadata.is_lossy
-        
-        # Determina il formato base
-        format_category = self._detect_format_category(metadata)
-        
-        # Verifica se il formato è supportato dal profilo
-        if format_category in self.profile.formats:
-            return self._check_supported_format(
-                filepath, metadata, format_category, sample_rate, bit_depth, is_float
-            )
-        elif format_category in CONVERTIBLE_FORMATS:
-            # Formato convertibile ma non nativo
-            return self._check_unsupported_format(
-                filepath, metadata, format_category, is_lossy
-            )
-        else:
-            # Formato sconosciuto/incompatibile
-            return CompatibilityResult(
-                filepath=filepath,
-                metadata=metadata,
-                status=CompatibilityStatus.INCOMPATIBLE,
-                message=f"{format_category} format not supported",
-                profile_id=self.profile_id,
-                profile_name=self.profile.name,
-            )
+    def recheck(
+        self, results: list[CompatibilityResult]
+    ) -> tuple[list[CompatibilityResult], set[int]]:
+        """Re-check analyzed files against the current profile.
 
-    def _detect_format_category(self, metadata: AudioMetadata) -> str:
-        """Detect format category from codec and extension."""
-        codec = metadata.codec.lower() if metadata.codec else ""
-        ext = metadata.filepath.suffix.lower() if metadata.filepath else ""
-        
-        # Mappatura codec/formato
-        if "mp3" in codec or ext == ".mp3":
-            return "MP3"
-        elif "aac" in codec or ext in (".m4a", ".aac"):
-            return "AAC"
-        elif "pcm" in codec or codec in ("wav", "pcm_s16le", "pcm_s24le") or ext in (".wav", ".wave"):
-            return "WAV"
-        elif "aiff" in codec or codec == "pcm_s16be" or ext in (".aiff", ".aif"):
-            return "AIFF"
-        elif "flac" in codec or ext == ".flac":
-            return "FLAC"
-        elif "vorbis" in codec or ext == ".ogg":
-            return "OGG"
-        elif "opus" in codec or ext == ".opus":
-            return "OPUS"
-        elif "wma" in codec or ext == ".wma":
-            return "WMA"
-        elif "alac" in codec:
-            return "ALAC"
+        Reuses the stored metadata (no re-analysis) and the memoized
+        verdicts, so it is cheap enough to run on a profile switch. Analysis
+        errors and results without metadata are kept as they are.
+
+        Args:
+            results: Results computed for any profile.
+
+        Returns:
+            (new results in the same order, indices whose status, message
+            or conversion plan changed).
+        """
+        new_results = []
+        changed = set()
+        for index, result in enumerate(results):
+            if (
+                result.profile_id == self.profile_id
+                or result.metadata is None
+                or result.status == CompatibilityStatus.ERROR
+            ):
+                new_results.append(result)
+                continue
+            new_result = check_profile(result.metadata, self.profile_id, self.profile)
+            if (
+                new_result.status != result.status
+                or new_result.message != result.message
+                or new_result.conversion_plan != result.conversion_plan
+            ):
+                changed.add(index)
+            new_results.append(new_result)
+        return new_results, changed
+
+
+class VerdictKey(NamedTuple):
+    """Everything a compatibility verdict depends on, besides the profile."""
+
+    codec: str  # Lower case, "" if unknown
+    extension: str  # Lower-case suffix, "" if none
+    sample_rate: Optional[int]
+    bit_depth: Optional[int]
+    is_float: bool
+    is_lossy: bool
+
+
+def verdict_key(metadata: AudioMetadata) -> VerdictKey:
+    """Return the memoization key of a file's verdicts."""
+    return VerdictKey(
+        metadata.codec.lower() if metadata.codec else "",
+        metadata.filepath.suffix.lower() if metadata.filepath else "",
+        metadata.sample_rate,
+        metadata.bit_depth,
+        bool(metadata.is_float),
+        bool(metadata.is_lossy),
+    )
+
+
+@dataclass(frozen=True, eq=False)
+class CompiledProfile:
+    """CDJProfile flattened into lookup tables.
+
+    Compared and hashed by identity: the built-in profiles are compiled
+    once at import and their verdicts memoized per compiled profile.
+    """
+
+    source: CDJProfile
+    name: str
+    max_sample_rate: int
+    max_bit_depth: int
+    sample_rates: dict[str, frozenset[int]]  # Format category → supported rates
+    bit_depths: dict[str, frozenset[int]]  # Format category → supported depths
+    ready_message: str
+
+
+def compile_profile(profile: CDJProfile) -> CompiledProfile:
+    """Flatten a profile into the tables used by the evaluation."""
+    return CompiledProfile(
+        source=profile,
+        name=profile.name,
+        max_sample_rate=profile.max_sample_rate,
+        max_bit_depth=profile.max_bit_depth,
+        sample_rates={cat: frozenset(fmt.sample_rates) for cat, fmt in profile.formats.items()},
+        bit_depths={cat: frozenset(fmt.bit_depths) for cat, fmt in profile.formats.items()},
+        ready_message=f"Ready for {profile.name}",
+    )
+
+
+_COMPILED_PROFILES = {
+    profile_id: compile_profile(profile) for profile_id, profile in CDJ_PROFILES.items()
+}
+
+# (status, message, plan) shared by every file with the same key and profile
+_Verdict = tuple[CompatibilityStatus, str, Optional[ConversionPlan]]
+
+
+def check_profile(
+    metadata: AudioMetadata,
+    profile_id: str,
+    profile: CDJProfile,
+    key: Optional[VerdictKey] = None,
+) -> CompatibilityResult:
+    """Check a file against one profile (pure function, thread-safe).
+
+    Verdicts of the built-in profiles are memoized per VerdictKey, so
+    results of files with the same key share their message and
+    (frozen) ConversionPlan objects.
+
+    Args:
+        metadata: Audio file metadata.
+        profile_id: ID of ``profile``.
+        profile: Profile to check against.
+        key: Precomputed verdict_key(metadata), when checking the same
+            file against several profiles.
+
+    Returns:
+        CompatibilityResult with verdict and conversion plan.
+    """
+    try:
+        compiled = _COMPILED_PROFILES.get(profile_id)
+        if compiled is None or compiled.source is not profile:
+            # Custom profile: evaluate without filling the cache
+            status, message, plan = _evaluate(
+                compile_profile(profile), key or verdict_key(metadata)
+            )
+        elif key is not None:
+            status, message, plan = _cached_verdict(compiled, *key)
         else:
-            return "UNKNOWN"
-
-    def _check_supported_format(
-        self,
-        filepath: Path,
-        metadata: AudioMetadata,
-        format_category: str,
-        sample_rate: Optional[int],
-        bit_depth: Optional[int],
-        is_float: bool,
-    ) -> CompatibilityResult:
-        """Check compatibility for profile-supported format."""
-        fmt = self.profile.formats[format_category]
-        
-        issues = []
-        
-        # Verifica sample rate
-        if sample_rate and fmt.sample_rates and sample_rate not in fmt.sample_rates:
-            if sample_rate > self.profile.max_sample_rate:
-                issues.append(f"{sample_rate/1000:.1f}kHz → max {self.profile.max_sample_rate/1000:.1f}kHz")
-            else:
-                issues.append(f"{sample_rate/1000:.1f}kHz not supported")
-        
-        # Verifica bit depth (solo per formati PCM)
-        if bit_depth and fmt.bit_depths:
-            if bit_depth not in fmt.bit_depths:
-                if is_float:
-                    issues.append("32-bit float not supported")
-                elif bit_depth > self.profile.max_bit_depth:
-                    issues.append(f"{bit_depth}-bit too high")
-                else:
-                    issues.append(f"{bit_depth}-bit not supported")
-        
-        if issues:
-            # Ha problemi ma è convertibile lossless
-            plan = self._create_conversion_plan(metadata, lossless_source=True)
-            return CompatibilityResult(
-                filepath=filepath,
-                metadata=metadata,
-                status=CompatibilityStatus.CONVERTIBLE_LOSSLESS,
-                message="; ".join(issues),
-                profile_id=self.profile_id,
-                profile_name=self.profile.name,
-                conversion_plan=plan,
+            # Raw fields as cache key: normalizing them costs more than the lookup
+            status, message, plan = _cached_verdict(
+                compiled,
+                metadata.codec,
+                metadata.filepath.suffix if metadata.filepath else "",
+                metadata.sample_rate,
+                metadata.bit_depth,
+                metadata.is_float,
+                metadata.is_lossy,
             )
-        
-        # Tutto OK
+    except Exception as e:
         return CompatibilityResult(
-            filepath=filepath,
+            filepath=metadata.filepath,
             metadata=metadata,
-            status=CompatibilityStatus.COMPATIBLE,
-            message=f"Ready for {self.profile.name}",
-            profile_id=self.profile_id,
-            profile_name=self.profile.name,
+            status=CompatibilityStatus.ERROR,
+            message=f"Error: {str(e)[:50]}",
+            profile_id=profile_id,
+            profile_name=profile.name,
         )
+    return CompatibilityResult(
+        filepath=metadata.filepath,
+        metadata=metadata,
+        status=status,
+        message=message,
+        profile_id=profile_id,
+        profile_name=profile.name,
+        conversion_plan=plan,
+    )
 
-    def _check_unsupported_format(
-        self,
-        filepath: Path,
-        metadata: AudioMetadata,
-        format_category: str,
-        is_lossy: bool,
-    ) -> CompatibilityResult:
-        """Check for natively unsupported format (requires conversion)."""
-        plan = self._create_conversion_plan(metadata, lossless_source=not is_lossy)
-        
-        if is_lossy:
-            status = CompatibilityStatus.CONVERTIBLE_LOSSY
-            message = f"{format_category} convertible (lossy source)"
-        else:
-            status = CompatibilityStatus.CONVERTIBLE_LOSSLESS
-            message = f"{format_category} → {plan.output_format} lossless"
-        
-        return CompatibilityResult(
-            filepath=filepath,
-            metadata=metadata,
-            status=status,
-            message=message,
-            profile_id=self.profile_id,
-            profile_name=self.profile.name,
-            conversion_plan=plan,
+
+def lookup_verdict(profile_id: str, key: VerdictKey) -> _Verdict:
+    """Return the memoized (status, message, plan) of a key for a profile.
+
+    Lets callers that keep keys per track (e.g. a library table) re-check
+    rows without rebuilding metadata or results.
+
+    Raises:
+        KeyError: If the profile is not a built-in profile.
+    """
+    return _cached_verdict(_COMPILED_PROFILES[profile_id], *key)
+
+
+def clear_verdict_cache() -> None:
+    """Forget all memoized verdicts (e.g. in tests or benchmarks)."""
+    _cached_verdict.cache_clear()
+    _format_category.cache_clear()
+
+
+@lru_cache(maxsize=VERDICT_CACHE_SIZE)
+def _cached_verdict(
+    compiled: CompiledProfile,
+    codec: Optional[str],
+    extension: str,
+    sample_rate: Optional[int],
+    bit_depth: Optional[int],
+    is_float: bool,
+    is_lossy: bool,
+) -> _Verdict:
+    key = VerdictKey(
+        codec.lower() if codec else "",
+        extension.lower(),
+        sample_rate,
+        bit_depth,
+        bool(is_float),
+        bool(is_lossy),
+    )
+    return _evaluate(compiled, key)
+
+
+def _evaluate(profile: CompiledProfile, key: VerdictKey) -> _Verdict:
+    """Compatibility evaluation logic."""
+    format_category = _format_category(key.codec, key.extension)
+
+    # Verifica se il formato è supportato dal profilo
+    if format_category in profile.sample_rates:
+        return _check_supported_format(key, format_category, profile)
+    elif format_category in CONVERTIBLE_FORMATS:
+        # Formato convertibile ma non nativo
+        return _check_unsupported_format(key, format_category, profile)
+    else:
+        # Formato sconosciuto/incompatibile
+        return (
+            CompatibilityStatus.INCOMPATIBLE,
+            f"{format_category} format not supported",
+            None,
         )
 
-    def _create_conversion_plan(
-        self, metadata: AudioMetadata, lossless_source: bool
-    ) -> ConversionPlan:
-        """Create optimal conversion plan for current profile."""
-        sample_rate = metadata.sample_rate or 44100
-        bit_depth = metadata.bit_depth or 16
-        
-        # Determina i target in base al profilo
-        max_sr = self.profile.max_sample_rate
-        max_bd = self.profile.max_bit_depth
-        
-        if lossless_source:
-            # Per sorgenti lossless, mantieni la massima qualità possibile del profilo
-            target_sample_rate = min(sample_rate, max_sr)
-            target_bit_depth = min(bit_depth, max_bd) if bit_depth else max_bd
-            
-            # Arrotonda ai valori supportati
-            if target_sample_rate >= 96000 and 96000 in [44100, 48000, 88200, 96000]:
-                target_sample_rate = 96000
-            elif target_sample_rate >= 88200:
-                target_sample_rate = 88200 if max_sr >= 88200 else 48000
-            elif target_sample_rate >= 48000:
-                target_sample_rate = 48000
-            else:
-                target_sample_rate = 44100
-                
-            if target_bit_depth >= 24:
-                target_bit_depth = 24
+
+def detect_format_category(metadata: AudioMetadata) -> str:
+    """Detect format category from codec and extension."""
+    key = verdict_key(metadata)
+    return _format_category(key.codec, key.extension)
+
+
+@lru_cache(maxsize=256)
+def _format_category(codec: str, ext: str) -> str:
+    # Mappatura codec/formato
+    if "mp3" in codec or ext == ".mp3":
+        return "MP3"
+    elif "aac" in codec or ext in (".m4a", ".aac"):
+        return "AAC"
+    elif "pcm" in codec or codec in ("wav", "pcm_s16le", "pcm_s24le") or ext in (".wav", ".wave"):
+        return "WAV"
+    elif "aiff" in codec or codec == "pcm_s16be" or ext in (".aiff", ".aif"):
+        return "AIFF"
+    elif "flac" in codec or ext == ".flac":
+        return "FLAC"
+    elif "vorbis" in codec or ext == ".ogg":
+        return "OGG"
+    elif "opus" in codec or ext == ".opus":
+        return "OPUS"
+    elif "wma" in codec or ext == ".wma":
+        return "WMA"
+    elif "alac" in codec:
+        return "ALAC"
+    else:
+        return "UNKNOWN"
+
+
+def _check_supported_format(
+    key: VerdictKey, format_category: str, profile: CompiledProfile
+) -> _Verdict:
+    """Check compatibility for profile-supported format."""
+    sample_rates = profile.sample_rates[format_category]
+    bit_depths = profile.bit_depths[format_category]
+    sample_rate = key.sample_rate
+    bit_depth = key.bit_depth
+
+    issues = []
+
+    # Verifica sample rate
+    if sample_rate and sample_rates and sample_rate not in sample_rates:
+        if sample_rate > profile.max_sample_rate:
+            issues.append(f"{sample_rate/1000:.1f}kHz → max {profile.max_sample_rate/1000:.1f}kHz")
+        else:
+            issues.append(f"{sample_rate/1000:.1f}kHz not supported")
+
+    # Verifica bit depth (solo per formati PCM)
+    if bit_depth and bit_depths:
+        if bit_depth not in bit_depths:
+            if key.is_float:
+                issues.append("32-bit float not supported")
+            elif bit_depth > profile.max_bit_depth:
+                issues.append(f"{bit_depth}-bit too high")
             else:
-                target_bit_depth = 16
-                
-            reason = f"Lossless: {target_bit_depth}bit/{target_sample_rate/1000:.1f}kHz"
+                issues.append(f"{bit_depth}-bit not supported")
+
+    if issues:
+        # Ha problemi ma è convertibile lossless
+        plan = _create_conversion_plan(key, profile, lossless_source=True)
+        return CompatibilityStatus.CONVERTIBLE_LOSSLESS, "; ".join(issues), plan
+
+    # Tutto OK
+    return CompatibilityStatus.COMPATIBLE, profile.ready_message, None
+
+
+def _check_unsupported_format(
+    key: VerdictKey, format_category: str, profile: CompiledProfile
+) -> _Verdict:
+    """Check for natively unsupported format (requires conversion)."""
+    is_lossy = key.is_lossy
+    plan = _create_conversion_plan(key, profile, lossless_source=not is_lossy)
+
+    if is_lossy:
+        status = CompatibilityStatus.CONVERTIBLE_LOSSY
+        message = f"{format_category} convertible (lossy source)"
+    else:
+        status = CompatibilityStatus.CONVERTIBLE_LOSSLESS
+        message = f"{format_category} → {plan.output_format} lossless"
+
+    return status, message, plan
+
+
+def _create_conversion_plan(
+    key: VerdictKey, profile: CompiledProfile, lossless_source: bool
+) -> ConversionPlan:
+    """Create optimal conversion plan for a profile."""
+    sample_rate = key.sample_rate or 44100
+    bit_depth = key.bit_depth or 16
+
+    # Determina i target in base al profilo
+    max_sr = profile.max_sample_rate
+    max_bd = profile.max_bit_depth
+
+    if lossless_source:
+        # Per sorgenti lossless, mantieni la massima qualità possibile del profilo
+        target_sample_rate = min(sample_rate, max_sr)
+        target_bit_depth = min(bit_depth, max_bd) if bit_depth else max_bd
+
+        # Arrotonda ai valori supportati
+        if target_sample_rate >= 96000 and 96000 in [44100, 48000, 88200, 96000]:
+            target_sample_rate = 96000
+        elif target_sample_rate >= 88200:
+            target_sample_rate = 88200 if max_sr >= 88200 else 48000
+        elif target_sample_rate >= 48000:
+            target_sample_rate = 48000
         else:
-            # Per sorgenti lossy, 16/44.1 è sufficiente
             target_sample_rate = 44100
-            target_bit_depth = 16
-            reason = "From lossy: 16bit/44.1kHz"
-        
-        # Scegli formato output (preferisci WAV come standard)
-        if metadata.codec and metadata.codec.lower() in ("aiff", "pcm_s16be", "pcm_s24be"):
-            output_format = "AIFF"
+
+        if target_bit_depth >= 24:
+            target_bit_depth = 24
         else:
-            output_format = "WAV"
-        
-        return ConversionPlan(
-            output_format=output_format,
-            target_sample_rate=target_sample_rate,
-            target_bit_depth=target_bit_depth,
-            reason=reason,
+            target_bit_depth = 16
+
+        reason = f"Lossless: {target_bit_depth}bit/{target_sample_rate/1000:.1f}kHz"
+    else:
+        # Per sorgenti lossy, 16/44.1 è sufficiente
+        target_sample_rate = 44100
+        target_bit_depth = 16
+        reason = "From lossy: 16bit/44.1kHz"
+
+    # Scegli formato output (preferisci WAV come standard)
+    output_format = "AIFF" if key.codec in ("aiff", "pcm_s16be", "pcm_s24be") else "WAV"
+
+    return ConversionPlan(
+        output_format=output_format,
+        target_sample_rate=target_sample_rate,
+        target_bit_depth=target_bit_depth,
+        reason=reason,
+    )
+
+
+@dataclass(frozen=True)
+class TrackVerdicts:
+    """Verdicts of one track for every profile of a CompatibilityMatrix."""
+
+    filepath: Path
+    profile_ids: tuple[str, ...]
+    results: tuple[CompatibilityResult, ...]  # Same order as profile_ids
+
+    def for_profile(self, profile_id: str) -> CompatibilityResult:
+        """Return the verdict for one profile.
+
+        Raises:
+            KeyError: If the profile is not part of the matrix.
+        """
+        try:
+            return self.results[self.profile_ids.index(profile_id)]
+        except ValueError:
+            raise KeyError(profile_id) from None
+
+    @property
+    def statuses(self) -> tuple[CompatibilityStatus, ...]:
+        """Status per profile, in matrix order."""
+        return tuple(result.status for result in self.results)
+
+    @property
+    def plays_everywhere(self) -> bool:
+        """True if the file plays unconverted on every profile."""
+        return all(result.is_compatible for result in self.results)
+
+    def compatible_profiles(self) -> tuple[str, ...]:
+        """IDs of the profiles that play the file unconverted."""
+        return tuple(
+            profile_id
+            for profile_id, result in zip(self.profile_ids, self.results, strict=True)
+            if result.is_compatible
         )
+
+
+@dataclass(frozen=True)
+class MatrixSummary:
+    """Library-level view of a compatibility matrix."""
+
+    profile_ids: tuple[str, ...]
+    total: int
+    counts: dict[str, dict[CompatibilityStatus, int]]  # profile → status → tracks
+    plays_everywhere: int  # Tracks compatible with every profile
+    plays_nowhere: int  # Tracks compatible with no profile
+
+    def compatible(self, profile_id: str) -> int:
+        """Number of tracks a profile plays unconverted."""
+        return self.counts[profile_id].get(CompatibilityStatus.COMPATIBLE, 0)
+
+
+class CompatibilityMatrix:
+    """Evaluates tracks against several CDJ profiles in one pass.
+
+    Unlike CompatibilityEngine there is no current profile to switch: the
+    profile list is fixed at construction and every method is a pure
+    function of its arguments, so one matrix can be shared by parallel
+    analysis workers.
+    """
+
+    __slots__ = ("_profiles",)
+
+    def __init__(self, profile_ids: Optional[Iterable[str]] = None):
+        """Initialize the matrix.
+
+        Args:
+            profile_ids: Profiles to evaluate, in column order. If None,
+                uses every profile in CDJ_PROFILES.
+
+        Raises:
+            ValueError: If a profile ID is unknown or none is given.
+        """
+        ids = tuple(dict.fromkeys(CDJ_PROFILES if profile_ids is None else profile_ids))
+        unknown = [profile_id for profile_id in ids if profile_id not in CDJ_PROFILES]
+        if unknown:
+            raise ValueError(f"Unknown profile(s): {', '.join(unknown)}")
+        if not ids:
+            raise ValueError("A compatibility matrix needs at least one profile")
+        object.__setattr__(
+            self, "_profiles", tuple((profile_id, CDJ_PROFILES[profile_id]) for profile_id in ids)
+        )
+
+    def __setattr__(self, name, value):
+        """Reject attribute assignment: a matrix is immutable."""
+        raise AttributeError("CompatibilityMatrix is immutable")
+
+    @property
+    def profile_ids(self) -> tuple[str, ...]:
+        """Profile IDs, in column order."""
+        return tuple(profile_id for profile_id, _ in self._profiles)
+
+    def evaluate(self, metadata: AudioMetadata) -> TrackVerdicts:
+        """Check a file against every profile of the matrix.
+
+        The verdict key is computed once and shared by all profiles.
+
+        Args:
+            metadata: Audio file metadata.
+
+        Returns:
+            TrackVerdicts with one CompatibilityResult per profile.
+        """
+        try:
+            key = verdict_key(metadata)
+        except Exception:
+            key = None  # check_profile reports the error per profile
+        return TrackVerdicts(
+            filepath=metadata.filepath,
+            profile_ids=self.profile_ids,
+            results=tuple(
+                check_profile(metadata, profile_id, profile, key)
+                for profile_id, profile in self._profiles
+            ),
+        )
+
+    def evaluate_all(self, metadata_list: Iterable[AudioMetadata]) -> Iterator[TrackVerdicts]:
+        """Evaluate several files lazily, in input order."""
+        return (self.evaluate(metadata) for metadata in metadata_list)
+
+    def summarize(self, verdicts: Iterable[TrackVerdicts]) -> MatrixSummary:
+        """Aggregate per-track verdicts into library-level counts.
+
+        Args:
+            verdicts: Verdicts produced by this matrix.
+
+        Returns:
+            MatrixSummary with per-profile status counts.
+        """
+        profile_ids = self.profile_ids
+        counts = {profile_id: {} for profile_id in profile_ids}
+        total = everywhere = nowhere = 0
+        for track in verdicts:
+            total += 1
+            compatible = 0
+            for profile_id, result in zip(profile_ids, track.results, strict=True):
+                by_status = counts[profile_id]
+                by_status[result.status] = by_status.get(result.status, 0) + 1
+                compatible += result.is_compatible
+            if compatible == len(profile_ids):
+                everywhere += 1
+            elif not compatible:
+                nowhere += 1
+        return MatrixSummary(profile_ids, total, counts, everywhere, nowhere)
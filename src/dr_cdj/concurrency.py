@@ -0,0 +1,243 @@
+"""ConcurrencyController: Adapts the number of parallel ffmpeg jobs to the machine."""
+
+import logging
+import os
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+from dr_cdj.config import (
+    CONCURRENCY_INTERVAL,
+    CONVERSION_WORKER_CEILING,
+    CONVERSION_WORKER_FLOOR,
+)
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+logger = logging.getLogger(__name__)
+
+# Load per core above which jobs are only queueing for CPU (load average only;
+# a saturated CPU under psutil shows up as a grow that adds no throughput)
+CPU_OVERLOAD = 1.5
+# Utilization below which there is room for another job
+CPU_LOW = 0.80
+# Minimum relative throughput gain that justifies the last added job
+MIN_GAIN = 0.10
+# Intervals to wait before growing again after a grow did not pay off
+COOLDOWN_INTERVALS = 5
+# Relative drop of both write rate and throughput, at unchanged concurrency,
+# read as the output device stalling (e.g. a USB stick flushing its cache)
+WRITE_DROP = 0.30
+
+
+def cpu_utilization() -> Optional[float]:
+    """Return system CPU utilization per core (1.0 = all cores busy), or None.
+
+    Uses psutil when installed (instantaneous), otherwise the 1-minute load
+    average, which lags but is available on macOS and Linux.
+    """
+    if psutil is not None:
+        return psutil.cpu_percent(interval=None) / 100
+    try:
+        return os.getloadavg()[0] / (os.cpu_count() or 1)
+    except (AttributeError, OSError):
+        return None
+
+
+@dataclass
+class ConcurrencyDecision:
+    """One controller decision, kept for the decision log."""
+
+    time: float  # Seconds since the batch started
+    action: str  # "grow", "shrink" or "hold"
+    limit: int  # Concurrency limit after the decision
+    reason: str
+    cpu: Optional[float] = None
+    throughput: float = 0.0  # Audio seconds converted per wall second
+    write_rate: float = 0.0  # Bytes written per second
+
+
+class ConcurrencyController:
+    """Hill-climbing controller for the number of concurrent conversion jobs.
+
+    Every ``interval`` seconds it compares the batch throughput (audio
+    seconds converted per wall second, fed by ffmpeg progress events) and
+    the write rate with the previous window. It adds a job while the CPU
+    has headroom and every slot is busy, backs off when the CPU is
+    saturated, and undoes a grow that raised neither throughput nor write
+    rate. When the write rate plateaus, the output device (e.g. a USB stick)
+    is the bottleneck. The rate at which it plateaued is kept as a write
+    ceiling, and the controller does not grow again while writes stay near
+    it. A sudden drop of both write rate and throughput also sheds a job.
+
+    ``observe`` may be called from any thread; ``update`` from the thread
+    that submits jobs.
+    """
+
+    def __init__(
+        self,
+        floor: int = CONVERSION_WORKER_FLOOR,
+        ceiling: int = CONVERSION_WORKER_CEILING,
+        initial: Optional[int] = None,
+        interval: float = CONCURRENCY_INTERVAL,
+        cpu_probe: Callable[[], Optional[float]] = cpu_utilization,
+    ):
+        """Initialize controller.
+
+        Args:
+            floor: Minimum number of concurrent jobs.
+            ceiling: Maximum number of concurrent jobs.
+            initial: Starting limit (default: floor).
+            interval: Seconds per measurement window.
+            cpu_probe: Returns CPU utilization per core, or None if unknown.
+        """
+        self.floor = max(floor, 1)
+        self.ceiling = max(ceiling, self.floor)
+        start = initial if initial is not None else self.floor
+        self.limit = min(max(start, self.floor), self.ceiling)
+        self.interval = interval
+        self.cpu_probe = cpu_probe
+        self.decisions: list[ConcurrencyDecision] = []
+        self._lock = threading.Lock()
+        self._jobs: dict[Path, tuple[float, int]] = {}
+        self._audio_seconds = 0.0
+        self._bytes = 0
+        self._started = time.monotonic()
+        self._window_start = self._started
+        self._last_throughput: Optional[float] = None
+        self._last_write_rate: Optional[float] = None
+        self._write_ceiling: Optional[float] = None  # Write rate the device saturated at
+        self._last_action = "hold"
+        self._settling = False
+        self._cooldown = 0
+        self.cpu_probe()  # Prime psutil's counter
+
+    def observe(self, source_path: Path, out_time: float, total_size: int) -> None:
+        """Account for progress reported by one job.
+
+        Args:
+            source_path: Job identifier.
+            out_time: Seconds of audio the job has written so far.
+            total_size: Bytes the job has written so far.
+        """
+        with self._lock:
+            prev_time, prev_size = self._jobs.get(source_path, (0.0, 0))
+            self._jobs[source_path] = (out_time, total_size)
+            self._audio_seconds += max(out_time - prev_time, 0.0)
+            self._bytes += max(total_size - prev_size, 0)
+
+    def update(self, active: int, pending: int, now: Optional[float] = None) -> int:
+        """Decide the limit for the next window, if the current one is over.
+
+        Args:
+            active: Jobs currently running.
+            pending: Jobs waiting to be started.
+            now: Current monotonic time (for tests).
+
+        Returns:
+            The concurrency limit to apply.
+        """
+        now = time.monotonic() if now is None else now
+        elapsed = now - self._window_start
+        if elapsed < self.interval:
+            return self.limit
+
+        with self._lock:
+            throughput = self._audio_seconds / elapsed
+            write_rate = self._bytes / elapsed
+            self._audio_seconds = 0.0
+            self._bytes = 0
+        self._window_start = now
+
+        if self._settling:
+            # First window after a change mixes old and new concurrency: discard it
+            self._settling = False
+            return self.limit
+
+        cpu = self.cpu_probe()
+        if self._cooldown:
+            self._cooldown -= 1
+
+        last_throughput = self._last_throughput
+        last_write_rate = self._last_write_rate
+        no_gain = bool(last_throughput) and throughput < last_throughput * (1 + MIN_GAIN)
+        writes_flat = bool(last_write_rate) and write_rate < last_write_rate * (1 + MIN_GAIN)
+        if self._write_ceiling is not None and write_rate > self._write_ceiling * (1 + MIN_GAIN):
+            self._write_ceiling = None  # The device keeps up again (e.g. cache flushed)
+        ceiling = self._write_ceiling
+        write_saturated = ceiling is not None and write_rate >= ceiling * (1 - MIN_GAIN)
+        can_grow = self.limit < self.ceiling and active >= self.limit and pending > 0
+
+        action, reason = "hold", "steady"
+        if cpu is not None and cpu >= CPU_OVERLOAD and self.limit > self.floor:
+            action, reason = "shrink", f"CPU overloaded ({cpu:.0%} per core)"
+        elif self._last_action == "grow" and self.limit > self.floor and (no_gain or writes_flat):
+            if no_gain:
+                reason = (
+                    f"last job added no throughput ({last_throughput:.1f}x → {throughput:.1f}x)"
+                )
+            else:
+                reason = (
+                    f"last job added no write throughput ({last_write_rate / 1e6:.1f} → "
+                    f"{write_rate / 1e6:.1f} MB/s)"
+                )
+            if writes_flat:
+                self._write_ceiling = max(write_rate, last_write_rate)
+                reason += ", output device saturated"
+            else:
+                reason += ", CPU or output device saturated"
+            action = "shrink"
+            self._cooldown = COOLDOWN_INTERVALS
+        elif (
+            self._last_action == "hold"
+            and self.limit > self.floor
+            and active >= self.limit
+            and pending > 0
+            and last_write_rate
+            and last_throughput
+            and write_rate < last_write_rate * (1 - WRITE_DROP)
+            and throughput < last_throughput * (1 - WRITE_DROP)
+        ):
+            action = "shrink"
+            reason = (
+                f"write rate dropped ({last_write_rate / 1e6:.1f} → "
+                f"{write_rate / 1e6:.1f} MB/s), output device saturated"
+            )
+            self._cooldown = COOLDOWN_INTERVALS
+        elif can_grow and not self._cooldown and (cpu is None or cpu < CPU_LOW):
+            if write_saturated:
+                reason = f"output device saturated ({write_rate / 1e6:.1f} MB/s)"
+            else:
+                action, reason = "grow", "CPU headroom" if cpu is not None else "probing"
+
+        if action == "grow":
+            self.limit += 1
+        elif action == "shrink":
+            self.limit -= 1
+
+        decision = ConcurrencyDecision(
+            time=now - self._started,
+            action=action,
+            limit=self.limit,
+            reason=reason,
+            cpu=cpu,
+            throughput=throughput,
+            write_rate=write_rate,
+        )
+        self.decisions.append(decision)
+        if action != "hold":
+            self._settling = True
+            logger.info(
+                f"Concurrency {action} → {self.limit}: {reason} "
+                f"(throughput {throughput:.1f}x, write {write_rate / 1e6:.1f} MB/s)"
+            )
+        self._last_action = action
+        self._last_throughput = throughput
+        self._last_write_rate = write_rate
+        return self.limit
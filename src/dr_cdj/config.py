@@ -1,5 +1,6 @@
 """Configuration and constants for Dr.CDJ with multi-model support."""
 
+import os
 from dataclasses import dataclass
 from typing import Set, Dict
 
@@ -322,6 +323,18 @@ for profile in CDJ_PROFILES.values():
     ALL_FORMATS.update(profile.formats)
 ALL_FORMATS.update(CONVERTIBLE_FORMATS)
 
+# File extensions picked up when scanning folders
+AUDIO_EXTENSIONS = frozenset(ext for fmt in ALL_FORMATS.values() for ext in fmt.extensions)
+
+# Maximum folder nesting walked below a dropped/scanned folder
+DISCOVERY_MAX_DEPTH = 32
+
+# Content fingerprints (duplicate detection): blocks hashed per file and
+# their size; files up to FINGERPRINT_SAMPLES * FINGERPRINT_BLOCK_SIZE
+# bytes are hashed whole
+FINGERPRINT_SAMPLES = 16
+FINGERPRINT_BLOCK_SIZE = 64 * 1024
+
 # Conversion preferences
 DEFAULT_OUTPUT_FORMAT = "WAV"
 DEFAULT_SAMPLE_RATE = 48000
@@ -337,10 +350,43 @@ SUPPORTED_SAMPLE_RATES = {44100, 48000, 88200, 96000}
 FFPROBE_TIMEOUT = 30
 FFMPEG_TIMEOUT = 300
 
+# ffmpeg watchdog: a job may run FFMPEG_TIMEOUT seconds plus
+# FFMPEG_TIMEOUT_PER_SECOND per second of audio, and is killed after
+# FFMPEG_STALL_TIMEOUT seconds without progress output. WATCHDOG_INTERVAL is
+# how often limits and cancellation are checked.
+FFMPEG_TIMEOUT_PER_SECOND = 0.5
+FFMPEG_STALL_TIMEOUT = 60
+WATCHDOG_INTERVAL = 0.1
+
+# Minimum seconds between two progress events of the same conversion job
+PROGRESS_INTERVAL = 0.25
+
 # Batch configuration
 DEFAULT_MAX_WORKERS = 2
 MAX_MAX_WORKERS = 4
 
+# Adaptive conversion concurrency: bounds and measurement window (seconds)
+CONVERSION_WORKER_FLOOR = 1
+CONVERSION_WORKER_CEILING = max(os.cpu_count() or 4, MAX_MAX_WORKERS)
+CONCURRENCY_INTERVAL = 2.0
+
+# Converter outputs: fsync before renaming into place, and write size used
+# when copying outputs staged on local disk to the destination
+OUTPUT_FSYNC = True
+STAGING_CHUNK_SIZE = 8 * 1024 * 1024
+
+# Batch analysis: ffprobe is mostly process start-up and I/O wait, so one
+# worker per core keeps the machine busy without oversubscribing it.
+DEFAULT_ANALYSIS_WORKERS = os.cpu_count() or 4
+MAX_ANALYSIS_WORKERS = 32
+
+# Persistent metadata cache (~/.dr_cdj/metadata_cache.sqlite3)
+METADATA_CACHE_MAX_ENTRIES = 200_000
+
+# Memoized compatibility verdicts, one per (profile, codec, extension, rate,
+# depth, float, lossy); a real library has a few hundred distinct keys
+VERDICT_CACHE_SIZE = 4096
+
 # Compatibility states
 COMPATIBLE = "compatible"
 CONVERTIBLE_LOSSLESS = "convertible_lossless"
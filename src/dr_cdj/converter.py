@@ -1,17 +1,64 @@
 """AudioConverter: Converts audio files using FFmpeg with multi-profile support."""
 
+import logging
+import os
 import shutil
 import subprocess
 import json
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from dataclasses import dataclass
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import asdict, dataclass
 from pathlib import Path
 from typing import Callable, Optional
 
 from dr_cdj.analyzer import AudioMetadata
-from dr_cdj.compatibility import CompatibilityResult, ConversionPlan
-from dr_cdj.config import FFMPEG_TIMEOUT, CDJ_PROFILES
-from dr_cdj.utils import get_ffmpeg_path, get_ffprobe_path
+from dr_cdj.cancellation import CancellationToken, ConversionCancelledError, ConversionTimeoutError
+from dr_cdj.compatibility import CompatibilityEngine, CompatibilityResult, ConversionPlan
+from dr_cdj.concurrency import ConcurrencyController
+from dr_cdj.config import (
+    CDJ_PROFILES,
+    CONVERSION_WORKER_CEILING,
+    CONVERSION_WORKER_FLOOR,
+    FFMPEG_STALL_TIMEOUT,
+    FFMPEG_TIMEOUT,
+    FFMPEG_TIMEOUT_PER_SECOND,
+    OUTPUT_FSYNC,
+    PROGRESS_INTERVAL,
+    WATCHDOG_INTERVAL,
+)
+from dr_cdj import pcm, staging
+from dr_cdj.fingerprint import ContentIndex
+from dr_cdj.headers import probe_header
+from dr_cdj.journal import (
+    CACHED,
+    CANCELLED,
+    DONE,
+    FAILED,
+    RUNNING,
+    ConversionJournal,
+    JournalJob,
+)
+from dr_cdj.manifest import ConversionManifest
+from dr_cdj.scheduler import estimate_cost, longest_first, predict_makespan
+from dr_cdj.utils import (
+    binary_capabilities,
+    cached_binary_info,
+    get_ffmpeg_path,
+    get_ffprobe_path,
+    record_binary,
+)
+
+logger = logging.getLogger(__name__)
+
+# SoX resampler with high precision and Shibata dithering: minimizes
+# artifacts when changing sample rates
+RESAMPLE_FILTER = "aresample=resampler=soxr:precision=28:cheby=1:dither_method=shibata"
+# Built-in swresample fallback for ffmpeg builds without libsoxr
+FALLBACK_RESAMPLE_FILTER = (
+    "aresample=resampler=swr:filter_size=64:phase_shift=10:cutoff=0.97:dither_method=shibata"
+)
 
 
 @dataclass
@@ -22,7 +69,32 @@ class ConversionResult:
     output_path: Optional[Path]
     success: bool
     message: str
-    duration: Optional[float] = None
+    duration: Optional[float] = None  # Wall time spent converting (seconds)
+    cached: bool = False  # Output was already up to date, ffmpeg not run
+    profile_id: Optional[str] = None  # Target profile
+    cancelled: bool = False  # Stopped by a CancellationToken before finishing
+    duplicate_of: Optional[Path] = None  # Identical source whose output was reused
+
+
+@dataclass
+class ConversionProgress:
+    """Progress of one running conversion job."""
+
+    source_path: Path
+    fraction: float  # 0.0 - 1.0 of the source duration written
+    out_time: float  # Seconds of audio written so far
+    speed: Optional[float] = None  # Realtime multiplier reported by ffmpeg
+    eta: Optional[float] = None  # Estimated seconds left for this job
+    total_size: int = 0  # Bytes written so far
+    batch_fraction: Optional[float] = None  # Duration-weighted batch progress (batches only)
+
+
+def _parse_speed(value: str) -> Optional[float]:
+    """Parse ffmpeg's speed field ("12.3x", "N/A")."""
+    try:
+        return float(value.strip().rstrip("x"))
+    except ValueError:
+        return None
 
 
 class AudioConverter:
@@ -33,22 +105,69 @@ class AudioConverter:
         ffmpeg_path: str | None = None,
         max_workers: int = 2,
         output_suffix: str = "_CDJ",
+        use_manifest: bool = True,
+        adaptive: bool = False,
+        worker_floor: int = CONVERSION_WORKER_FLOOR,
+        worker_ceiling: int = CONVERSION_WORKER_CEILING,
+        paranoid_verify: bool = False,
+        native_pcm: bool = True,
+        fsync: bool = OUTPUT_FSYNC,
+        stage_dir: Optional[Path] = None,
     ):
         """Initialize converter.
         
         Args:
             ffmpeg_path: Path to ffmpeg executable. If None, uses get_ffmpeg_path().
-            max_workers: Maximum number of parallel conversions.
+            max_workers: Maximum number of parallel conversions (starting
+                point when ``adaptive``).
             output_suffix: Suffix added to converted files.
+            use_manifest: Keep a manifest in each output directory and skip
+                jobs whose output is still up to date.
+            adaptive: Let a ConcurrencyController grow/shrink the number of
+                parallel conversions during a batch.
+            worker_floor: Minimum parallel conversions when adaptive.
+            worker_ceiling: Maximum parallel conversions when adaptive.
+            paranoid_verify: Also verify every output with ffprobe, on top of
+                the native header check.
+            native_pcm: Convert WAV/AIFF bit depth and endianness in
+                process (needs NumPy) instead of running ffmpeg, when no
+                resampling is required.
+            fsync: Flush each output to disk before renaming it into place.
+            stage_dir: Write outputs to this local directory first and copy
+                them to the destination in large sequential chunks (for
+                slow removable media). By default outputs are written next
+                to their final path under a temporary name.
         """
         self.ffmpeg_path = ffmpeg_path or get_ffmpeg_path()
         self.ffprobe_path = get_ffprobe_path()
         self.max_workers = max(max_workers, 1)
         self.output_suffix = output_suffix
+        self.use_manifest = use_manifest
+        self.adaptive = adaptive
+        self.worker_floor = worker_floor
+        self.worker_ceiling = worker_ceiling
+        self.paranoid_verify = paranoid_verify
+        self.native_pcm = native_pcm
+        self.fsync = fsync
+        self.stage_dir = stage_dir
+        self._verify_lock = threading.Lock()
+        self._verify_stats = self._empty_verify_stats()
+        self._ffprobe_verify_samples: list[float] = []
+        self._manifests: dict[Path, ConversionManifest] = {}
+        self._manifests_lock = threading.Lock()
+        self.last_batch_stats: dict = {}
         self._check_ffmpeg()
+        # Unknown capabilities (unverified binary) are assumed present
+        if binary_capabilities(self.ffmpeg_path).get("soxr", True):
+            self.resample_filter = RESAMPLE_FILTER
+        else:
+            logger.info("ffmpeg built without libsoxr: using the swresample resampler")
+            self.resample_filter = FALLBACK_RESAMPLE_FILTER
 
     def _check_ffmpeg(self) -> None:
-        """Verify ffmpeg is available."""
+        """Verify ffmpeg is available (skipped for already verified binaries)."""
+        if cached_binary_info(self.ffmpeg_path) is not None:
+            return
         try:
             result = subprocess.run(
                 [self.ffmpeg_path, "-version"],
@@ -58,6 +177,7 @@ class AudioConverter:
             )
             if result.returncode != 0:
                 raise RuntimeError("ffmpeg not working")
+            record_binary(self.ffmpeg_path, result.stdout)
         except FileNotFoundError:
             raise RuntimeError(
                 f"ffmpeg not found: {self.ffmpeg_path}\n"
@@ -123,6 +243,27 @@ class AudioConverter:
         
         return target_depth, target_rate, output_format, needs_resample
 
+    def estimate_job_cost(self, result: CompatibilityResult) -> float:
+        """Predict the conversion wall time (seconds, one core) of a result."""
+        plan = result.conversion_plan
+        if plan is None:
+            return 0.0
+        _, _, output_format, needs_resample = self._get_optimal_settings(
+            result.metadata, plan, result.profile_id
+        )
+        return estimate_cost(result.metadata, needs_resample, output_format)
+
+    def _get_manifest(self, output_dir: Path) -> Optional[ConversionManifest]:
+        """Return the (shared) manifest of an output directory, or None if disabled."""
+        if not self.use_manifest:
+            return None
+        key = output_dir.resolve()
+        with self._manifests_lock:
+            manifest = self._manifests.get(key)
+            if manifest is None:
+                manifest = self._manifests[key] = ConversionManifest(key)
+            return manifest
+
     def _build_output_path(
         self, source_path: Path, output_format: str, output_dir: Optional[Path] = None
     ) -> Path:
@@ -188,46 +329,21 @@ class AudioConverter:
             "-y",  # Overwrite existing files
             "-hide_banner",  # Less verbose output
             "-loglevel", "error",  # Only show errors
+            "-nostats",  # No human-readable stats on stderr...
+            "-progress", "pipe:1",  # ...machine-readable key=value progress on stdout
             "-i", str(source_path),  # Input
             "-vn",  # No video
         ]
         
         # High-quality resampling with dithering if needed
         if needs_resample:
-            # SoX resampler with high precision and Shibata dithering
-            # This minimizes artifacts when changing sample rates
-            cmd.extend([
-                "-af", "aresample=resampler=soxr:precision=28:cheby=1:dither_method=shibata",
-            ])
+            cmd.extend(["-af", self.resample_filter])
         
         # Sample rate
         cmd.extend(["-ar", str(target_rate)])
         
         # Audio codec and format based on output format
-        if output_format == "AIFF":
-            # AIFF uses big-endian
-            if target_depth == 16:
-                cmd.extend(["-c:a", "pcm_s16be"])
-                cmd.extend(["-sample_fmt", "s16"])
-            else:
-                cmd.extend(["-c:a", "pcm_s24be"])
-                cmd.extend(["-sample_fmt", "s32"])
-        elif output_format == "FLAC":
-            # FLAC for CDJ-3000
-            cmd.extend(["-c:a", "flac"])
-            cmd.extend(["-compression_level", "5"])  # Balanced
-            if target_depth == 16:
-                cmd.extend(["-sample_fmt", "s16"])
-            else:
-                cmd.extend(["-sample_fmt", "s32"])
-        else:  # WAV (default)
-            # WAV uses little-endian
-            if target_depth == 16:
-                cmd.extend(["-c:a", "pcm_s16le"])
-                cmd.extend(["-sample_fmt", "s16"])
-            else:
-                cmd.extend(["-c:a", "pcm_s24le"])
-                cmd.extend(["-sample_fmt", "s32"])
+        cmd.extend(self._codec_args(output_format, target_depth))
         
         # Metadata: copy only essential metadata, exclude embedded artwork
         # This prevents large files from artwork and incompatible tags
@@ -238,17 +354,178 @@ class AudioConverter:
         
         return cmd
 
-    def _verify_output(self, output_path: Path, expected_depth: int, expected_rate: int) -> bool:
+    @staticmethod
+    def _codec_args(output_format: str, target_depth: int) -> list[str]:
+        """Return encoder arguments for an output format and bit depth."""
+        if output_format == "AIFF":
+            # AIFF uses big-endian
+            if target_depth == 16:
+                return ["-c:a", "pcm_s16be", "-sample_fmt", "s16"]
+            return ["-c:a", "pcm_s24be", "-sample_fmt", "s32"]
+        if output_format == "FLAC":
+            # FLAC for CDJ-3000, balanced compression
+            sample_fmt = "s16" if target_depth == 16 else "s32"
+            return ["-c:a", "flac", "-compression_level", "5", "-sample_fmt", sample_fmt]
+        # WAV (default) uses little-endian
+        if target_depth == 16:
+            return ["-c:a", "pcm_s16le", "-sample_fmt", "s16"]
+        return ["-c:a", "pcm_s24le", "-sample_fmt", "s32"]
+
+    def _build_multi_ffmpeg_args(
+        self,
+        source_path: Path,
+        outputs: list[tuple[Path, tuple]],
+    ) -> list[str]:
+        """Build one ffmpeg command writing several outputs from a single decode.
+        
+        The decoded stream is split once per distinct target rate; each rate
+        that differs from the source is resampled once and then split again
+        between the outputs sharing it, so decode and resample are never
+        repeated.
+        
+        Args:
+            source_path: Source file path.
+            outputs: (output path, settings) pairs, settings as returned by
+                _get_optimal_settings.
+            
+        Returns:
+            List of arguments for subprocess.
+        """
+        by_rate: dict[tuple[int, bool], list[int]] = {}
+        for index, (_, (_, rate, _, needs_resample)) in enumerate(outputs):
+            by_rate.setdefault((rate, needs_resample), []).append(index)
+        
+        chains = []
+        if len(by_rate) > 1:
+            split = "".join(f"[r{k}]" for k in range(len(by_rate)))
+            chains.append(f"[0:a:0]asplit={len(by_rate)}{split}")
+            branches = [f"[r{k}]" for k in range(len(by_rate))]
+        else:
+            branches = ["[0:a:0]"]
+        
+        for branch, ((rate, needs_resample), indexes) in zip(
+            branches, by_rate.items(), strict=True
+        ):
+            chain = f"{self.resample_filter}:osr={rate}" if needs_resample else "anull"
+            if len(indexes) > 1:
+                chain += f",asplit={len(indexes)}"
+            chains.append(branch + chain + "".join(f"[o{i}]" for i in indexes))
+        
+        cmd = [
+            self.ffmpeg_path,
+            "-y",
+            "-hide_banner",
+            "-loglevel", "error",
+            "-nostats",
+            "-progress", "pipe:1",
+            "-i", str(source_path),
+            "-filter_complex", ";".join(chains),
+        ]
+        for index, (output_path, (depth, rate, output_format, _)) in enumerate(outputs):
+            cmd.extend(["-map", f"[o{index}]", "-map_metadata", "0", "-ar", str(rate)])
+            cmd.extend(self._codec_args(output_format, depth))
+            cmd.append(str(output_path))
+        return cmd
+
+    @staticmethod
+    def _settings_label(settings: tuple) -> str:
+        """Return a directory name for a settings tuple, e.g. "WAV_24bit_48kHz"."""
+        depth, rate, output_format, _ = settings
+        return f"{output_format}_{depth}bit_{rate / 1000:g}kHz"
+
+    @staticmethod
+    def _empty_verify_stats() -> dict:
+        """Return zeroed verification counters."""
+        return {"native": 0, "native_time": 0.0, "ffprobe": 0, "ffprobe_time": 0.0, "avoided": 0}
+
+    def _count_verify(self, method: str, elapsed: float) -> None:
+        """Accumulate verification counters (thread-safe)."""
+        with self._verify_lock:
+            self._verify_stats[method] += 1
+            self._verify_stats[f"{method}_time"] += elapsed
+            if method == "ffprobe":
+                self._ffprobe_verify_samples.append(elapsed)
+
+    def _verify_output(
+        self,
+        output_path: Path,
+        expected_depth: int,
+        expected_rate: int,
+        expected_duration: Optional[float] = None,
+    ) -> bool:
         """Verify converted file is valid and matches expected parameters.
         
+        The header just written is parsed natively (no subprocess, only the
+        first few KB are read). ffprobe is used when the header check is
+        inconclusive, once per converter to measure what it costs, and for
+        every file in ``paranoid_verify`` mode.
+        
         Args:
             output_path: Path to converted file
             expected_depth: Expected bit depth
             expected_rate: Expected sample rate
+            expected_duration: Source duration in seconds, if known
             
         Returns:
             True if verification passes
         """
+        start = time.perf_counter()
+        verdict = self._verify_header(output_path, expected_depth, expected_rate, expected_duration)
+        elapsed = time.perf_counter() - start
+        
+        if verdict is None:
+            return self._verify_with_ffprobe(output_path, expected_rate)
+        self._count_verify("native", elapsed)
+        
+        if verdict and (self.paranoid_verify or not self._ffprobe_verify_samples):
+            return self._verify_with_ffprobe(output_path, expected_rate)
+        with self._verify_lock:
+            self._verify_stats["avoided"] += 1
+        return verdict
+
+    @staticmethod
+    def _verify_header(
+        output_path: Path,
+        expected_depth: int,
+        expected_rate: int,
+        expected_duration: Optional[float],
+    ) -> Optional[bool]:
+        """Check the written header: rate, depth, data length vs duration.
+        
+        Returns:
+            True/False, or None if the header cannot be judged natively.
+        """
+        info = probe_header(output_path)
+        if info is None:
+            return None
+        if info.sample_rate != expected_rate or info.bit_depth != expected_depth:
+            return False
+        
+        block_align = info.block_align
+        if block_align:
+            # PCM: the data chunk must hold a whole number of frames and
+            # agree with the frame count in the header
+            if not info.data_size or info.data_size % block_align != 0:
+                return False
+            frames = info.data_size // block_align
+            if info.total_frames is not None and info.total_frames != frames:
+                return False
+        else:
+            # FLAC: STREAMINFO frame count (0 = unknown)
+            frames = info.total_frames
+            if not frames:
+                return None
+        
+        if expected_duration:
+            actual = frames / info.sample_rate
+            tolerance = max(0.05, expected_duration * 0.005)
+            if abs(actual - expected_duration) > tolerance:
+                return False
+        return True
+
+    def _verify_with_ffprobe(self, output_path: Path, expected_rate: int) -> bool:
+        """Verify an output by reading it back with ffprobe."""
+        start = time.perf_counter()
         try:
             cmd = [
                 self.ffprobe_path,
@@ -270,9 +547,8 @@ class AudioConverter:
             
             stream = streams[0]
             actual_rate = int(stream.get("sample_rate", 0))
-            actual_depth = int(stream.get("bits_per_raw_sample", 0))
             
-            # Verify sample rate matches (allowing for some tolerance)
+            # Verify sample rate matches
             if actual_rate != expected_rate:
                 return False
             
@@ -284,6 +560,8 @@ class AudioConverter:
             
         except Exception:
             return False
+        finally:
+            self._count_verify("ffprobe", time.perf_counter() - start)
 
     def _parse_error(self, stderr_output: list[str]) -> str:
         """Parse FFmpeg stderr for user-friendly error messages.
@@ -319,17 +597,195 @@ class AudioConverter:
         result: CompatibilityResult,
         output_dir: Optional[Path] = None,
         progress_callback: Optional[Callable[[float], None]] = None,
+        force: bool = False,
+        job_progress_callback: Optional[Callable[[ConversionProgress], None]] = None,
+        cancel_token: Optional[CancellationToken] = None,
     ) -> ConversionResult:
         """Convert a single file with optimal quality settings.
         
+        If the output already exists and the manifest shows it was made from
+        the unchanged source with the same settings, ffmpeg is not run and
+        the result is marked ``cached``.
+        
         Args:
             result: Compatibility result with conversion plan.
             output_dir: Optional output directory.
             progress_callback: Progress callback (0.0 - 1.0).
+            force: Convert even if the output is up to date.
+            job_progress_callback: Called with a ConversionProgress (fraction,
+                speed, ETA) at most every PROGRESS_INTERVAL seconds while
+                ffmpeg runs, and once at completion. Runs on a thread of
+                the conversion (not necessarily the caller's).
+            cancel_token: Stops the conversion when cancelled: ffmpeg is
+                killed, the partial output removed and the result marked
+                ``cancelled``.
+            
+        ffmpeg runs under a watchdog that kills it when it exceeds
+        FFMPEG_TIMEOUT plus FFMPEG_TIMEOUT_PER_SECOND per second of audio,
+        or produces no progress for FFMPEG_STALL_TIMEOUT seconds.
             
         Returns:
-            ConversionResult.
+            ConversionResult, with ``duration`` set to the wall time spent.
         """
+        start = time.perf_counter()
+        conversion = self._convert(
+            result, output_dir, progress_callback, force, job_progress_callback, cancel_token
+        )
+        conversion.duration = time.perf_counter() - start
+        conversion.profile_id = result.profile_id
+        return conversion
+
+    def convert_multi(
+        self,
+        result: CompatibilityResult,
+        profile_ids: list[str],
+        output_dir: Optional[Path] = None,
+        progress_callback: Optional[Callable[[float], None]] = None,
+        force: bool = False,
+        job_progress_callback: Optional[Callable[[ConversionProgress], None]] = None,
+        cancel_token: Optional[CancellationToken] = None,
+    ) -> list[ConversionResult]:
+        """Convert one file for several profiles with a single ffmpeg run.
+        
+        Profiles whose optimal settings coincide share one output; each
+        distinct output goes to a subdirectory named after its settings
+        (e.g. ``CDJ_Ready/WAV_24bit_48kHz/``). The source is decoded once,
+        and resampled once per distinct target rate.
+        
+        Args:
+            result: Compatibility result for the source (any profile).
+            profile_ids: Target CDJ profiles.
+            output_dir: Base output directory (default: source/CDJ_Ready).
+            progress_callback: Progress callback (0.0 - 1.0).
+            force: Convert even if outputs are up to date.
+            job_progress_callback: Receives ConversionProgress events.
+            cancel_token: Stops the conversion when cancelled (see convert).
+            
+        Returns:
+            One ConversionResult per profile, in ``profile_ids`` order.
+        """
+        start = time.perf_counter()
+        source_path = result.filepath
+        metadata = result.metadata
+        base_dir = output_dir if output_dir is not None else source_path.parent / "CDJ_Ready"
+        
+        by_profile: dict[str, ConversionResult] = {}
+        groups: dict[tuple, list[str]] = {}
+        for profile_id in profile_ids:
+            check = CompatibilityEngine(profile_id).check(metadata)
+            if check.is_compatible:
+                by_profile[profile_id] = ConversionResult(
+                    source_path=source_path,
+                    output_path=source_path,
+                    success=True,
+                    message=f"File already compatible with {check.profile_name}",
+                    profile_id=profile_id,
+                )
+            elif check.conversion_plan is None:
+                by_profile[profile_id] = ConversionResult(
+                    source_path=source_path,
+                    output_path=None,
+                    success=False,
+                    message=check.message or "No conversion plan available",
+                    profile_id=profile_id,
+                )
+            else:
+                settings = self._get_optimal_settings(metadata, check.conversion_plan, profile_id)
+                groups.setdefault(settings, []).append(profile_id)
+        
+        # One output per distinct settings; skip those still up to date
+        outputs: dict[tuple, Path] = {}
+        stale: list[tuple[Path, tuple]] = []
+        outcome: dict[tuple, tuple[bool, str, bool]] = {}
+        temps: dict[tuple, Path] = {}
+        cancelled = False
+        try:
+            for settings in groups:
+                output_path = self._build_output_path(
+                    source_path, settings[2], base_dir / self._settings_label(settings)
+                )
+                outputs[settings] = output_path
+                manifest = self._get_manifest(output_path.parent)
+                if manifest is not None:
+                    if not force and manifest.is_up_to_date(source_path, output_path, settings):
+                        outcome[settings] = (True, "Already converted, output up to date", True)
+                        continue
+                    manifest.forget(output_path)
+                stale.append((output_path, settings))
+            
+            if stale:
+                temps = {
+                    settings: staging.temp_path_for(output_path, self.stage_dir)
+                    for output_path, settings in stale
+                }
+                cmd = self._build_multi_ffmpeg_args(
+                    source_path, [(temps[settings], settings) for _, settings in stale]
+                )
+                returncode, stderr_output = self._run_ffmpeg(
+                    cmd, source_path, metadata.duration, progress_callback, job_progress_callback,
+                    cancel_token,
+                )
+                for output_path, settings in stale:
+                    if returncode != 0:
+                        outcome[settings] = (False, self._parse_error(stderr_output), False)
+                    elif not self._verify_output(
+                        temps[settings], settings[0], settings[1], metadata.duration
+                    ):
+                        outcome[settings] = (
+                            False,
+                            "Output file verification failed - conversion may be incomplete",
+                            False,
+                        )
+                    else:
+                        staging.commit(temps[settings], output_path, fsync=self.fsync)
+                        manifest = self._get_manifest(output_path.parent)
+                        if manifest is not None:
+                            manifest.record(source_path, output_path, settings)
+                        depth, rate, output_format, _ = settings
+                        quality_msg = f"{depth}bit/{rate / 1000:.1f}kHz"
+                        if output_format == "FLAC":
+                            quality_msg += " FLAC"
+                        outcome[settings] = (True, f"Converted to {quality_msg}", False)
+        except ConversionCancelledError:
+            cancelled = True
+            for settings in groups:
+                outcome.setdefault(settings, (False, "Cancelled", False))
+        except ConversionTimeoutError as e:
+            for _, settings in stale:
+                outcome[settings] = (False, str(e), False)
+        except Exception as e:
+            for settings in groups:
+                outcome.setdefault(settings, (False, f"Error: {str(e)[:100]}", False))
+        finally:
+            for temp_path in temps.values():
+                temp_path.unlink(missing_ok=True)
+        
+        elapsed = time.perf_counter() - start
+        for settings, profiles in groups.items():
+            success, message, cached = outcome[settings]
+            for profile_id in profiles:
+                by_profile[profile_id] = ConversionResult(
+                    source_path=source_path,
+                    output_path=outputs.get(settings) if success else None,
+                    success=success,
+                    message=message,
+                    duration=elapsed,
+                    cached=cached,
+                    profile_id=profile_id,
+                    cancelled=cancelled and not success,
+                )
+        return [by_profile[profile_id] for profile_id in profile_ids]
+
+    def _convert(
+        self,
+        result: CompatibilityResult,
+        output_dir: Optional[Path],
+        progress_callback: Optional[Callable[[float], None]],
+        force: bool,
+        job_progress_callback: Optional[Callable[[ConversionProgress], None]],
+        cancel_token: Optional[CancellationToken] = None,
+    ) -> ConversionResult:
+        """Body of convert() (see there)."""
         if not result.conversion_plan:
             return ConversionResult(
                 source_path=result.filepath,
@@ -351,35 +807,58 @@ class AudioConverter:
                 message="File already compatible, no conversion needed",
             )
         
+        temp_path: Optional[Path] = None
         try:
+            if cancel_token is not None:
+                cancel_token.raise_if_cancelled()
+            
             # Get optimal settings for logging
-            target_depth, target_rate, output_format, _ = self._get_optimal_settings(
-                metadata, plan, result.profile_id
+            target_depth, target_rate, output_format, needs_resample = (
+                self._get_optimal_settings(metadata, plan, result.profile_id)
             )
+            settings = (target_depth, target_rate, output_format, needs_resample)
             
             # Build output path with correct extension
             output_path = self._build_output_path(source_path, output_format, output_dir)
             
-            # Build ffmpeg command
-            cmd = self._build_ffmpeg_args(
-                source_path, output_path, metadata, plan, result.profile_id
-            )
+            # Skip if a previous run already produced this exact output
+            manifest = self._get_manifest(output_path.parent)
+            if manifest is not None:
+                if not force and manifest.is_up_to_date(source_path, output_path, settings):
+                    return ConversionResult(
+                        source_path=source_path,
+                        output_path=output_path,
+                        success=True,
+                        message="Already converted, output up to date",
+                        cached=True,
+                    )
+                manifest.forget(output_path)
             
-            # Execute ffmpeg
-            process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-            )
+            # Write under a temporary name; renamed into place once verified
+            temp_path = staging.temp_path_for(output_path, self.stage_dir)
             
-            # Read stderr for error collection
-            stderr_output = []
-            if process.stderr:
-                for line in process.stderr:
-                    stderr_output.append(line)
+            # Plain PCM rewrites (no resampling) run in process, without ffmpeg
+            converted = False
+            if self.native_pcm and pcm.can_convert(
+                source_path, target_depth, output_format, needs_resample
+            ):
+                converted = self._run_native(
+                    source_path, temp_path, target_depth, output_format,
+                    metadata.duration, progress_callback, job_progress_callback, cancel_token,
+                )
             
-            returncode = process.wait(timeout=FFMPEG_TIMEOUT)
+            returncode, stderr_output = 0, []
+            if not converted:
+                # Build ffmpeg command
+                cmd = self._build_ffmpeg_args(
+                    source_path, temp_path, metadata, plan, result.profile_id
+                )
+                
+                # Execute ffmpeg
+                returncode, stderr_output = self._run_ffmpeg(
+                    cmd, source_path, metadata.duration, progress_callback, job_progress_callback,
+                    cancel_token,
+                )
             
             if returncode != 0:
                 error_msg = self._parse_error(stderr_output)
@@ -391,9 +870,9 @@ class AudioConverter:
                 )
             
             # Verify output file
-            if not self._verify_output(output_path, target_depth, target_rate):
-                # Clean up invalid output
-                output_path.unlink(missing_ok=True)
+            if not self._verify_output(
+                temp_path, target_depth, target_rate, metadata.duration
+            ):
                 return ConversionResult(
                     source_path=source_path,
                     output_path=None,
@@ -401,6 +880,10 @@ class AudioConverter:
                     message="Output file verification failed - conversion may be incomplete",
                 )
             
+            staging.commit(temp_path, output_path, fsync=self.fsync)
+            if manifest is not None:
+                manifest.record(source_path, output_path, settings)
+            
             # Build success message with quality info
             quality_msg = f"{target_depth}bit/{target_rate/1000:.1f}kHz"
             if output_format == "FLAC":
@@ -413,13 +896,20 @@ class AudioConverter:
                 message=f"Converted to {quality_msg}",
             )
             
-        except subprocess.TimeoutExpired:
-            process.kill()
+        except ConversionCancelledError:
+            return ConversionResult(
+                source_path=source_path,
+                output_path=None,
+                success=False,
+                message="Cancelled",
+                cancelled=True,
+            )
+        except ConversionTimeoutError as e:
             return ConversionResult(
                 source_path=source_path,
                 output_path=None,
                 success=False,
-                message="Conversion timeout - file may be too large or complex",
+                message=str(e),
             )
         except Exception as e:
             return ConversionResult(
@@ -428,12 +918,258 @@ class AudioConverter:
                 success=False,
                 message=f"Error: {str(e)[:100]}",
             )
+        finally:
+            # Failed or unverified output: never leave the temporary file behind
+            if temp_path is not None:
+                temp_path.unlink(missing_ok=True)
+
+    def _run_native(
+        self,
+        source_path: Path,
+        output_path: Path,
+        target_depth: int,
+        output_format: str,
+        duration: Optional[float],
+        progress_callback: Optional[Callable[[float], None]],
+        job_progress_callback: Optional[Callable[[ConversionProgress], None]],
+        cancel_token: Optional[CancellationToken] = None,
+    ) -> bool:
+        """Convert with the in-process PCM engine, emitting throttled progress.
+        
+        Args:
+            source_path: Source WAV/AIFF file.
+            output_path: Destination path.
+            target_depth: Target bit depth.
+            output_format: Target container (WAV, AIFF).
+            duration: Source duration in seconds, if known.
+            progress_callback: Receives the job fraction (0.0 - 1.0).
+            job_progress_callback: Receives ConversionProgress events.
+            cancel_token: Checked after every chunk.
+            
+        Returns:
+            True if the output was written, False to fall back to ffmpeg.
+            
+        Raises:
+            ConversionCancelledError: cancel_token was cancelled.
+        """
+        start = time.monotonic()
+        last_emit = 0.0
+        
+        def on_chunk(fraction: float, out_time: float, total_size: int) -> None:
+            nonlocal last_emit
+            if cancel_token is not None:
+                cancel_token.raise_if_cancelled()
+            now = time.monotonic()
+            if fraction < 1.0 and now - last_emit < PROGRESS_INTERVAL:
+                return
+            last_emit = now
+            elapsed = now - start
+            speed = out_time / elapsed if elapsed > 0 else None
+            eta = None
+            if duration and speed:
+                eta = max(duration - out_time, 0.0) / speed
+            if progress_callback:
+                progress_callback(fraction)
+            if job_progress_callback:
+                job_progress_callback(
+                    ConversionProgress(
+                        source_path=source_path,
+                        fraction=fraction,
+                        out_time=out_time,
+                        speed=speed,
+                        eta=eta,
+                        total_size=total_size,
+                    )
+                )
+        
+        try:
+            pcm.convert(source_path, output_path, target_depth, output_format, on_chunk)
+        except (OSError, RuntimeError, ValueError) as e:
+            logger.warning(f"Native PCM conversion of {source_path.name} failed, using ffmpeg: {e}")
+            return False
+        return True
+
+    def _run_ffmpeg(
+        self,
+        cmd: list[str],
+        source_path: Path,
+        duration: Optional[float],
+        progress_callback: Optional[Callable[[float], None]],
+        job_progress_callback: Optional[Callable[[ConversionProgress], None]],
+        cancel_token: Optional[CancellationToken] = None,
+    ) -> tuple[int, list[str]]:
+        """Run ffmpeg under a watchdog, following its progress output.
+        
+        stdout (progress) and stderr (errors) are read on side threads; the
+        calling thread only waits for the process, checking every
+        WATCHDOG_INTERVAL for cancellation, the wall-clock limit and the
+        no-progress limit, so a hung decode cannot block it.
+        
+        Args:
+            cmd: ffmpeg command (with ``-progress pipe:1``).
+            source_path: Source file (for progress events).
+            duration: Source duration in seconds, if known.
+            progress_callback: Receives the job fraction (0.0 - 1.0).
+            job_progress_callback: Receives ConversionProgress events.
+            cancel_token: Kills ffmpeg when cancelled.
+            
+        Returns:
+            Tuple of (return code, stderr lines).
+            
+        Raises:
+            ConversionCancelledError: cancel_token was cancelled (ffmpeg is killed).
+            ConversionTimeoutError: A watchdog limit was exceeded (ffmpeg is killed).
+        """
+        process = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+        
+        stderr_output = []
+        stderr_reader = threading.Thread(
+            target=lambda: stderr_output.extend(process.stderr or ()), daemon=True
+        )
+        stderr_reader.start()
+        
+        started = time.monotonic()
+        last_output = started
+        
+        def heartbeat() -> None:
+            nonlocal last_output
+            last_output = time.monotonic()
+        
+        progress_reader = threading.Thread(
+            target=self._follow_progress,
+            args=(process, source_path, duration, progress_callback, job_progress_callback),
+            kwargs={"heartbeat": heartbeat},
+            daemon=True,
+        )
+        progress_reader.start()
+        
+        wall_limit = FFMPEG_TIMEOUT + (duration or 0.0) * FFMPEG_TIMEOUT_PER_SECOND
+        try:
+            while True:
+                try:
+                    returncode = process.wait(timeout=WATCHDOG_INTERVAL)
+                    break
+                except subprocess.TimeoutExpired:
+                    pass
+                if cancel_token is not None:
+                    cancel_token.raise_if_cancelled()
+                now = time.monotonic()
+                if now - started > wall_limit:
+                    raise ConversionTimeoutError(
+                        "Conversion timeout - file may be too large or complex"
+                    )
+                if now - last_output > FFMPEG_STALL_TIMEOUT:
+                    raise ConversionTimeoutError(
+                        f"Conversion stalled - no progress from ffmpeg for "
+                        f"{FFMPEG_STALL_TIMEOUT:.0f}s"
+                    )
+        except BaseException:
+            process.kill()
+            process.wait()
+            raise
+        finally:
+            progress_reader.join(timeout=5)
+            stderr_reader.join(timeout=5)
+        return returncode, stderr_output
+
+    def _follow_progress(
+        self,
+        process: subprocess.Popen,
+        source_path: Path,
+        duration: Optional[float],
+        progress_callback: Optional[Callable[[float], None]],
+        job_progress_callback: Optional[Callable[[ConversionProgress], None]],
+        heartbeat: Optional[Callable[[], None]] = None,
+    ) -> None:
+        """Parse ``-progress`` output until ffmpeg closes stdout, emitting throttled events.
+        
+        Args:
+            process: Running ffmpeg process.
+            source_path: Source file (for the events).
+            duration: Source duration in seconds, if known.
+            progress_callback: Receives the job fraction (0.0 - 1.0).
+            job_progress_callback: Receives ConversionProgress events.
+            heartbeat: Called for every line read (feeds the stall watchdog).
+        """
+        if process.stdout is None:
+            return
+        
+        block: dict[str, str] = {}
+        last_emit = 0.0
+        for line in process.stdout:
+            if heartbeat:
+                heartbeat()
+            key, sep, value = line.strip().partition("=")
+            if not sep:
+                continue
+            block[key] = value
+            if key != "progress":
+                continue
+            
+            # A "progress=" line terminates one block of key=value pairs
+            finished = value == "end"
+            now = time.monotonic()
+            if not finished and now - last_emit < PROGRESS_INTERVAL:
+                block = {}
+                continue
+            last_emit = now
+            
+            try:
+                # out_time_ms is in microseconds too (long-standing ffmpeg quirk)
+                out_time = int(block.get("out_time_us") or block.get("out_time_ms")) / 1e6
+            except (TypeError, ValueError):
+                out_time = 0.0
+            out_time = max(out_time, 0.0)
+            speed = _parse_speed(block.get("speed", ""))
+            try:
+                total_size = int(block.get("total_size", 0))
+            except ValueError:
+                total_size = 0
+            
+            if finished:
+                fraction = 1.0
+            elif duration:
+                fraction = min(out_time / duration, 0.999)
+            else:
+                fraction = 0.0
+            eta = None
+            if duration and speed:
+                eta = 0.0 if finished else max(duration - out_time, 0.0) / speed
+            
+            if progress_callback:
+                progress_callback(fraction)
+            if job_progress_callback:
+                job_progress_callback(
+                    ConversionProgress(
+                        source_path=source_path,
+                        fraction=fraction,
+                        out_time=out_time,
+                        speed=speed,
+                        eta=eta,
+                        total_size=total_size,
+                    )
+                )
+            block = {}
 
     def convert_batch(
         self,
         results: list[CompatibilityResult],
         output_dir: Optional[Path] = None,
         progress_callback: Optional[Callable[[int, int], None]] = None,
+        result_callback: Optional[Callable[[ConversionResult], None]] = None,
+        force: bool = False,
+        job_progress_callback: Optional[Callable[[ConversionProgress], None]] = None,
+        journal: Optional[ConversionJournal] = None,
+        cancel_token: Optional[CancellationToken] = None,
+        dedupe: bool = False,
+        full_hash: bool = False,
+        link_duplicates: bool = False,
+        job_start_callback: Optional[Callable[[CompatibilityResult], None]] = None,
     ) -> list[ConversionResult]:
         """Convert batch of files in parallel.
         
@@ -441,9 +1177,35 @@ class AudioConverter:
             results: List of compatibility results.
             output_dir: Optional output directory.
             progress_callback: Callback(current, total).
+            result_callback: Called with each ConversionResult as soon as
+                its job completes.
+            force: Reconvert files whose output is already up to date.
+            job_progress_callback: Receives per-job ConversionProgress events
+                with ``batch_fraction`` set to the batch progress weighted
+                by source duration. Called from worker threads.
+            journal: Record every job and its state transitions, so an
+                interrupted batch can be resumed (see ConversionJournal).
+            cancel_token: Stops the batch when cancelled: running jobs are
+                killed and, like jobs not yet started, reported with
+                ``cancelled`` set. An interrupted call (e.g. Ctrl-C) also
+                kills the running jobs before returning.
+            dedupe: Convert identical sources (same content fingerprint and
+                target settings) once; each copy then gets its own output
+                from the converted file, without re-encoding.
+            full_hash: Compare whole-file hashes when deduplicating.
+            link_duplicates: Hardlink the outputs of copies instead of
+                copying them (falls back to a copy where the filesystem
+                has no hardlinks, e.g. FAT32/exFAT sticks).
+            job_start_callback: Called with each job as it is handed to a
+                worker (not for copies reusing another job's output).
             
+        Jobs are started longest-first by estimated cost (see
+        dr_cdj.scheduler) so a long mix does not end up running alone at the
+        tail of the batch. Predicted and actual batch times are stored in
+        ``last_batch_stats``.
+        
         Returns:
-            List of ConversionResult.
+            List of ConversionResult, in completion order.
         """
         # Filter only those needing conversion
         to_convert = [r for r in results if r.needs_conversion]
@@ -451,27 +1213,361 @@ class AudioConverter:
         if not to_convert:
             return []
         
+        # Copies of a source are not scheduled: they reuse its output
+        copies: dict[int, list[CompatibilityResult]] = {}
+        if dedupe:
+            to_convert, copies = self._group_copies(to_convert, full_hash)
+        
+        costs = {id(r): self.estimate_job_cost(r) for r in to_convert}
+        to_convert = longest_first(to_convert, [costs[id(r)] for r in to_convert])
+        all_jobs = to_convert + [c for group in copies.values() for c in group]
+        predicted = predict_makespan((costs[id(r)] for r in to_convert), self.max_workers)
+        batch_start = time.perf_counter()
+        with self._verify_lock:
+            self._verify_stats = self._empty_verify_stats()
+        
+        controller = None
+        if self.adaptive:
+            controller = ConcurrencyController(
+                floor=self.worker_floor,
+                ceiling=self.worker_ceiling,
+                initial=self.max_workers,
+            )
+        
         conversion_results = []
         completed = 0
-        total = len(to_convert)
+        total = len(all_jobs)
         
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            # Submit all tasks
-            future_to_result = {
-                executor.submit(self.convert, r, output_dir): r
-                for r in to_convert
+        fractions: dict[Path, float] = {}
+        if job_progress_callback:
+            # Weight each job by its duration (unknown durations count as average)
+            known = [r.metadata.duration for r in to_convert if r.metadata.duration]
+            default_weight = sum(known) / len(known) if known else 1.0
+            weights = {
+                r.filepath: r.metadata.duration or default_weight for r in all_jobs
             }
+            total_weight = sum(weights.values())
+            fractions = dict.fromkeys(weights, 0.0)
+            fractions_lock = threading.Lock()
+        
+        def on_job_progress(event: ConversionProgress) -> None:
+            if controller:
+                controller.observe(event.source_path, event.out_time, event.total_size)
+            if job_progress_callback:
+                with fractions_lock:
+                    fractions[event.source_path] = event.fraction
+                    done = sum(weights[p] * f for p, f in fractions.items())
+                event.batch_fraction = min(done / total_weight, 1.0)
+                job_progress_callback(event)
+        
+        job_ids = {id(r): job_id for job_id, r in enumerate(all_jobs)}
+        if journal is not None:
+            journal.start_batch(
+                [self._journal_job(job_ids[id(r)], r, output_dir) for r in all_jobs],
+                output_dir,
+                self.stage_dir,
+            )
+        
+        if cancel_token is None:
+            cancel_token = CancellationToken()
+        
+        def finish(source: CompatibilityResult, result: ConversionResult) -> None:
+            nonlocal completed
+            conversion_results.append(result)
+            completed += 1
+            if journal is not None:
+                journal.mark(job_ids[id(source)], *self._journal_state(result))
             
-            # Collect results
-            for future in as_completed(future_to_result):
-                result = future.result()
-                conversion_results.append(result)
-                completed += 1
-                
-                if progress_callback:
-                    progress_callback(completed, total)
+            # Jobs that never ran ffmpeg (cached, failed early) still count as done
+            if job_progress_callback and fractions[result.source_path] < 1.0:
+                on_job_progress(
+                    ConversionProgress(
+                        source_path=result.source_path,
+                        fraction=1.0,
+                        out_time=source.metadata.duration or 0.0,
+                    )
+                )
+            
+            if result_callback:
+                result_callback(result)
+            
+            if progress_callback:
+                progress_callback(completed, total)
+            
+            for copy in copies.pop(id(source), ()):
+                finish(
+                    copy,
+                    self._share_output(result, copy, output_dir, force, link_duplicates),
+                )
+        
+        pending = deque(to_convert)
+        running = {}
+        pool_size = controller.ceiling if controller else self.max_workers
+        with ThreadPoolExecutor(max_workers=pool_size) as executor:
+            
+            def submit_ready() -> None:
+                limit = controller.limit if controller else pool_size
+                while pending and len(running) < limit and not cancel_token.cancelled:
+                    r = pending.popleft()
+                    if journal is not None:
+                        journal.mark(job_ids[id(r)], RUNNING)
+                    if job_start_callback:
+                        job_start_callback(r)
+                    future = executor.submit(
+                        self.convert, r, output_dir,
+                        force=force, job_progress_callback=on_job_progress,
+                        cancel_token=cancel_token,
+                    )
+                    running[future] = r
+            
+            try:
+                submit_ready()
+                while running:
+                    done, _ = wait(
+                        running,
+                        timeout=controller.interval if controller else None,
+                        return_when=FIRST_COMPLETED,
+                    )
+                    for future in done:
+                        source = running.pop(future)
+                        finish(source, future.result())
+                    
+                    if controller:
+                        controller.update(active=len(running), pending=len(pending))
+                    submit_ready()
+            except BaseException:
+                # Kill running ffmpeg processes instead of letting the pool wait for them
+                cancel_token.cancel()
+                raise
         
+        # Jobs never started because the batch was cancelled
+        while pending:
+            r = pending.popleft()
+            finish(
+                r,
+                ConversionResult(
+                    source_path=r.filepath,
+                    output_path=None,
+                    success=False,
+                    message="Cancelled",
+                    profile_id=r.profile_id,
+                    cancelled=True,
+                ),
+            )
+        
+        if journal is not None:
+            if cancel_token.cancelled:
+                # Leave the batch resumable
+                journal.close()
+            else:
+                journal.end_batch()
+        self._record_batch_stats(
+            to_convert, costs, conversion_results, predicted, batch_start, controller
+        )
+        self.last_batch_stats["duplicates"] = len(all_jobs) - len(to_convert)
         return conversion_results
+    
+    def _group_copies(
+        self, jobs: list[CompatibilityResult], full_hash: bool = False
+    ) -> tuple[list[CompatibilityResult], dict[int, list[CompatibilityResult]]]:
+        """Split jobs into originals and copies with identical content and settings.
+        
+        Args:
+            jobs: Jobs needing conversion.
+            full_hash: Compare whole-file hashes (see dr_cdj.fingerprint).
+            
+        Returns:
+            Tuple (originals, copies), where ``copies`` maps ``id(original)``
+            to the jobs that can reuse its output.
+        """
+        content = ContentIndex(full_hash)
+        originals = []
+        copies: dict[int, list[CompatibilityResult]] = {}
+        by_content: dict[tuple, CompatibilityResult] = {}
+        for r in jobs:
+            if r.conversion_plan is None:
+                originals.append(r)
+                continue
+            settings = self._get_optimal_settings(r.metadata, r.conversion_plan, r.profile_id)
+            key = (content.add(r.filepath) or r.filepath, settings)
+            original = by_content.setdefault(key, r)
+            if original is r:
+                originals.append(r)
+            else:
+                copies.setdefault(id(original), []).append(r)
+        if copies:
+            logger.info(f"{content.duplicates} duplicate source(s) will reuse converted outputs")
+        return originals, copies
+    
+    def _share_output(
+        self,
+        original: ConversionResult,
+        result: CompatibilityResult,
+        output_dir: Optional[Path] = None,
+        force: bool = False,
+        link: bool = False,
+    ) -> ConversionResult:
+        """Give a copy of an already converted source its own output.
+        
+        The output of ``original`` is hardlinked (``link``) or copied to the
+        output path of ``result`` instead of converting the copy again.
+        
+        Args:
+            original: Result of converting the identical source.
+            result: Compatibility result of the copy.
+            output_dir: Output directory of the batch.
+            force: Replace an output that is already up to date.
+            link: Hardlink instead of copying when the filesystem allows it.
+        """
+        source_path = result.filepath
+        if not original.success:
+            return ConversionResult(
+                source_path=source_path,
+                output_path=None,
+                success=False,
+                message=original.message,
+                profile_id=result.profile_id,
+                cancelled=original.cancelled,
+                duplicate_of=original.source_path,
+            )
+        
+        settings = self._get_optimal_settings(
+            result.metadata, result.conversion_plan, result.profile_id
+        )
+        output_path = self._build_output_path(source_path, settings[2], output_dir)
+        shared = ConversionResult(
+            source_path=source_path,
+            output_path=output_path,
+            success=True,
+            message=f"Same content as {original.source_path.name}",
+            cached=original.cached,
+            profile_id=result.profile_id,
+            duplicate_of=original.source_path,
+        )
+        if output_path == original.output_path:
+            return shared
+        
+        manifest = self._get_manifest(output_path.parent)
+        if manifest is not None:
+            if not force and manifest.is_up_to_date(source_path, output_path, settings):
+                shared.cached = True
+                shared.message = "Already converted, output up to date"
+                return shared
+            manifest.forget(output_path)
+        
+        temp_path = staging.temp_path_for(output_path)
+        try:
+            linked = False
+            if link:
+                try:
+                    os.link(original.output_path, temp_path)
+                    linked = True
+                except OSError as e:
+                    logger.debug(f"Hardlink not possible for {output_path}, copying: {e}")
+            if not linked:
+                staging.copy_chunked(original.output_path, temp_path)
+            staging.commit(temp_path, output_path, fsync=self.fsync and not linked)
+        except OSError as e:
+            temp_path.unlink(missing_ok=True)
+            return ConversionResult(
+                source_path=source_path,
+                output_path=None,
+                success=False,
+                message=f"Could not write output: {e}",
+                profile_id=result.profile_id,
+                duplicate_of=original.source_path,
+            )
+        if manifest is not None:
+            manifest.record(source_path, output_path, settings)
+        
+        shared.cached = False
+        shared.message = (
+            f"{'Hardlinked' if linked else 'Copied'} from {original.source_path.name} "
+            "(same content)"
+        )
+        return shared
+
+    def _journal_job(
+        self, job_id: int, result: CompatibilityResult, output_dir: Optional[Path]
+    ) -> JournalJob:
+        """Describe a batch job for the conversion journal."""
+        plan = result.conversion_plan
+        settings = self._get_optimal_settings(result.metadata, plan, result.profile_id)
+        return JournalJob(
+            job_id=job_id,
+            source_path=result.filepath,
+            profile_id=result.profile_id,
+            plan=asdict(plan),
+            settings=list(settings),
+            output_path=self._build_output_path(result.filepath, settings[2], output_dir),
+        )
+
+    @staticmethod
+    def _journal_state(result: ConversionResult) -> tuple[str, str]:
+        """Return the journal state and message for a finished job."""
+        if result.cached:
+            return CACHED, ""
+        if result.success:
+            return DONE, ""
+        if result.cancelled:
+            return CANCELLED, ""
+        return FAILED, result.message
+
+    def _record_batch_stats(
+        self,
+        jobs: list[CompatibilityResult],
+        costs: dict[int, float],
+        conversions: list[ConversionResult],
+        predicted: float,
+        batch_start: float,
+        controller: Optional[ConcurrencyController] = None,
+    ) -> None:
+        """Store predicted vs actual timings of the last batch in ``last_batch_stats``."""
+        actual = time.perf_counter() - batch_start
+        predicted_by_path = {r.filepath: costs[id(r)] for r in jobs}
+        
+        # Per-job model error, only over jobs that really ran ffmpeg
+        errors = [
+            (c.duration - predicted_by_path[c.source_path]) / c.duration
+            for c in conversions
+            if c.success and not c.cached and c.duration
+        ]
+        
+        self.last_batch_stats = {
+            "files": len(jobs),
+            "workers": self.max_workers,
+            "cached": sum(1 for c in conversions if c.cached),
+            "predicted_time": predicted,
+            "actual_time": actual,
+            "predicted_ratio": predicted / actual if actual > 0 else None,
+            "job_mean_relative_error": (
+                sum(abs(e) for e in errors) / len(errors) if errors else None
+            ),
+        }
+        with self._verify_lock:
+            verify = dict(self._verify_stats)
+            samples = list(self._ffprobe_verify_samples)
+        ffprobe_cost = sum(samples) / len(samples) if samples else None
+        self.last_batch_stats.update(
+            verify_native=verify["native"],
+            verify_ffprobe=verify["ffprobe"],
+            verify_time=verify["native_time"] + verify["ffprobe_time"],
+            # ffprobe runs avoided × measured ffprobe cost, minus the native checks
+            verify_time_saved=(
+                verify["avoided"] * ffprobe_cost - verify["native_time"]
+                if ffprobe_cost is not None
+                else None
+            ),
+        )
+        if controller:
+            self.last_batch_stats["final_workers"] = controller.limit
+            self.last_batch_stats["concurrency_decisions"] = [
+                asdict(d) for d in controller.decisions if d.action != "hold"
+            ]
+        logger.info(
+            f"Conversion batch: {len(jobs)} files in {actual:.1f}s "
+            f"(predicted {predicted:.1f}s, {self.max_workers} workers)"
+        )
 
     def get_conversion_summary(
         self, results: list[ConversionResult]
@@ -485,11 +1581,15 @@ class AudioConverter:
             Dict with statistics.
         """
         successful = sum(1 for r in results if r.success)
-        failed = len(results) - successful
+        cancelled = sum(1 for r in results if r.cancelled)
+        failed = len(results) - successful - cancelled
+        cached = sum(1 for r in results if r.cached)
         
         return {
             "total": len(results),
             "successful": successful,
             "failed": failed,
+            "cancelled": cancelled,
+            "cached": cached,
             "outputs": [r.output_path for r in results if r.output_path],
         }
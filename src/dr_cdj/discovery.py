@@ -0,0 +1,143 @@
+"""Streaming discovery of audio files in dropped or scanned folders.
+
+A single ``os.scandir`` pass per directory: each entry's type comes from
+the directory listing itself, so no extra ``stat`` call is needed for
+plain files. Paths are yielded as they are found, letting analysis start
+before the walk is over.
+"""
+
+import logging
+import os
+import threading
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Optional
+
+from dr_cdj.config import AUDIO_EXTENSIONS, DISCOVERY_MAX_DEPTH
+
+logger = logging.getLogger(__name__)
+
+
+def is_audio_name(name: str) -> bool:
+    """True for visible files with a known audio extension (any case).
+
+    Hidden files are skipped, including macOS AppleDouble files (``._*``)
+    that share the name and extension of the real track.
+    """
+    if name.startswith("."):
+        return False
+    dot = name.rfind(".")
+    return dot > 0 and name[dot:].lower() in AUDIO_EXTENSIONS
+
+
+def _dir_key(path: str) -> Optional[tuple[int, int]]:
+    """Return (device, inode) identifying a directory, or None if unreadable."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_dev, st.st_ino
+
+
+def walk_audio_files(
+    root: Path,
+    max_depth: int = DISCOVERY_MAX_DEPTH,
+    follow_symlinks: bool = True,
+    cancel: Optional[threading.Event] = None,
+    _visited: Optional[set] = None,
+) -> Iterator[Path]:
+    """Yield the audio files below a directory, depth first.
+
+    Each directory's files are yielded (sorted by name) before its
+    subdirectories are entered, the same order as a sorted ``os.walk``.
+    Hidden files and folders are skipped. Unreadable directories are
+    logged and skipped.
+
+    Args:
+        root: Directory to walk.
+        max_depth: Subdirectory levels to descend (0: only ``root``).
+        follow_symlinks: Descend into symlinked folders. Every directory
+            is entered at most once, so symlink loops terminate.
+        cancel: Stop walking once this event is set.
+
+    Yields:
+        Paths of audio files.
+    """
+    visited = _visited if _visited is not None else set()
+    root_key = _dir_key(str(root))
+    if root_key is None or root_key in visited:
+        return
+    visited.add(root_key)
+
+    # Stack of (directory, depth); children pushed in reverse to pop in order
+    stack = [(str(root), 0)]
+    while stack:
+        if cancel is not None and cancel.is_set():
+            return
+        directory, depth = stack.pop()
+        files = []
+        subdirs = []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.name.startswith("."):
+                        continue
+                    try:
+                        if entry.is_dir(follow_symlinks=follow_symlinks):
+                            if depth < max_depth:
+                                subdirs.append(entry)
+                        elif is_audio_name(entry.name) and entry.is_file():
+                            files.append(entry.name)
+                    except OSError:
+                        continue
+        except OSError as e:
+            logger.debug(f"Skipping unreadable folder {directory}: {e}")
+            continue
+
+        for name in sorted(files):
+            yield Path(directory, name)
+
+        for entry in sorted(subdirs, key=lambda e: e.name, reverse=True):
+            key = _dir_key(entry.path)
+            if key is None or key in visited:
+                continue
+            visited.add(key)
+            stack.append((entry.path, depth + 1))
+
+
+def discover(
+    paths: Iterable[Path],
+    recursive: bool = True,
+    max_depth: int = DISCOVERY_MAX_DEPTH,
+    cancel: Optional[threading.Event] = None,
+) -> Iterator[Path]:
+    """Yield files to analyze from files and folders (e.g. a drop).
+
+    Paths that are not directories are yielded as-is, even with an unknown
+    extension, so the caller reports an error instead of ignoring them.
+    Folders are walked with :func:`walk_audio_files`; a folder reached
+    twice (nested drops, symlinks) is only listed once.
+
+    Args:
+        paths: Files and/or directories.
+        recursive: Descend into subdirectories (up to ``max_depth``).
+        max_depth: Subdirectory levels to descend when recursive.
+        cancel: Stop discovery once this event is set.
+
+    Yields:
+        Paths of files to analyze.
+    """
+    visited: set = set()
+    for path in paths:
+        if cancel is not None and cancel.is_set():
+            return
+        path = Path(path)
+        if path.is_dir():
+            yield from walk_audio_files(
+                path,
+                max_depth=max_depth if recursive else 0,
+                cancel=cancel,
+                _visited=visited,
+            )
+        else:
+            yield path
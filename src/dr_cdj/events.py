@@ -0,0 +1,203 @@
+"""Conversion worker thread and the event bus it reports through.
+
+The GUI must never block in ``convert_batch``: a ConversionWorker runs it
+on its own thread and publishes typed events to an EventBus. The Tk thread
+drains the bus at a fixed frame rate; :func:`coalesce` keeps only the
+latest progress event per job, so the UI work per frame stays bounded
+however many events the workers produce.
+"""
+
+import logging
+import queue
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional
+
+from dr_cdj.cancellation import CancellationToken
+from dr_cdj.compatibility import CompatibilityResult
+from dr_cdj.converter import AudioConverter, ConversionProgress, ConversionResult
+from dr_cdj.journal import ConversionJournal
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class JobStarted:
+    """A job was handed to a conversion worker."""
+
+    source_path: Path
+    profile_id: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class JobProgress:
+    """Progress of a running job (latest value wins when coalesced)."""
+
+    source_path: Path
+    fraction: float
+    batch_fraction: Optional[float] = None
+    speed: Optional[float] = None
+
+
+@dataclass(frozen=True)
+class JobFinished:
+    """A job completed successfully (converted, up to date or shared)."""
+
+    result: ConversionResult
+
+
+@dataclass(frozen=True)
+class JobFailed:
+    """A job failed or was cancelled."""
+
+    result: ConversionResult
+
+
+@dataclass(frozen=True)
+class BatchFinished:
+    """The worker is done; no more events follow."""
+
+    results: list[ConversionResult] = field(default_factory=list)
+    error: Optional[str] = None  # Unexpected exception that stopped the batch
+
+
+ConversionEvent = JobStarted | JobProgress | JobFinished | JobFailed | BatchFinished
+
+
+class EventBus:
+    """Thread-safe FIFO of conversion events (many producers, one consumer)."""
+
+    def __init__(self):
+        """Initialize an empty bus."""
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+
+    def publish(self, event: ConversionEvent) -> None:
+        """Add an event (any thread)."""
+        self._queue.put(event)
+
+    def drain(self, max_events: Optional[int] = None) -> list[ConversionEvent]:
+        """Remove and return the queued events, oldest first.
+
+        Args:
+            max_events: Stop after this many events (None: all queued).
+        """
+        events = []
+        while max_events is None or len(events) < max_events:
+            try:
+                events.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return events
+
+
+def coalesce(events: list[ConversionEvent]) -> list[ConversionEvent]:
+    """Drop progress events superseded by a later event of the same job.
+
+    Start, finish, failure and batch events are kept in order; of the
+    progress events only the most recent per job survives, and none for a
+    job that finished within the same drain.
+
+    Args:
+        events: Drained events, oldest first.
+
+    Returns:
+        Events to apply, oldest first.
+    """
+    latest: dict[Path, int] = {}
+    for i, event in enumerate(events):
+        if isinstance(event, JobProgress):
+            latest[event.source_path] = i
+        elif isinstance(event, (JobFinished, JobFailed)):
+            latest.pop(event.result.source_path, None)
+    keep = set(latest.values())
+    return [
+        event for i, event in enumerate(events) if not isinstance(event, JobProgress) or i in keep
+    ]
+
+
+class ConversionWorker(threading.Thread):
+    """Daemon thread running a conversion and publishing its events.
+
+    The last event is always BatchFinished, even if the conversion raises.
+    """
+
+    def __init__(
+        self,
+        converter: AudioConverter,
+        jobs: list[CompatibilityResult],
+        bus: EventBus,
+        output_dir: Optional[Path] = None,
+        journal: Optional[ConversionJournal] = None,
+        cancel_token: Optional[CancellationToken] = None,
+        batch: bool = True,
+        **batch_options,
+    ):
+        """Initialize the worker (call start() to run it).
+
+        Args:
+            converter: Converter to run.
+            jobs: Compatibility results to convert.
+            bus: Bus receiving the events.
+            output_dir: Output directory (None: next to each source).
+            journal: Journal for resumable batches (batch mode only).
+            cancel_token: Token stopping the conversion.
+            batch: Use ``convert_batch`` (parallel, scheduled); False
+                converts the jobs one by one with ``convert``.
+            **batch_options: Extra ``convert_batch`` arguments (e.g. dedupe).
+        """
+        super().__init__(name="dr-cdj-conversion", daemon=True)
+        self.converter = converter
+        self.jobs = jobs
+        self.bus = bus
+        self.output_dir = output_dir
+        self.journal = journal
+        self.cancel_token = cancel_token or CancellationToken()
+        self.batch = batch
+        self.batch_options = batch_options
+
+    def _on_started(self, result: CompatibilityResult) -> None:
+        """Publish JobStarted for a job handed to ffmpeg."""
+        self.bus.publish(JobStarted(result.filepath, result.profile_id))
+
+    def _on_progress(self, event: ConversionProgress) -> None:
+        """Publish a converter progress event as JobProgress."""
+        self.bus.publish(
+            JobProgress(event.source_path, event.fraction, event.batch_fraction, event.speed)
+        )
+
+    def _on_result(self, result: ConversionResult) -> None:
+        """Publish JobFinished or JobFailed for a completed job."""
+        self.bus.publish(JobFinished(result) if result.success else JobFailed(result))
+
+    def run(self) -> None:
+        """Convert the jobs, then publish BatchFinished."""
+        results: list[ConversionResult] = []
+        try:
+            if self.batch:
+                results = self.converter.convert_batch(
+                    self.jobs,
+                    output_dir=self.output_dir,
+                    result_callback=self._on_result,
+                    job_progress_callback=self._on_progress,
+                    job_start_callback=self._on_started,
+                    journal=self.journal,
+                    cancel_token=self.cancel_token,
+                    **self.batch_options,
+                )
+            else:
+                for job in self.jobs:
+                    self._on_started(job)
+                    result = self.converter.convert(
+                        job,
+                        output_dir=self.output_dir,
+                        job_progress_callback=self._on_progress,
+                        cancel_token=self.cancel_token,
+                    )
+                    results.append(result)
+                    self._on_result(result)
+        except Exception as e:
+            logger.exception("Conversion worker failed")
+            self.bus.publish(BatchFinished(results, error=str(e)))
+            return
+        self.bus.publish(BatchFinished(results))
@@ -0,0 +1,124 @@
+"""Content fingerprints: find copies of the same track in different folders.
+
+A fingerprint is the file size plus a BLAKE2b hash of evenly spaced blocks
+(first and last block included), so it costs a few small reads however
+large the file is. Two copies of a track, even under different names or
+dates, get the same fingerprint; tagging or re-encoding one changes it.
+The optional full hash reads the whole file, for libraries where sampled
+blocks are not considered proof enough.
+"""
+
+import hashlib
+import logging
+import os
+from pathlib import Path
+from typing import Optional
+
+from dr_cdj.config import FINGERPRINT_BLOCK_SIZE, FINGERPRINT_SAMPLES
+
+logger = logging.getLogger(__name__)
+
+# Read size of the full hash
+_FULL_HASH_CHUNK = 1024 * 1024
+
+
+def content_fingerprint(path: Path, full: bool = False) -> Optional[str]:
+    """Return the content fingerprint of a file, or None if it cannot be read.
+
+    Args:
+        path: File to fingerprint.
+        full: Hash the whole file instead of sampled blocks.
+
+    Returns:
+        String ``"<size>:<s|f>:<hex digest>"``; sampled and full fingerprints
+        never compare equal.
+    """
+    try:
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            digest = hashlib.blake2b(digest_size=16)
+            digest.update(size.to_bytes(8, "little"))
+            sampled_size = FINGERPRINT_SAMPLES * FINGERPRINT_BLOCK_SIZE
+            if full or size <= sampled_size:
+                while chunk := f.read(_FULL_HASH_CHUNK):
+                    digest.update(chunk)
+            else:
+                step = (size - FINGERPRINT_BLOCK_SIZE) / (FINGERPRINT_SAMPLES - 1)
+                for i in range(FINGERPRINT_SAMPLES):
+                    f.seek(int(i * step))
+                    digest.update(f.read(FINGERPRINT_BLOCK_SIZE))
+    except OSError as e:
+        logger.debug(f"Cannot fingerprint {path}: {e}")
+        return None
+    mode = "f" if full or size <= sampled_size else "s"
+    return f"{size}:{mode}:{digest.hexdigest()}"
+
+
+class ContentIndex:
+    """Incremental duplicate detector for a stream of paths.
+
+    Files are first grouped by size; a file is only hashed once another
+    file of the same size shows up, so a library without duplicates costs
+    one ``stat`` per file. Hard links and repeated paths are recognized by
+    inode without hashing.
+
+    Not thread-safe: feed it from one thread.
+    """
+
+    def __init__(self, full_hash: bool = False):
+        """Initialize an empty index.
+
+        Args:
+            full_hash: Compare whole-file hashes instead of sampled blocks.
+        """
+        self.full_hash = full_hash
+        self._by_inode: dict[tuple[int, int], Path] = {}
+        # size → originals of that size not hashed yet
+        self._unhashed: dict[int, list[Path]] = {}
+        self._by_fingerprint: dict[str, Path] = {}
+        self.duplicates = 0
+
+    def add(self, path: Path) -> Optional[Path]:
+        """Register a file and return the earlier file with the same content.
+
+        Args:
+            path: File to register.
+
+        Returns:
+            The first registered path with identical content, or None if
+            ``path`` is new (or unreadable, which is never a duplicate).
+        """
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+
+        inode = (st.st_dev, st.st_ino)
+        original = self._by_inode.get(inode)
+        if original is not None:
+            self.duplicates += 1
+            return original
+        self._by_inode[inode] = path
+
+        size = st.st_size
+        same_size = self._unhashed.get(size)
+        if same_size is None:
+            # First file of this size: no need to read it (yet)
+            self._unhashed[size] = [path]
+            return None
+
+        # Hash the originals of this size that were deferred so far
+        for earlier in same_size:
+            fingerprint = content_fingerprint(earlier, self.full_hash)
+            if fingerprint is not None:
+                self._by_fingerprint.setdefault(fingerprint, earlier)
+        same_size.clear()
+
+        fingerprint = content_fingerprint(path, self.full_hash)
+        if fingerprint is None:
+            return None
+        original = self._by_fingerprint.setdefault(fingerprint, path)
+        if original == path:
+            return None
+        self.duplicates += 1
+        return original
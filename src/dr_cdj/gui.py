@@ -1,10 +1,13 @@
 """Modern GUI for Dr.CDJ — Audio Compatibility Checker & Converter."""
 
+import queue
 import sys
+import threading
+import time
 import tkinter as tk
 from pathlib import Path
 from tkinter import filedialog, messagebox
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 from dataclasses import dataclass
 
 try:
@@ -15,10 +18,25 @@ except ImportError:
     print("Install with: pip install customtkinter tkinterdnd2")
     sys.exit(1)
 
-from dr_cdj.analyzer import AudioAnalyzer, AudioMetadata
-from dr_cdj.compatibility import CompatibilityEngine, CompatibilityResult, CompatibilityStatus, ConversionPlan
 from dr_cdj.config import COLORS, CDJ_PROFILES, get_profile_color
-from dr_cdj.converter import AudioConverter, ConversionResult
+
+# The analysis/conversion stack is imported by the methods that first use
+# it, and loaded by _load_backend once the first frame is drawn (see
+# dr_cdj.startup): these imports only serve the type annotations.
+if TYPE_CHECKING:
+    from dr_cdj.cancellation import CancellationToken
+    from dr_cdj.compatibility import CompatibilityEngine, CompatibilityResult
+    from dr_cdj.events import BatchFinished, EventBus
+    from dr_cdj.journal import InterruptedBatch
+
+# Interval (ms) between two drains of the background analysis queue
+_ANALYSIS_POLL_MS = 50
+
+# Interval (ms) between two drains of the conversion event bus (~30 fps)
+_CONVERSION_FRAME_MS = 33
+
+# Max results moved from the analysis queue to the UI per drain
+_ANALYSIS_DRAIN_BATCH = 200
 
 # Shared style for all convert action buttons
 _CONVERT_BTN_COLORS = {
@@ -60,7 +78,7 @@ class ModernTooltip:
         self._hide()
     
     def _show(self):
-        if self.tooltip_window:
+        if self.tooltip_window or not self.text:
             return
         
         x = self.widget.winfo_rootx() + 20
@@ -90,12 +108,16 @@ class ModernTooltip:
 
 
 class FileCard(ctk.CTkFrame):
-    """Modern card for displaying an audio file."""
+    """Modern card for displaying an audio file.
+
+    Widgets are built once; ``set_result`` reconfigures them in place so a
+    card can be recycled for another track by VirtualFileList.
+    """
 
     def __init__(
         self,
         master,
-        result: CompatibilityResult,
+        result: "CompatibilityResult",
         on_remove: Optional[callable] = None,
         on_convert_single: Optional[callable] = None,
         **kwargs,
@@ -103,12 +125,10 @@ class FileCard(ctk.CTkFrame):
         super().__init__(master, **kwargs)
         
         self.result = result
+        self._shown: Optional[CompatibilityResult] = None  # Result the widgets show
         self.on_remove = on_remove
         self.on_convert_single = on_convert_single
         
-        # Style based on status
-        self._setup_appearance()
-        
         # Main layout
         self.grid_columnconfigure(0, weight=1)
         self.grid_columnconfigure(1, weight=0)
@@ -129,8 +149,33 @@ class FileCard(ctk.CTkFrame):
         
         # Actions (single convert)
         self._setup_actions()
+
+        self.set_result(result)
+
+    def set_result(self, result: "CompatibilityResult"):
+        """Bind the card to a result, reconfiguring only what changed.
+
+        After a profile switch most tracks keep their status, so usually
+        only the message and profile labels are touched.
+        """
+        previous = self._shown
+        self.result = self._shown = result
+        same_track = (
+            previous is not None
+            and previous.filepath == result.filepath
+            and previous.metadata is result.metadata
+        )
+        same_status = same_track and previous.status == result.status
+        if not same_status:
+            self._update_appearance()
+            self._update_status_icon()
+            self._update_actions()
+        if not (same_status and previous.message == result.message):
+            self._update_file_info()
+        if not (same_track and previous.profile_name == result.profile_name):
+            self._update_tech_specs()
     
-    def _setup_appearance(self):
+    def _update_appearance(self):
         """Configure appearance based on status."""
         border_color = self.result.status_color
         bg_color = self.result.status_bg_color
@@ -144,22 +189,11 @@ class FileCard(ctk.CTkFrame):
     
     def _setup_status_icon(self):
         """Create status icon."""
-        status_colors = {
-            CompatibilityStatus.COMPATIBLE: (COLORS["compatible"], "✓"),
-            CompatibilityStatus.CONVERTIBLE_LOSSLESS: (COLORS["convertible_lossless"], "⇄"),
-            CompatibilityStatus.CONVERTIBLE_LOSSY: (COLORS["convertible_lossy"], "⚠"),
-            CompatibilityStatus.INCOMPATIBLE: (COLORS["incompatible"], "✕"),
-            CompatibilityStatus.ERROR: (COLORS["error"], "!"),
-        }
-        
-        color, icon = status_colors.get(self.result.status, (COLORS["text_secondary"], "?"))
-        
         # Circle with icon
         self.icon_frame = ctk.CTkFrame(
             self.content,
             width=36,
             height=36,
-            fg_color=color,
             corner_radius=18,
         )
         self.icon_frame.grid(row=0, column=0, rowspan=2, padx=(0, 12))
@@ -167,97 +201,118 @@ class FileCard(ctk.CTkFrame):
         
         self.icon_label = ctk.CTkLabel(
             self.icon_frame,
-            text=icon,
+            text="",
             font=("SF Pro Display", 16, "bold"),
             text_color=COLORS["background"],
             width=36,
             height=36,
         )
         self.icon_label.place(relx=0.5, rely=0.5, anchor="center")
+
+    def _update_status_icon(self):
+        """Update status icon colour and glyph."""
+        from dr_cdj.compatibility import CompatibilityStatus
+
+        status_colors = {
+            CompatibilityStatus.COMPATIBLE: (COLORS["compatible"], "✓"),
+            CompatibilityStatus.CONVERTIBLE_LOSSLESS: (COLORS["convertible_lossless"], "⇄"),
+            CompatibilityStatus.CONVERTIBLE_LOSSY: (COLORS["convertible_lossy"], "⚠"),
+            CompatibilityStatus.INCOMPATIBLE: (COLORS["incompatible"], "✕"),
+            CompatibilityStatus.ERROR: (COLORS["error"], "!"),
+        }
+        
+        color, icon = status_colors.get(self.result.status, (COLORS["text_secondary"], "?"))
+        self.icon_frame.configure(fg_color=color)
+        self.icon_label.configure(text=icon)
     
     def _setup_file_info(self):
         """Configure file information."""
         # Filename
-        filename = self.result.metadata.filename if self.result.metadata else self.result.filepath.name
-        display_name = filename[:45] + "..." if len(filename) > 45 else filename
-        
         self.name_label = ctk.CTkLabel(
             self.content,
-            text=display_name,
+            text="",
             font=("SF Pro Display", 14, "bold"),
             text_color=COLORS["text"],
             anchor="w",
         )
         self.name_label.grid(row=0, column=1, sticky="w")
-        if len(filename) > 45:
-            ModernTooltip(self.name_label, filename)
+        self.name_tooltip = ModernTooltip(self.name_label, "")
 
         # Status message
-        status_text = self.result.message
-        if len(status_text) > 60:
-            status_text = status_text[:57] + "..."
-        
         self.status_label = ctk.CTkLabel(
             self.content,
-            text=status_text,
+            text="",
             font=("SF Pro Display", 12),
-            text_color=self.result.status_color,
             anchor="w",
         )
         self.status_label.grid(row=1, column=1, sticky="w", pady=(2, 0))
+
+    def _update_file_info(self):
+        """Update file name and status message."""
+        filename = self.result.metadata.filename if self.result.metadata else self.result.filepath.name
+        display_name = filename[:45] + "..." if len(filename) > 45 else filename
+        self.name_label.configure(text=display_name)
+        self.name_tooltip.text = filename if len(filename) > 45 else ""
+
+        status_text = self.result.message
+        if len(status_text) > 60:
+            status_text = status_text[:57] + "..."
+        self.status_label.configure(text=status_text, text_color=self.result.status_color)
     
     def _setup_tech_specs(self):
         """Configure technical specifications."""
         specs_frame = ctk.CTkFrame(self.content, fg_color="transparent")
         specs_frame.grid(row=0, column=2, rowspan=2, padx=(20, 0), sticky="e")
         
-        # Format
-        if self.result.metadata:
-            codec = self.result.metadata.codec_formatted
-            sr = self.result.metadata.sample_rate_formatted
-            bd = self.result.metadata.bit_depth_formatted
-            
-            specs_text = f"{codec}  •  {sr}  •  {bd}"
-        else:
-            specs_text = "N/A"
-        
         self.specs_label = ctk.CTkLabel(
             specs_frame,
-            text=specs_text,
+            text="",
             font=("SF Pro Mono", 11),
             text_color=COLORS["text_muted"],
         )
         self.specs_label.pack()
         
-        # Profile
-        profile_text = f"for {self.result.profile_name}"
         self.profile_label = ctk.CTkLabel(
             specs_frame,
-            text=profile_text,
+            text="",
             font=("SF Pro Display", 10),
             text_color=COLORS["text_muted"],
         )
         self.profile_label.pack()
+
+    def _update_tech_specs(self):
+        """Update format and profile labels."""
+        # Format
+        if self.result.metadata:
+            codec = self.result.metadata.codec_formatted
+            sr = self.result.metadata.sample_rate_formatted
+            bd = self.result.metadata.bit_depth_formatted
+            
+            specs_text = f"{codec}  •  {sr}  •  {bd}"
+        else:
+            specs_text = "N/A"
+        self.specs_label.configure(text=specs_text)
+        
+        # Profile
+        self.profile_label.configure(text=f"for {self.result.profile_name}")
     
     def _setup_actions(self):
         """Configure available actions."""
         actions_frame = ctk.CTkFrame(self, fg_color="transparent")
         actions_frame.grid(row=0, column=1, padx=(0, 12), pady=12, sticky="ne")
         
-        # Convert single button (only for convertible files)
-        if self.result.needs_conversion:
-            self.convert_btn = ctk.CTkButton(
-                actions_frame,
-                text="⇄",
-                font=("SF Pro Display", 14, "bold"),
-                width=32,
-                height=32,
-                **_CONVERT_BTN_COLORS,
-                corner_radius=8,
-                command=self._on_convert_click,
-            )
-            self.convert_btn.pack(pady=(0, 4))
-            ModernTooltip(self.convert_btn, "Convert this file")
+        # Convert single button (shown only for convertible files)
+        self.convert_btn = ctk.CTkButton(
+            actions_frame,
+            text="⇄",
+            font=("SF Pro Display", 14, "bold"),
+            width=32,
+            height=32,
+            **_CONVERT_BTN_COLORS,
+            corner_radius=8,
+            command=self._on_convert_click,
+        )
+        ModernTooltip(self.convert_btn, "Convert this file")
         
         # Remove button
         self.remove_btn = ctk.CTkButton(
@@ -274,6 +329,14 @@ class FileCard(ctk.CTkFrame):
         )
         self.remove_btn.pack()
         ModernTooltip(self.remove_btn, "Remove from list")
+
+    def _update_actions(self):
+        """Show the convert button only for convertible files."""
+        if self.result.needs_conversion:
+            if not self.convert_btn.winfo_manager():
+                self.convert_btn.pack(pady=(0, 4), before=self.remove_btn)
+        else:
+            self.convert_btn.pack_forget()
     
     def _on_convert_click(self):
         """Callback for single file conversion."""
@@ -286,6 +349,155 @@ class FileCard(ctk.CTkFrame):
             self.on_remove(self.result)
 
 
+class VirtualFileList(ctk.CTkFrame):
+    """Scrollable file list that only materializes the rows in view.
+
+    A small pool of FileCard widgets is positioned over the visible window
+    and rebound to other results while scrolling, so the widget count stays
+    constant whatever the number of tracks. Rows are only reconfigured when
+    the result shown at their position actually changed.
+    """
+
+    ROW_HEIGHT = 92
+    ROW_GAP = 8
+
+    def __init__(
+        self,
+        master,
+        on_remove: Optional[callable] = None,
+        on_convert_single: Optional[callable] = None,
+        **kwargs,
+    ):
+        """Create an empty list.
+
+        Args:
+            master: Parent widget.
+            on_remove: Called with the result of a removed row.
+            on_convert_single: Called with the result of a row to convert.
+            **kwargs: CTkFrame options.
+        """
+        super().__init__(master, **kwargs)
+
+        self.on_remove = on_remove
+        self.on_convert_single = on_convert_single
+        self._results: list[CompatibilityResult] = []
+        self._rows: list[FileCard] = []
+        self._offset = 0.0  # Scroll position (unscaled px)
+
+        self.grid_columnconfigure(0, weight=1)
+        self.grid_rowconfigure(0, weight=1)
+
+        # Plain Tk frame: rows are placed on it and it supports bind_all
+        self._viewport = tk.Frame(self, bg=COLORS["background"], highlightthickness=0, bd=0)
+        self._viewport.grid(row=0, column=0, sticky="nsew")
+
+        self._scrollbar = ctk.CTkScrollbar(
+            self,
+            command=self._on_scrollbar,
+            button_color=COLORS["surface_light"],
+            button_hover_color=COLORS["surface_hover"],
+        )
+        self._scrollbar.grid(row=0, column=1, sticky="ns", padx=(4, 0))
+
+        # Empty label
+        self.empty_label = ctk.CTkLabel(
+            self._viewport,
+            text="No files loaded",
+            font=("SF Pro Display", 14),
+            text_color=COLORS["text_muted"],
+        )
+
+        self._viewport.bind("<Configure>", lambda e: self._layout())
+        self._viewport.bind_all("<MouseWheel>", self._on_mouse_wheel, add="+")
+        self._viewport.bind_all("<Button-4>", self._on_mouse_wheel, add="+")
+        self._viewport.bind_all("<Button-5>", self._on_mouse_wheel, add="+")
+
+        self._layout()
+
+    @property
+    def _pitch(self) -> int:
+        return self.ROW_HEIGHT + self.ROW_GAP
+
+    def set_results(self, results: list["CompatibilityResult"]):
+        """Show a new list of results, rebinding only rows whose result changed."""
+        self._results = results
+        self._layout()
+
+    def _view_height(self) -> float:
+        """Visible height in unscaled px."""
+        return max(self._viewport.winfo_height() / self._get_widget_scaling(), 1.0)
+
+    def _layout(self):
+        """Place pooled rows over the visible slice of results."""
+        view_height = self._view_height()
+        content_height = len(self._results) * self._pitch
+        self._offset = min(max(self._offset, 0.0), max(content_height - view_height, 0.0))
+
+        if not self._results:
+            for row in self._rows:
+                row.place_forget()
+            self.empty_label.place(relx=0.5, y=60, anchor="n")
+            self._scrollbar.set(0.0, 1.0)
+            return
+        self.empty_label.place_forget()
+
+        first = int(self._offset // self._pitch)
+        last = min(first + int(view_height // self._pitch) + 2, len(self._results))
+
+        # Grow the pool only up to the number of rows that fit on screen
+        while len(self._rows) < last - first:
+            row = FileCard(
+                self._viewport,
+                result=self._results[first + len(self._rows)],
+                on_remove=self.on_remove,
+                on_convert_single=self.on_convert_single,
+                height=self.ROW_HEIGHT,
+            )
+            row.grid_propagate(False)
+            self._rows.append(row)
+
+        for i, row in enumerate(self._rows):
+            index = first + i
+            if index < last:
+                result = self._results[index]
+                if row.result is not result:
+                    row.set_result(result)
+                row.place(x=0, y=index * self._pitch - self._offset, relwidth=1.0)
+            else:
+                row.place_forget()
+
+        self._scrollbar.set(
+            self._offset / content_height,
+            min((self._offset + view_height) / content_height, 1.0),
+        )
+
+    def _scroll_to(self, offset: float):
+        self._offset = offset
+        self._layout()
+
+    def _on_scrollbar(self, action: str, value, unit: Optional[str] = None):
+        """Handle Tk scrollbar protocol ('moveto', fraction) / ('scroll', n, unit)."""
+        if action == "moveto":
+            self._scroll_to(float(value) * len(self._results) * self._pitch)
+        elif action == "scroll":
+            step = self._view_height() if unit == "pages" else self._pitch / 2
+            self._scroll_to(self._offset + int(value) * step)
+
+    def _on_mouse_wheel(self, event):
+        """Scroll when the wheel is used over the list."""
+        if not str(event.widget).startswith(str(self._viewport)):
+            return
+        if event.num == 4:
+            delta = -self._pitch / 2
+        elif event.num == 5:
+            delta = self._pitch / 2
+        elif sys.platform == "darwin":
+            delta = -event.delta * 4
+        else:
+            delta = -event.delta / 120 * self._pitch / 2
+        self._scroll_to(self._offset + delta)
+
+
 class ProfileInfoPanel(ctk.CTkFrame):
     """CDJ profile info panel."""
 
@@ -609,6 +821,23 @@ class ConversionSettingsPanel(ctk.CTkFrame):
         self.update_quality_info(profile_id)
         self.on_change()
     
+    def set_settings(
+        self, output_format: str, sample_rate: int, bit_depth: int, output_dir: Optional[Path]
+    ):
+        """Set all conversion settings (e.g. restored from an interrupted batch)."""
+        self.settings.output_format = output_format
+        self.format_var.set(output_format)
+        self.settings.sample_rate = sample_rate
+        self.sr_var.set(str(sample_rate))
+        self.settings.bit_depth = bit_depth
+        self.bd_var.set(str(bit_depth))
+        self.settings.output_dir = output_dir
+        if output_dir:
+            dir_path = str(output_dir)
+            display_path = ("…" + dir_path[-25:]) if len(dir_path) > 25 else dir_path
+            self.dir_label.configure(text=display_path)
+        self.on_change()
+
     def _on_format_change(self):
         self.settings.output_format = self.format_var.get()
         self.on_change()
@@ -783,35 +1012,77 @@ class DrCDJApp:
         self.root.minsize(1100, 800)
         self.root.configure(bg=COLORS["background"])
         
-        # Initialize engine
-        try:
-            self.analyzer = AudioAnalyzer()
-            self.compatibility = CompatibilityEngine()
-            self.converter = AudioConverter(max_workers=2)
-        except RuntimeError as e:
-            messagebox.showerror(
-                "FFmpeg Not Found",
-                f"{e}\n\nInstall FFmpeg to continue:\n"
-                "macOS: brew install ffmpeg\n"
-                "Ubuntu: sudo apt-get install ffmpeg\n"
-                "Windows: https://ffmpeg.org/download.html"
-            )
-            sys.exit(1)
+        # Engines are created by _load_backend, after the first frame
+        self.analyzer = None
+        self.compatibility = None
+        self.converter = None
+        self.journal = None
         
         # State
         self.results: list[CompatibilityResult] = []
-        self.file_items: list[FileCard] = []
         self.is_converting = False
         self.conversion_settings = ConversionSettings()
         self._pulse_job: Optional[str] = None
         self._pulse_state: bool = False
         self._progress_frame_visible: bool = False
+        self._resume_pending = False
+        self._conversion_cancel: Optional[CancellationToken] = None
+        self._conversion_bus: Optional[EventBus] = None
+        self._conversion_state: dict = {}
+        
+        # Background analysis
+        self._analysis_queue: queue.Queue = queue.Queue()
+        self._analysis_cancels: set[threading.Event] = set()
+        self._analysis_poll_job: Optional[str] = None
+        self._analysis_count = 0
+        self._analysis_started = 0.0
         
         self._setup_ui()
         
         # Set max quality for default profile
         self._apply_max_quality()
+        
+        # Load the analysis/conversion stack once the first frame is drawn:
+        # idle callbacks run after the pending redraws, the timer after them
+        self.root.after_idle(lambda: self.root.after(0, self._load_backend))
+
+        # Offer to finish a batch interrupted in a previous session
+        self.root.after(500, self._offer_resume)
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
     
+    def _load_backend(self):
+        """Import and create the analyzer, engine, converter and journal (once).
+
+        Called after the first frame, and by every action that needs them in
+        case it comes first. Exits with an error dialog if FFmpeg is missing.
+        """
+        if self.analyzer is not None:
+            return
+        from dr_cdj.analyzer import AudioAnalyzer
+        from dr_cdj.cache import MetadataCache
+        from dr_cdj.compatibility import CompatibilityEngine
+        from dr_cdj.converter import AudioConverter
+        from dr_cdj.journal import ConversionJournal
+
+        try:
+            analyzer = AudioAnalyzer(cache=MetadataCache())
+            self.compatibility = CompatibilityEngine(self.profile_selector.get_selected_id())
+            self.converter = AudioConverter(max_workers=2, adaptive=True)
+            self.journal = ConversionJournal()
+        except RuntimeError as e:
+            messagebox.showerror(
+                "FFmpeg Not Found",
+                f"{e}\n\nInstall FFmpeg to continue:\n"
+                "macOS: brew install ffmpeg\n"
+                "Ubuntu: sudo apt-get install ffmpeg\n"
+                "Windows: https://ffmpeg.org/download.html"
+            )
+            sys.exit(1)
+        self.analyzer = analyzer
+
+        # Drop cache rows of deleted or changed files without blocking the UI
+        threading.Thread(target=analyzer.cache.prune, daemon=True).start()
+
     def _setup_ui(self):
         """Configure modern user interface."""
         # Main container with generous padding
@@ -928,6 +1199,20 @@ class DrCDJApp:
             text_color=COLORS["text_muted"],
         )
         self.drop_sublabel.place(relx=0.5, rely=0.80, anchor="center")
+
+        # Cancel button (visible only while analyzing)
+        self.analysis_cancel_btn = ctk.CTkButton(
+            self.drop_frame,
+            text="Cancel",
+            font=("SF Pro Display", 12, "bold"),
+            fg_color=COLORS["surface_light"],
+            hover_color=COLORS["incompatible"],
+            text_color=COLORS["text"],
+            width=90,
+            height=28,
+            corner_radius=8,
+            command=self._on_cancel_analysis,
+        )
         
         # Bind drag-and-drop
         self.drop_frame.drop_target_register(DND_FILES)
@@ -999,22 +1284,15 @@ class DrCDJApp:
         )
         self.count_badge.pack(side="left", padx=(8, 0))
         
-        # Scrollable frame for cards
-        self.list_frame = ctk.CTkScrollableFrame(
+        # Virtualized list: only visible cards exist as widgets
+        self.file_list = VirtualFileList(
             self.list_container,
+            on_remove=self._on_remove_file,
+            on_convert_single=self._on_convert_single,
             fg_color="transparent",
             corner_radius=0,
         )
-        self.list_frame.grid(row=1, column=0, sticky="nsew")
-        
-        # Empty label
-        self.empty_label = ctk.CTkLabel(
-            self.list_frame,
-            text="No files loaded",
-            font=("SF Pro Display", 14),
-            text_color=COLORS["text_muted"],
-        )
-        self.empty_label.pack(pady=60)
+        self.file_list.grid(row=1, column=0, sticky="nsew")
     
     def _setup_action_bar(self):
         """Configure modern action bar."""
@@ -1086,10 +1364,23 @@ class DrCDJApp:
         )
         self.progress.set(0)
         self.progress.pack(side="left")
+        self.cancel_conversion_btn = ctk.CTkButton(
+            self.progress_frame,
+            text="Cancel",
+            font=("SF Pro Display", 12),
+            fg_color=COLORS["surface_light"],
+            hover_color=COLORS["incompatible"],
+            text_color=COLORS["text"],
+            width=70,
+            height=26,
+            corner_radius=8,
+            command=self._on_cancel_conversion,
+        )
+        self.cancel_conversion_btn.pack(side="left", padx=(12, 0))
     
     def _apply_max_quality(self):
         """Apply max quality for current profile."""
-        profile_id = self.compatibility.profile_id
+        profile_id = self.profile_selector.get_selected_id()
         self.settings_panel.set_max_quality(profile_id)
         self.profile_info.update_info(profile_id)
 
@@ -1107,6 +1398,12 @@ class DrCDJApp:
         self.progress_label.configure(text="")
         self.info_label.place(relx=0.02, rely=0.5, anchor="w")
 
+    def _on_cancel_conversion(self):
+        """Stop the running batch: ffmpeg jobs are killed, queued files skipped."""
+        if self._conversion_cancel is not None:
+            self._conversion_cancel.cancel()
+            self.progress_label.configure(text="Cancelling…")
+
     def _restore_info_label(self):
         """Reset info label colour after showing conversion result."""
         self.info_label.configure(text_color=COLORS["text_secondary"])
@@ -1114,6 +1411,8 @@ class DrCDJApp:
 
     def _update_info_label(self):
         """Rebuild action-bar summary with colour-coded dot indicators."""
+        from dr_cdj.compatibility import CompatibilityStatus
+
         to_convert = sum(1 for r in self.results if r.needs_conversion)
         compatible = sum(1 for r in self.results if r.is_compatible)
         errors = sum(1 for r in self.results if r.status == CompatibilityStatus.ERROR)
@@ -1146,6 +1445,7 @@ class DrCDJApp:
     
     def _on_profile_change(self, profile_id: str):
         """Profile change callback."""
+        self._load_backend()
         self.compatibility.set_profile(profile_id)
         
         # Update profile info
@@ -1155,22 +1455,13 @@ class DrCDJApp:
         self.settings_panel.set_max_quality(profile_id)
         self.settings_panel.flash_update()
 
-        # Re-analyze existing files with new profile
+        # Re-check loaded files from their stored metadata: verdicts are
+        # memoized, and only visible rows whose content changed are touched
         if self.results:
-            new_results = []
-            for result in self.results:
-                try:
-                    metadata = result.metadata
-                    if metadata:
-                        new_result = self.compatibility.check(metadata)
-                        new_results.append(new_result)
-                    else:
-                        new_results.append(result)
-                except Exception:
-                    new_results.append(result)
-            
-            self.results = new_results
-            self._update_file_list()
+            self.results, changed = self.compatibility.recheck(self.results)
+            self.file_list.set_results(self.results)
+            if changed:
+                self._refresh_list_summary()
     
     # ── Drop zone pulse animation ──────────────────────────────────────────
 
@@ -1239,19 +1530,11 @@ class DrCDJApp:
         else:
             paths = data.split()
         
-        file_paths = []
-        for path in paths:
-            path = Path(path.strip())
-            if path.is_file():
-                file_paths.append(path)
-            elif path.is_dir():
-                # Add all audio files in folder
-                for ext in [".mp3", ".m4a", ".wav", ".aiff", ".aif", ".flac", ".ogg", ".opus", ".wma"]:
-                    file_paths.extend(path.glob(f"*{ext}"))
-                    file_paths.extend(path.glob(f"*{ext.upper()}"))
-        
-        if file_paths:
-            self._analyze_files(file_paths)
+        paths = [Path(path.strip()) for path in paths if path.strip()]
+        if paths:
+            # Folders are walked recursively by the analysis thread, which
+            # starts analyzing the first files while the walk goes on
+            self._analyze_files(paths, discover_folders=True)
     
     def _on_select_files(self):
         """Callback for file selection."""
@@ -1269,76 +1552,184 @@ class DrCDJApp:
         if file_paths:
             self._analyze_files([Path(p) for p in file_paths])
     
-    def _analyze_files(self, file_paths: list[Path]):
-        """Analyze selected files."""
-        # Update UI
-        self.drop_label.configure(text="Analyzing...")
-        self.root.update()
-        
-        # Analyze
+    @property
+    def is_analyzing(self) -> bool:
+        """True while background analysis workers are running."""
+        return bool(self._analysis_cancels)
+
+    def _analyze_files(self, file_paths: list[Path], discover_folders: bool = False):
+        """Analyze selected files on a background thread.
+
+        Results are pushed to a queue and drained by ``root.after`` so the
+        Tk main loop keeps running and cards appear as files complete.
+
+        Args:
+            file_paths: Files to analyze.
+            discover_folders: ``file_paths`` may contain folders, walked
+                recursively for audio files on the background thread.
+        """
+        self._load_backend()
+        from dr_cdj.discovery import discover
+
+        if not self.is_analyzing:
+            self._analysis_count = 0
+            self._analysis_started = time.perf_counter()
+            self.drop_sublabel.place_forget()
+            self.analysis_cancel_btn.place(relx=0.5, rely=0.80, anchor="center")
+
+        cancel = threading.Event()
+        self._analysis_cancels.add(cancel)
+        worker = threading.Thread(
+            target=self._analysis_worker,
+            args=(
+                discover(file_paths, cancel=cancel) if discover_folders else file_paths,
+                self.compatibility.profile_id,
+                cancel,
+                self._analysis_queue,
+            ),
+            name="dr-cdj-analysis",
+            daemon=True,
+        )
+        worker.start()
+
+        self._update_analysis_status()
+        if self._analysis_poll_job is None:
+            self._analysis_poll_job = self.root.after(_ANALYSIS_POLL_MS, self._poll_analysis)
+
+    def _analysis_worker(
+        self,
+        file_paths,
+        profile_id: str,
+        cancel: threading.Event,
+        results: queue.Queue,
+    ):
+        """Background thread: analyze files and queue CompatibilityResults.
+
+        Uses its own CompatibilityEngine so profile switches on the Tk thread
+        never race with the check; stale verdicts are re-checked on drain.
+        """
+        from dr_cdj.compatibility import CompatibilityEngine
+
+        engine = CompatibilityEngine(profile_id)
+        # Copies of the same track (e.g. in several crates) are probed once
+        analysis = self.analyzer.iter_analyze(file_paths, dedupe=True)
+        try:
+            for _, path, metadata, error in analysis:
+                if cancel.is_set():
+                    break
+                if metadata is not None:
+                    result = engine.check(metadata)
+                else:
+                    result = self._make_error_result(path, error or "Analysis error", engine)
+                results.put((cancel, result))
+        except Exception as e:
+            results.put((cancel, e))
+        finally:
+            analysis.close()
+            results.put((cancel, None))  # Worker finished
+
+    def _make_error_result(
+        self, path: Path, message: str, engine: Optional["CompatibilityEngine"] = None
+    ) -> "CompatibilityResult":
+        """Build an ERROR result for a file that could not be analyzed."""
+        from dr_cdj.analyzer import AudioMetadata
+        from dr_cdj.compatibility import CompatibilityResult, CompatibilityStatus
+
+        engine = engine or self.compatibility
+        metadata = AudioMetadata(
+            filepath=path,
+            filename=path.name,
+            format_name="UNKNOWN",
+            codec="ERROR",
+            sample_rate=None,
+            bit_depth=None,
+            channels=0,
+            bitrate=None,
+            duration=None,
+            is_lossy=False,
+            is_float=False,
+        )
+        return CompatibilityResult(
+            filepath=path,
+            metadata=metadata,
+            status=CompatibilityStatus.ERROR,
+            message=message[:60],
+            profile_id=engine.profile_id,
+            profile_name=engine.profile.name,
+        )
+
+    def _poll_analysis(self):
+        """Drain the analysis queue into the file list (runs on the Tk thread)."""
+        from dr_cdj.compatibility import CompatibilityStatus
+
+        self._analysis_poll_job = None
         new_results = []
-        for path in file_paths:
+
+        for _ in range(_ANALYSIS_DRAIN_BATCH):
             try:
-                metadata = self.analyzer.analyze(path)
-                result = self.compatibility.check(metadata)
-                new_results.append(result)
-            except Exception as e:
-                # Create error result
-                metadata = AudioMetadata(
-                    filepath=path,
-                    filename=path.name,
-                    format_name="UNKNOWN",
-                    codec="ERROR",
-                    sample_rate=None,
-                    bit_depth=None,
-                    channels=0,
-                    bitrate=None,
-                    duration=None,
-                    is_lossy=False,
-                    is_float=False,
-                )
-                from dr_cdj.compatibility import CompatibilityStatus
-                result = CompatibilityResult(
-                    filepath=path,
-                    metadata=metadata,
-                    status=CompatibilityStatus.ERROR,
-                    message=str(e)[:60],
-                    profile_id=self.compatibility.profile_id,
-                    profile_name=self.compatibility.profile.name,
-                )
-                new_results.append(result)
-        
-        # Add to existing results
-        self.results.extend(new_results)
-        self._update_file_list()
-        
-        # Reset drop zone
+                cancel, item = self._analysis_queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is None:
+                self._analysis_cancels.discard(cancel)
+            elif cancel.is_set():
+                continue
+            elif isinstance(item, Exception):
+                messagebox.showerror("Analysis Error", f"❌ {item}")
+            else:
+                if (
+                    item.profile_id != self.compatibility.profile_id
+                    and item.metadata
+                    and item.status != CompatibilityStatus.ERROR
+                ):
+                    # Profile changed while this file was being analyzed
+                    item = self.compatibility.check(item.metadata)
+                new_results.append(item)
+
+        if new_results:
+            self._analysis_count += len(new_results)
+            self.results.extend(new_results)
+            self._update_file_list()
+
+        if self.is_analyzing or not self._analysis_queue.empty():
+            self._update_analysis_status()
+            self._analysis_poll_job = self.root.after(_ANALYSIS_POLL_MS, self._poll_analysis)
+        else:
+            self._finish_analysis()
+
+    def _update_analysis_status(self):
+        """Show live count and rate in the drop zone."""
+        if all(cancel.is_set() for cancel in self._analysis_cancels):
+            self.drop_label.configure(text="Cancelling…")
+            return
+        elapsed = time.perf_counter() - self._analysis_started
+        rate = self._analysis_count / elapsed if elapsed > 0 else 0.0
+        self.drop_label.configure(
+            text=f"Analyzing… {self._analysis_count} files  ·  {rate:.0f} files/s"
+        )
+
+    def _finish_analysis(self):
+        """Restore the drop zone once all workers are done."""
+        self.analysis_cancel_btn.place_forget()
+        self.drop_sublabel.place(relx=0.5, rely=0.80, anchor="center")
         self.drop_label.configure(text="Drop audio files here")
-    
+        if self._resume_pending:
+            self._resume_pending = False
+            self._on_convert()
+
+    def _on_cancel_analysis(self):
+        """Stop background analysis; results already shown are kept."""
+        for cancel in self._analysis_cancels:
+            cancel.set()
+        self.drop_label.configure(text="Cancelling…")
+
     def _update_file_list(self):
-        """Update file list in UI."""
-        # Remove old cards
-        for item in self.file_items:
-            item.destroy()
-        self.file_items.clear()
-        
-        # Hide empty label if there are files
-        if self.results:
-            self.empty_label.pack_forget()
-        else:
-            self.empty_label.pack(pady=60)
-        
-        # Add new cards
-        for result in self.results:
-            card = FileCard(
-                self.list_frame,
-                result=result,
-                on_remove=lambda r=result: self._on_remove_file(r),
-                on_convert_single=lambda r=result: self._on_convert_single(r),
-            )
-            card.pack(fill="x", pady=(0, 8))
-            self.file_items.append(card)
-        
+        """Update file list in UI (only visible rows are touched)."""
+        self.file_list.set_results(self.results)
+        self._refresh_list_summary()
+
+    def _refresh_list_summary(self):
+        """Update counter, status summary and action buttons."""
         # Update counter
         count = len(self.results)
         self.count_badge.configure(text=str(count))
@@ -1354,14 +1745,16 @@ class DrCDJApp:
         else:
             self.convert_btn.configure(state="disabled", text="Convert")
     
-    def _on_remove_file(self, result: CompatibilityResult):
+    def _on_remove_file(self, result: "CompatibilityResult"):
         """Remove a file from the list."""
         if result in self.results:
             self.results.remove(result)
             self._update_file_list()
     
-    def _on_convert_single(self, result: CompatibilityResult):
+    def _on_convert_single(self, result: "CompatibilityResult"):
         """Convert a single file."""
+        from dr_cdj.compatibility import CompatibilityResult, ConversionPlan
+
         if not result.needs_conversion:
             return
         
@@ -1389,33 +1782,159 @@ class DrCDJApp:
         self.convert_btn.configure(state="disabled", text="Converting...")
         self.clear_btn.configure(state="disabled")
         
-        self.root.after(100, lambda: self._do_single_conversion(modified_result))
+        self._start_conversion([modified_result], batch=False)
+    
+    def _start_conversion(self, jobs: list["CompatibilityResult"], batch: bool = True):
+        """Run a conversion on a worker thread and start draining its events.
+
+        Args:
+            jobs: Results (with their conversion plans) to convert.
+            batch: Parallel batch with journal and progress frame; False
+                for the single-file conversion of a card.
+        """
+        from dr_cdj.cancellation import CancellationToken
+        from dr_cdj.events import ConversionWorker, EventBus
+
+        self._conversion_cancel = CancellationToken()
+        self._conversion_bus = EventBus()
+        self._conversion_state = {
+            "batch": batch,
+            "total": len(jobs),
+            "done": 0,
+            "fraction": 0.0,
+            "current": None,
+        }
+        batch_options = {"journal": self.journal, "dedupe": True} if batch else {}
+        ConversionWorker(
+            self.converter,
+            jobs,
+            self._conversion_bus,
+            output_dir=self.conversion_settings.output_dir,
+            cancel_token=self._conversion_cancel,
+            batch=batch,
+            **batch_options,
+        ).start()
+        self.root.after(_CONVERSION_FRAME_MS, self._poll_conversion)
     
-    def _do_single_conversion(self, result: CompatibilityResult):
-        """Execute single file conversion."""
-        output_dir = self.conversion_settings.output_dir
-        conv_result = self.converter.convert(result, output_dir=output_dir)
+    def _poll_conversion(self):
+        """Apply the conversion events of one frame (runs on the Tk thread).
+
+        Events are coalesced, so the widgets are updated once per frame no
+        matter how many progress events the workers sent.
+        """
+        from dr_cdj.events import (
+            BatchFinished,
+            JobFailed,
+            JobFinished,
+            JobProgress,
+            JobStarted,
+            coalesce,
+        )
+
+        state = self._conversion_state
+        finished: Optional[BatchFinished] = None
+        for event in coalesce(self._conversion_bus.drain()):
+            if isinstance(event, JobStarted):
+                state["current"] = event.source_path.name
+            elif isinstance(event, JobProgress):
+                if event.batch_fraction is not None:
+                    state["fraction"] = event.batch_fraction
+                elif not state["batch"]:
+                    state["fraction"] = event.fraction
+            elif isinstance(event, (JobFinished, JobFailed)):
+                state["done"] += 1
+            elif isinstance(event, BatchFinished):
+                finished = event
+        
+        if finished is not None:
+            if state["batch"]:
+                self._finish_conversion_batch(finished)
+            else:
+                self._finish_single_conversion(finished)
+            return
         
+        if state["batch"]:
+            fraction = max(state["fraction"], state["done"] / state["total"])
+            self.progress.set(fraction)
+            if not self._conversion_cancel.cancelled:
+                text = f"Converting {state['done']} / {state['total']}…"
+                if state["current"]:
+                    text += f"  {state['current']}"
+                self.progress_label.configure(text=text[:80])
+        self.root.after(_CONVERSION_FRAME_MS, self._poll_conversion)
+    
+    def _finish_single_conversion(self, event: "BatchFinished"):
+        """Report the outcome of a single-file conversion."""
         self.is_converting = False
+        self._conversion_cancel = None
         self.convert_btn.configure(state="normal", text="Convert")
         self.clear_btn.configure(state="normal")
         
-        if conv_result.success:
+        if event.error is not None or not event.results:
+            messagebox.showerror("Conversion Error", f"❌ {event.error or 'Conversion failed'}")
+            return
+        conv_result = event.results[0]
+        if conv_result.cached:
+            message = f"✅ Already converted, up to date:\n{conv_result.output_path}"
+            messagebox.showinfo("Conversion Complete", message)
+        elif conv_result.success:
             message = f"✅ Conversion complete!\n\nFile saved to:\n{conv_result.output_path}"
             messagebox.showinfo("Conversion Complete", message)
         else:
             messagebox.showerror("Conversion Error", f"❌ {conv_result.message}")
     
+    def _offer_resume(self):
+        """Ask whether to resume a batch left unfinished by a previous session."""
+        self._load_backend()
+        batch = self.journal.load_interrupted()
+        if batch is None:
+            return
+        
+        remaining = [job for job in batch.remaining if job.source_path.exists()]
+        started = time.strftime("%d %b %H:%M", time.localtime(batch.started_at))
+        resume = remaining and messagebox.askyesno(
+            "Resume Conversion",
+            f"The conversion started {started} was interrupted: "
+            f"{batch.finished} of {len(batch.jobs)} files were finished.\n\n"
+            f"Resume the remaining {len(remaining)}?",
+        )
+        if not resume:
+            self.journal.discard()
+            return
+        
+        self.journal.remove_partial_outputs(batch)
+        self._restore_batch_settings(batch)
+        self._resume_pending = True
+        self._analyze_files([job.source_path for job in remaining])
+    
+    def _restore_batch_settings(self, batch: "InterruptedBatch"):
+        """Bring back the profile and conversion settings of an interrupted batch."""
+        job = batch.remaining[0]
+        if job.profile_id in CDJ_PROFILES and job.profile_id != self.compatibility.profile_id:
+            self.profile_selector.set_profile(job.profile_id)
+            self._on_profile_change(job.profile_id)
+        plan = job.plan
+        self.settings_panel.set_settings(
+            output_format=plan.get("output_format", self.conversion_settings.output_format),
+            sample_rate=plan.get("target_sample_rate", self.conversion_settings.sample_rate),
+            bit_depth=plan.get("target_bit_depth", self.conversion_settings.bit_depth),
+            output_dir=batch.output_dir,
+        )
+    
     def _on_clear(self):
         """Clear all files."""
         if self.is_converting:
             return
         
+        if self.is_analyzing:
+            self._on_cancel_analysis()
         self.results.clear()
         self._update_file_list()
     
     def _on_convert(self):
         """Start batch conversion."""
+        from dr_cdj.compatibility import CompatibilityResult, ConversionPlan
+
         if self.is_converting:
             return
         
@@ -1430,18 +1949,6 @@ class DrCDJApp:
         # Show progress frame
         self._show_progress_frame()
         
-        # Execute conversion in background
-        self.root.after(100, lambda: self._do_conversion_batch(to_convert))
-    
-    def _do_conversion_batch(self, to_convert: list[CompatibilityResult]):
-        """Execute batch conversion."""
-        total = len(to_convert)
-        
-        def on_progress(done: int, total: int):
-            self.progress.set(done / total)
-            self.progress_label.configure(text=f"Converting {done} / {total}…")
-            self.root.update()
-        
         # Create custom conversion plans
         custom_results = []
         for result in to_convert:
@@ -1463,11 +1970,14 @@ class DrCDJApp:
             )
             custom_results.append(custom_result)
         
-        output_dir = self.conversion_settings.output_dir
-        results = self.converter.convert_batch(custom_results, output_dir=output_dir, progress_callback=on_progress)
-        
-        # Update final UI
+        # Convert on a worker thread; the Tk loop stays responsive
+        self._start_conversion(custom_results)
+    
+    def _finish_conversion_batch(self, event: "BatchFinished"):
+        """Restore the UI and show the summary of a finished batch."""
+        results = event.results
         self.is_converting = False
+        self._conversion_cancel = None
         
         to_convert_count = sum(1 for r in self.results if r.needs_conversion)
         self.convert_btn.configure(
@@ -1479,7 +1989,7 @@ class DrCDJApp:
 
         # Show inline result (auto-resets after 5 s)
         summary = self.converter.get_conversion_summary(results)
-        successful = summary["successful"]
+        successful = summary["successful"] - summary["cached"]
         failed = summary["failed"]
         if failed == 0:
             result_text = f"✓ {successful} converted successfully"
@@ -1487,9 +1997,24 @@ class DrCDJApp:
         else:
             result_text = f"✓ {successful} converted  ·  ✕ {failed} failed"
             result_color = COLORS["primary"]
+        if summary["cached"]:
+            result_text += f"  ·  {summary['cached']} already up to date"
+        if summary["cancelled"]:
+            result_text += f"  ·  {summary['cancelled']} cancelled"
+        if event.error is not None:
+            result_text = f"✕ Conversion stopped: {event.error}"
+            result_color = COLORS["primary"]
         self.info_label.configure(text=result_text, text_color=result_color)
         self.root.after(5000, self._restore_info_label)
     
+    def _on_close(self):
+        """Stop background analysis, save the metadata cache and quit."""
+        for cancel in self._analysis_cancels:
+            cancel.set()
+        if self.analyzer is not None:
+            self.analyzer.cache.close()
+        self.root.destroy()
+    
     def run(self):
         """Start the application."""
         self.root.mainloop()
@@ -0,0 +1,692 @@
+"""Native header parsers: read audio stream parameters without spawning ffprobe.
+
+Covers the containers in CDJ_PROFILES (WAV/RF64, AIFF/AIFC, FLAC, MP3 and
+MP4/M4A with AAC or ALAC). Only the first few kilobytes plus a handful of
+box/chunk headers are read. Anything unusual (compressed WAV, HE-AAC,
+missing totals, truncated headers...) returns None so the caller can fall
+back to ffprobe.
+"""
+
+import struct
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, Optional
+
+# Bytes scanned for the first MP3 frame after any ID3v2 tag
+_MP3_SYNC_SCAN = 64 * 1024
+
+# Guard against absurd chunk lists in damaged RIFF/AIFF files
+_MAX_CHUNKS = 512
+
+_WAVE_FORMAT_PCM = 0x0001
+_WAVE_FORMAT_IEEE_FLOAT = 0x0003
+_WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+
+_MP4_FORMAT_NAME = "mov,mp4,m4a,3gp,3g2,mj2"
+
+# Ogg, ASF/WMA, Matroska/WebM: always handled by ffprobe
+_NON_MP3_MAGIC = {b"OggS", b"\x30\x26\xb2\x75", b"\x1a\x45\xdf\xa3"}
+_MP3_SYNC_WORDS = {b"\xff\xfb", b"\xff\xfa", b"\xff\xf3", b"\xff\xf2", b"\xff\xe3", b"\xff\xe2"}
+
+
+@dataclass
+class StreamInfo:
+    """Audio stream parameters read from a container header.
+
+    Field names and values follow ffprobe conventions so that the result can
+    be fed to the same normalization as real ffprobe output.
+    """
+
+    format_name: str
+    codec_name: str
+    sample_rate: int
+    channels: int
+    sample_fmt: str
+    bits_per_sample: int = 0
+    bits_per_raw_sample: int = 0
+    duration: Optional[float] = None
+    bit_rate: Optional[int] = None
+    total_frames: Optional[int] = None
+    data_offset: Optional[int] = None
+    data_size: Optional[int] = None
+
+    @property
+    def bit_depth(self) -> Optional[int]:
+        """Return bits per sample, if the codec has one."""
+        return self.bits_per_sample or self.bits_per_raw_sample or None
+
+    @property
+    def is_float(self) -> bool:
+        """True for floating point PCM."""
+        return self.sample_fmt in ("flt", "dbl")
+
+    @property
+    def block_align(self) -> Optional[int]:
+        """Bytes per PCM frame (all channels), None for compressed codecs."""
+        if not self.codec_name.startswith("pcm_") or not self.bits_per_sample:
+            return None
+        return (self.bits_per_sample // 8) * self.channels
+
+    def to_ffprobe_dict(self) -> dict:
+        """Return the info shaped like ``ffprobe -show_format -show_streams -of json``."""
+        stream = {
+            "codec_type": "audio",
+            "codec_name": self.codec_name,
+            "sample_fmt": self.sample_fmt,
+            "sample_rate": str(self.sample_rate),
+            "channels": self.channels,
+            "bits_per_sample": self.bits_per_sample,
+        }
+        if self.bits_per_raw_sample:
+            stream["bits_per_raw_sample"] = str(self.bits_per_raw_sample)
+        if self.duration is not None:
+            stream["duration"] = f"{self.duration:.6f}"
+
+        fmt = {"format_name": self.format_name}
+        if self.duration is not None:
+            fmt["duration"] = f"{self.duration:.6f}"
+        if self.bit_rate:
+            # ffprobe reports PCM/MP3/AAC rates on the stream, FLAC only on the format
+            if self.codec_name == "flac":
+                fmt["bit_rate"] = str(self.bit_rate)
+            else:
+                stream["bit_rate"] = str(self.bit_rate)
+
+        return {"format": fmt, "streams": [stream]}
+
+
+def probe_header(filepath: Path) -> Optional[StreamInfo]:
+    """Read stream parameters from the file header.
+
+    Args:
+        filepath: Path to audio file.
+
+    Returns:
+        StreamInfo, or None if the format is not handled natively or the
+        header is malformed.
+    """
+    try:
+        with open(filepath, "rb") as f:
+            f.seek(0, 2)
+            file_size = f.tell()
+            f.seek(0)
+            head = f.read(12)
+            if len(head) < 12:
+                return None
+
+            if head[:4] in (b"RIFF", b"RF64") and head[8:12] == b"WAVE":
+                return _parse_wav(f, file_size, rf64=head[:4] == b"RF64")
+            if head[:4] == b"FORM" and head[8:12] in (b"AIFF", b"AIFC"):
+                return _parse_aiff(f, file_size, aifc=head[8:12] == b"AIFC")
+            if head[4:8] == b"ftyp":
+                return _parse_mp4(f, file_size)
+
+            if head[:4] in _NON_MP3_MAGIC:
+                return None
+
+            audio_start = _skip_id3v2(f)
+            f.seek(audio_start)
+            magic = f.read(4)
+            if magic == b"fLaC":
+                return _parse_flac(f, file_size)
+            # Only hunt for MPEG frames where an MP3 is plausible
+            is_mp3_suffix = Path(filepath).suffix.lower() == ".mp3"
+            if audio_start or magic[:2] in _MP3_SYNC_WORDS or is_mp3_suffix:
+                return _parse_mp3(f, file_size, audio_start)
+            return None
+    except (OSError, struct.error, ValueError, IndexError, ZeroDivisionError):
+        return None
+
+
+# ============================================================
+# RIFF / WAVE
+# ============================================================
+
+
+def _parse_wav(f: BinaryIO, file_size: int, rf64: bool) -> Optional[StreamInfo]:
+    """Parse RIFF/RF64 'fmt ' and 'data' chunks."""
+    fmt = None
+    data_offset = data_size = None
+    ds64_data_size = None
+
+    pos = 12
+    for _ in range(_MAX_CHUNKS):
+        if pos + 8 > file_size:
+            break
+        f.seek(pos)
+        chunk_id, chunk_size = struct.unpack("<4sI", f.read(8))
+        body = pos + 8
+
+        if chunk_id == b"ds64":
+            ds64_data_size = struct.unpack("<Q", f.read(16)[8:16])[0]
+        elif chunk_id == b"fmt ":
+            fmt = f.read(min(chunk_size, 40))
+        elif chunk_id == b"data":
+            data_offset = body
+            data_size = chunk_size
+            if rf64 and chunk_size == 0xFFFFFFFF and ds64_data_size is not None:
+                data_size = ds64_data_size
+            # Streamed/unfinished files carry a placeholder size
+            data_size = min(data_size, file_size - body)
+            if fmt is not None:
+                break
+        pos = body + chunk_size + (chunk_size & 1)
+
+    if fmt is None or len(fmt) < 16 or data_offset is None:
+        return None
+
+    format_tag, channels, sample_rate, _, _, bits = struct.unpack("<HHIIHH", fmt[:16])
+    if format_tag == _WAVE_FORMAT_EXTENSIBLE:
+        if len(fmt) < 26:
+            return None
+        format_tag = struct.unpack("<H", fmt[24:26])[0]
+
+    if format_tag == _WAVE_FORMAT_PCM:
+        codecs = {
+            8: ("pcm_u8", "u8"),
+            16: ("pcm_s16le", "s16"),
+            24: ("pcm_s24le", "s32"),
+            32: ("pcm_s32le", "s32"),
+        }
+    elif format_tag == _WAVE_FORMAT_IEEE_FLOAT:
+        codecs = {32: ("pcm_f32le", "flt"), 64: ("pcm_f64le", "dbl")}
+    else:
+        return None  # ADPCM, MP3-in-WAV, ...
+
+    if bits not in codecs or not channels or not sample_rate:
+        return None
+    codec_name, sample_fmt = codecs[bits]
+
+    block_align = bits // 8 * channels
+    total_frames = data_size // block_align
+    return StreamInfo(
+        format_name="wav",
+        codec_name=codec_name,
+        sample_rate=sample_rate,
+        channels=channels,
+        sample_fmt=sample_fmt,
+        bits_per_sample=bits,
+        duration=total_frames / sample_rate,
+        bit_rate=sample_rate * channels * bits,
+        total_frames=total_frames,
+        data_offset=data_offset,
+        data_size=data_size,
+    )
+
+
+# ============================================================
+# AIFF / AIFC
+# ============================================================
+
+
+def _extended_to_float(raw: bytes) -> float:
+    """Decode an 80-bit IEEE 754 extended float (AIFF sample rate)."""
+    exponent, mantissa = struct.unpack(">HQ", raw)
+    sign = -1 if exponent & 0x8000 else 1
+    exponent &= 0x7FFF
+    if exponent == 0 and mantissa == 0:
+        return 0.0
+    return sign * mantissa * 2.0 ** (exponent - 16383 - 63)
+
+
+def _parse_aiff(f: BinaryIO, file_size: int, aifc: bool) -> Optional[StreamInfo]:
+    """Parse AIFF/AIFC 'COMM' and 'SSND' chunks."""
+    comm = None
+    data_offset = data_size = None
+
+    pos = 12
+    for _ in range(_MAX_CHUNKS):
+        if pos + 8 > file_size:
+            break
+        f.seek(pos)
+        chunk_id, chunk_size = struct.unpack(">4sI", f.read(8))
+        body = pos + 8
+
+        if chunk_id == b"COMM":
+            comm = f.read(min(chunk_size, 64))
+        elif chunk_id == b"SSND":
+            offset = struct.unpack(">I", f.read(8)[:4])[0]
+            data_offset = body + 8 + offset
+            data_size = max(0, min(chunk_size - 8 - offset, file_size - data_offset))
+            if comm is not None:
+                break
+        pos = body + chunk_size + (chunk_size & 1)
+
+    if comm is None or len(comm) < 18 or data_offset is None:
+        return None
+
+    channels, total_frames, bits = struct.unpack(">hIh", comm[:8])
+    sample_rate = int(round(_extended_to_float(comm[8:18])))
+
+    compression = b"NONE"
+    if aifc:
+        if len(comm) < 22:
+            return None
+        compression = comm[18:22]
+
+    if compression in (b"NONE", b"twos"):
+        codecs = {
+            8: ("pcm_s8", "u8"),
+            16: ("pcm_s16be", "s16"),
+            24: ("pcm_s24be", "s32"),
+            32: ("pcm_s32be", "s32"),
+        }
+    elif compression == b"sowt":
+        codecs = {16: ("pcm_s16le", "s16"), 24: ("pcm_s24le", "s32"), 32: ("pcm_s32le", "s32")}
+    elif compression in (b"fl32", b"FL32"):
+        codecs = {32: ("pcm_f32be", "flt")}
+        bits = 32
+    elif compression in (b"fl64", b"FL64"):
+        codecs = {64: ("pcm_f64be", "dbl")}
+        bits = 64
+    else:
+        return None  # ima4, ulaw, alaw, ...
+
+    if bits not in codecs or channels <= 0 or sample_rate <= 0:
+        return None
+    codec_name, sample_fmt = codecs[bits]
+
+    return StreamInfo(
+        format_name="aiff",
+        codec_name=codec_name,
+        sample_rate=sample_rate,
+        channels=channels,
+        sample_fmt=sample_fmt,
+        bits_per_sample=bits,
+        duration=total_frames / sample_rate,
+        bit_rate=sample_rate * channels * bits,
+        total_frames=total_frames,
+        data_offset=data_offset,
+        data_size=data_size,
+    )
+
+
+# ============================================================
+# FLAC
+# ============================================================
+
+
+def _parse_flac(f: BinaryIO, file_size: int) -> Optional[StreamInfo]:
+    """Parse the FLAC STREAMINFO block (always the first metadata block)."""
+    block_header = f.read(4)
+    if len(block_header) < 4 or block_header[0] & 0x7F != 0:
+        return None
+    streaminfo = f.read(34)
+    if len(streaminfo) < 34:
+        return None
+
+    # 20 bits rate | 3 bits channels-1 | 5 bits bps-1 | 36 bits total samples
+    packed = int.from_bytes(streaminfo[10:18], "big")
+    sample_rate = packed >> 44
+    channels = ((packed >> 41) & 0x7) + 1
+    bits = ((packed >> 36) & 0x1F) + 1
+    total_frames = packed & 0xFFFFFFFFF
+
+    if not sample_rate or not total_frames:
+        return None  # unknown length: let ffprobe estimate it
+
+    duration = total_frames / sample_rate
+    return StreamInfo(
+        format_name="flac",
+        codec_name="flac",
+        sample_rate=sample_rate,
+        channels=channels,
+        sample_fmt="s16" if bits <= 16 else "s32",
+        bits_per_raw_sample=bits,
+        duration=duration,
+        bit_rate=int(file_size * 8 / duration),
+        total_frames=total_frames,
+    )
+
+
+# ============================================================
+# MP3
+# ============================================================
+
+_MP3_BITRATES = {
+    # (MPEG-1, Layer III) and (MPEG-2/2.5, Layer III), kbit/s
+    1: (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    2: (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+_MP3_SAMPLE_RATES = {
+    3: (44100, 48000, 32000),  # MPEG-1
+    2: (22050, 24000, 16000),  # MPEG-2
+    0: (11025, 12000, 8000),  # MPEG-2.5
+}
+
+
+def _skip_id3v2(f: BinaryIO) -> int:
+    """Return the offset just past a leading ID3v2 tag (0 if none)."""
+    f.seek(0)
+    header = f.read(10)
+    if len(header) < 10 or header[:3] != b"ID3":
+        return 0
+    size = 0
+    for byte in header[6:10]:
+        size = (size << 7) | (byte & 0x7F)
+    footer = 10 if header[5] & 0x10 else 0
+    return 10 + size + footer
+
+
+def _mp3_frame_header(word: int) -> Optional[tuple[int, int, int, int, int]]:
+    """Decode a Layer III frame header.
+
+    Returns:
+        (version_id, bitrate, sample_rate, channels, frame_length) or None.
+    """
+    if word >> 21 != 0x7FF:
+        return None
+    version_id = (word >> 19) & 0x3
+    layer = (word >> 17) & 0x3
+    bitrate_idx = (word >> 12) & 0xF
+    rate_idx = (word >> 10) & 0x3
+    padding = (word >> 9) & 0x1
+    channel_mode = (word >> 6) & 0x3
+
+    if version_id == 1 or layer != 1 or bitrate_idx in (0, 15) or rate_idx == 3:
+        return None
+
+    bitrate = _MP3_BITRATES[1 if version_id == 3 else 2][bitrate_idx] * 1000
+    sample_rate = _MP3_SAMPLE_RATES[version_id][rate_idx]
+    coefficient = 144 if version_id == 3 else 72
+    frame_length = coefficient * bitrate // sample_rate + padding
+    channels = 1 if channel_mode == 3 else 2
+    return version_id, bitrate, sample_rate, channels, frame_length
+
+
+def _parse_mp3(f: BinaryIO, file_size: int, audio_start: int) -> Optional[StreamInfo]:
+    """Parse the first MPEG Layer III frame and its Xing/Info/VBRI tag."""
+    f.seek(audio_start)
+    buf = f.read(_MP3_SYNC_SCAN)
+
+    frame_pos = header = None
+    i = -1
+    while True:
+        i = buf.find(b"\xff", i + 1, len(buf) - 4)
+        if i < 0:
+            break
+        if buf[i + 1] & 0xE0 != 0xE0:
+            continue
+        candidate = _mp3_frame_header(int.from_bytes(buf[i : i + 4], "big"))
+        if candidate is None:
+            continue
+        # Require the next frame to line up, to avoid false syncs in junk
+        nxt = i + candidate[4]
+        if nxt + 4 <= len(buf):
+            following = _mp3_frame_header(int.from_bytes(buf[nxt : nxt + 4], "big"))
+            if following is None or following[2] != candidate[2]:
+                continue
+        frame_pos, header = i, candidate
+        break
+
+    if header is None:
+        return None
+
+    version_id, bitrate, sample_rate, channels, _ = header
+    samples_per_frame = 1152 if version_id == 3 else 576
+    frame = buf[frame_pos : frame_pos + 200]
+
+    # Xing/Info sits after the side information
+    mono = channels == 1
+    side_info = (17 if mono else 32) if version_id == 3 else (9 if mono else 17)
+    xing = 4 + side_info
+
+    frames = stream_bytes = None
+    if frame[xing : xing + 4] in (b"Xing", b"Info"):
+        flags = struct.unpack(">I", frame[xing + 4 : xing + 8])[0]
+        off = xing + 8
+        if flags & 0x1:
+            frames = struct.unpack(">I", frame[off : off + 4])[0]
+            off += 4
+        if flags & 0x2:
+            stream_bytes = struct.unpack(">I", frame[off : off + 4])[0]
+    elif frame[36:40] == b"VBRI":
+        stream_bytes, frames = struct.unpack(">II", frame[46:54])
+
+    audio_bytes = file_size - audio_start - frame_pos
+    f.seek(max(file_size - 128, 0))
+    if f.read(3) == b"TAG":
+        audio_bytes -= 128
+
+    if frames:
+        duration = frames * samples_per_frame / sample_rate
+        if stream_bytes:
+            bitrate = int(stream_bytes * 8 / duration)
+        else:
+            bitrate = int(audio_bytes * 8 / duration)
+    else:
+        duration = audio_bytes * 8 / bitrate
+
+    return StreamInfo(
+        format_name="mp3",
+        codec_name="mp3",
+        sample_rate=sample_rate,
+        channels=channels,
+        sample_fmt="fltp",
+        duration=duration,
+        bit_rate=bitrate,
+    )
+
+
+# ============================================================
+# MP4 / M4A
+# ============================================================
+
+_MP4_CONTAINERS = {b"moov", b"trak", b"mdia", b"minf", b"stbl"}
+
+
+def _iter_boxes(f: BinaryIO, start: int, end: int):
+    """Yield (type, body_offset, body_size) for boxes in [start, end)."""
+    pos = start
+    for _ in range(_MAX_CHUNKS):
+        if pos + 8 > end:
+            return
+        f.seek(pos)
+        size, box_type = struct.unpack(">I4s", f.read(8))
+        header = 8
+        if size == 1:
+            size = struct.unpack(">Q", f.read(8))[0]
+            header = 16
+        elif size == 0:
+            size = end - pos
+        if size < header:
+            return
+        yield box_type, pos + header, size - header
+        pos += size
+
+
+def _find_sound_track(f: BinaryIO, start: int, end: int) -> Optional[dict]:
+    """Return hdlr/mdhd/stsd information for the first sound track in moov."""
+    for box_type, body, size in _iter_boxes(f, start, end):
+        if box_type != b"trak":
+            continue
+        track: dict = {}
+        _collect_track(f, body, body + size, track)
+        if track.get("handler") == b"soun" and "entry" in track:
+            return track
+    return None
+
+
+def _collect_track(f: BinaryIO, start: int, end: int, track: dict) -> None:
+    """Collect hdlr, mdhd and stsd information below a trak box."""
+    for box_type, body, size in _iter_boxes(f, start, end):
+        if box_type in _MP4_CONTAINERS:
+            _collect_track(f, body, body + size, track)
+        elif box_type == b"hdlr":
+            f.seek(body + 8)
+            track["handler"] = f.read(4)
+        elif box_type == b"mdhd":
+            f.seek(body)
+            version = f.read(4)[0]
+            if version == 1:
+                _, _, timescale, duration = struct.unpack(">QQIQ", f.read(28))
+            else:
+                _, _, timescale, duration = struct.unpack(">IIII", f.read(16))
+            track["timescale"] = timescale
+            track["duration"] = duration
+        elif box_type == b"stsd":
+            f.seek(body + 8)  # version/flags + entry count
+            entry_size, entry_type = struct.unpack(">I4s", f.read(8))
+            entry = f.read(min(entry_size - 8, 512))
+            track["entry"] = (entry_type, entry)
+        elif box_type == b"stsz":
+            f.seek(body + 4)
+            sample_size, count = struct.unpack(">II", f.read(8))
+            if sample_size:
+                track["stream_bytes"] = sample_size * count
+
+
+def _read_descriptor_length(data: bytes, pos: int) -> tuple[int, int]:
+    """Read an MPEG-4 descriptor length (up to 4 bytes of 7-bit groups)."""
+    length = 0
+    for _ in range(4):
+        byte = data[pos]
+        pos += 1
+        length = (length << 7) | (byte & 0x7F)
+        if not byte & 0x80:
+            break
+    return length, pos
+
+
+def _parse_esds(esds: bytes) -> Optional[tuple[int, int, int, int, int]]:
+    """Parse an esds box body.
+
+    Returns:
+        (object_type, audio_object_type, sample_rate, channels, avg_bitrate)
+        or None if the descriptors are not laid out as expected.
+    """
+    pos = 4  # version/flags
+    if esds[pos] != 0x03:
+        return None
+    _, pos = _read_descriptor_length(esds, pos + 1)
+    es_flags = esds[pos + 2]
+    pos += 3
+    if es_flags & 0x80:
+        pos += 2
+    if es_flags & 0x40:
+        pos += 1 + esds[pos]
+    if es_flags & 0x20:
+        pos += 2
+
+    if esds[pos] != 0x04:
+        return None
+    _, pos = _read_descriptor_length(esds, pos + 1)
+    object_type = esds[pos]
+    avg_bitrate = struct.unpack(">I", esds[pos + 9 : pos + 13])[0]
+    pos += 13
+
+    if esds[pos] != 0x05:
+        return object_type, 0, 0, 0, avg_bitrate
+    length, pos = _read_descriptor_length(esds, pos + 1)
+    asc = int.from_bytes(esds[pos : pos + max(length, 2)][:5].ljust(5, b"\0"), "big")
+
+    # AudioSpecificConfig: 5 bits object type, 4 bits freq index, [24 bits freq], 4 bits channels
+    audio_object_type = asc >> 35
+    freq_index = (asc >> 31) & 0xF
+    if freq_index == 0xF:
+        sample_rate = (asc >> 7) & 0xFFFFFF
+        channels = (asc >> 3) & 0xF
+    else:
+        rates = (
+            96000,
+            88200,
+            64000,
+            48000,
+            44100,
+            32000,
+            24000,
+            22050,
+            16000,
+            12000,
+            11025,
+            8000,
+            7350,
+        )
+        if freq_index >= len(rates):
+            return None
+        sample_rate = rates[freq_index]
+        channels = (asc >> 27) & 0xF
+    return object_type, audio_object_type, sample_rate, channels, avg_bitrate
+
+
+def _parse_mp4(f: BinaryIO, file_size: int) -> Optional[StreamInfo]:
+    """Parse the first sound track of an ISO-BMFF (MP4/M4A) file."""
+    track = None
+    mdat_size = 0
+    for box_type, body, size in _iter_boxes(f, 0, file_size):
+        if box_type == b"moov":
+            track = _find_sound_track(f, body, body + size)
+        elif box_type == b"mdat":
+            mdat_size += size
+    if not track or "entry" not in track or not track.get("timescale"):
+        return None
+
+    entry_type, entry = track["entry"]
+    # SampleEntry (8) + AudioSampleEntry v0 (20) before child boxes
+    sound_version = struct.unpack(">H", entry[8:10])[0]
+    channels, sample_size = struct.unpack(">HH", entry[16:20])
+    sample_rate = struct.unpack(">I", entry[24:28])[0] >> 16
+    children = {0: 28, 1: 44, 2: 64}.get(sound_version)
+    if children is None:
+        return None
+
+    boxes = {}
+    pos = children
+    while pos + 8 <= len(entry):
+        size, box_type = struct.unpack(">I4s", entry[pos : pos + 8])
+        if size < 8:
+            break
+        boxes[box_type] = entry[pos + 8 : pos + size]
+        pos += size
+
+    duration = track["duration"] / track["timescale"]
+    if duration <= 0:
+        return None
+
+    if entry_type == b"alac" and b"alac" in boxes:
+        config = boxes[b"alac"]
+        bits = config[9]
+        channels = config[13]
+        avg_bitrate, sample_rate = struct.unpack(">II", config[20:28])
+        # Sample sizes are variable; mdat is a better measure than the encoder's hint
+        bit_rate = int(mdat_size * 8 / duration) if mdat_size else avg_bitrate or None
+        stream = StreamInfo(
+            format_name=_MP4_FORMAT_NAME,
+            codec_name="alac",
+            sample_rate=sample_rate,
+            channels=channels,
+            sample_fmt="s16p" if bits <= 16 else "s32p",
+            bits_per_raw_sample=bits,
+            duration=duration,
+            bit_rate=bit_rate,
+        )
+    elif entry_type == b"mp4a" and b"esds" in boxes:
+        parsed = _parse_esds(boxes[b"esds"])
+        if parsed is None:
+            return None
+        object_type, audio_object_type, asc_rate, asc_channels, avg_bitrate = parsed
+        if object_type in (0x69, 0x6B):
+            codec_name = "mp3"
+        elif object_type == 0x40 and audio_object_type in (1, 2, 3, 4, 6):
+            codec_name = "aac"
+        else:
+            return None  # HE-AAC (SBR/PS) and others report a different output rate
+        stream = StreamInfo(
+            format_name=_MP4_FORMAT_NAME,
+            codec_name=codec_name,
+            sample_rate=asc_rate or sample_rate,
+            channels=asc_channels or channels,
+            sample_fmt="fltp",
+            duration=duration,
+            bit_rate=avg_bitrate or None,
+        )
+    else:
+        return None  # encrypted (enca/drms) or other codecs
+
+    if not stream.bit_rate:
+        stream_bytes = track.get("stream_bytes") or mdat_size
+        if stream_bytes:
+            stream.bit_rate = int(stream_bytes * 8 / duration)
+    if not stream.sample_rate or not stream.channels:
+        return None
+    return stream
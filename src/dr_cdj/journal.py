@@ -0,0 +1,261 @@
+"""ConversionJournal: Append-only record of batch conversions, for resuming."""
+
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional
+
+from dr_cdj.manifest import file_fingerprint
+from dr_cdj.staging import partial_paths
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_JOURNAL_PATH = Path.home() / ".dr_cdj" / "conversion_journal.jsonl"
+
+# Job states
+PENDING = "pending"
+RUNNING = "running"
+DONE = "done"
+CACHED = "cached"
+FAILED = "failed"
+CANCELLED = "cancelled"
+
+# States that need no more work on resume
+FINISHED_STATES = frozenset({DONE, CACHED})
+
+
+@dataclass
+class JournalJob:
+    """One job of a journaled batch, with its latest state."""
+
+    job_id: int
+    source_path: Path
+    profile_id: Optional[str]
+    plan: dict  # ConversionPlan fields
+    settings: list  # Normalized conversion settings (see ConversionManifest)
+    output_path: Optional[Path]
+    source: Optional[dict] = None  # Source fingerprint when the batch started
+    state: str = PENDING
+    message: str = ""
+
+
+@dataclass
+class InterruptedBatch:
+    """A batch whose journal has no end record (app quit, crash, sleep)."""
+
+    batch_id: str
+    started_at: float
+    output_dir: Optional[Path]
+    jobs: list[JournalJob] = field(default_factory=list)
+    stage_dir: Optional[Path] = None  # Local staging directory of the batch
+
+    @property
+    def remaining(self) -> list[JournalJob]:
+        """Jobs that were pending, running, failed or cancelled."""
+        return [job for job in self.jobs if job.state not in FINISHED_STATES]
+
+    @property
+    def finished(self) -> int:
+        """Number of jobs that completed."""
+        return len(self.jobs) - len(self.remaining)
+
+
+class ConversionJournal:
+    """JSON-lines journal of the current batch conversion.
+
+    ``start_batch`` truncates the file and writes one record listing every
+    job; each state transition (running → done/cached/failed) is then
+    appended as its own line and flushed, and ``end_batch`` appends a final
+    record. A journal without the end record is an interrupted batch that
+    ``load_interrupted`` can reconstruct; a torn last line is ignored.
+
+    Safe to use from several conversion threads.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        """Initialize journal.
+
+        Args:
+            path: Journal file. If None, uses ~/.dr_cdj/conversion_journal.jsonl.
+        """
+        self.path = Path(path) if path else DEFAULT_JOURNAL_PATH
+        self._lock = threading.Lock()
+        self._file = None
+        self.batch_id: Optional[str] = None
+
+    def _append(self, record: dict) -> None:
+        """Write one record and flush it (lock held)."""
+        if self._file is None:
+            return
+        try:
+            self._file.write(json.dumps(record) + "\n")
+            self._file.flush()
+        except OSError as e:
+            logger.warning(f"Could not write conversion journal {self.path}: {e}")
+
+    def start_batch(
+        self,
+        jobs: list[JournalJob],
+        output_dir: Optional[Path] = None,
+        stage_dir: Optional[Path] = None,
+    ) -> str:
+        """Start a new journal listing ``jobs`` (replaces any previous one).
+
+        Args:
+            jobs: Jobs of the batch, in submission order.
+            output_dir: Output directory of the batch (None = next to sources).
+            stage_dir: Local staging directory the outputs are written to
+                first, if any.
+
+        Returns:
+            The batch id.
+        """
+        self.close()
+        batch_id = uuid.uuid4().hex
+        record = {
+            "type": "batch",
+            "batch_id": batch_id,
+            "started_at": time.time(),
+            "output_dir": str(output_dir) if output_dir else None,
+            "stage_dir": str(stage_dir) if stage_dir else None,
+            "jobs": [
+                {
+                    "job_id": job.job_id,
+                    "source_path": str(job.source_path),
+                    "source": job.source or file_fingerprint(job.source_path),
+                    "profile_id": job.profile_id,
+                    "plan": job.plan,
+                    "settings": list(job.settings),
+                    "output_path": str(job.output_path) if job.output_path else None,
+                }
+                for job in jobs
+            ],
+        }
+        with self._lock:
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                # Stays open across mark() calls until end_batch()/close()
+                self._file = open(self.path, "w", encoding="utf-8")  # noqa: SIM115
+            except OSError as e:
+                logger.warning(f"Conversion journal disabled, cannot open {self.path}: {e}")
+                self._file = None
+            self.batch_id = batch_id
+            self._append(record)
+        return batch_id
+
+    def mark(self, job_id: int, state: str, message: str = "") -> None:
+        """Append a state transition for a job.
+
+        Args:
+            job_id: Job identifier from start_batch.
+            state: New state (RUNNING, DONE, CACHED, FAILED, CANCELLED).
+            message: Optional detail (e.g. the error).
+        """
+        record = {"type": "job", "job_id": job_id, "state": state, "at": time.time()}
+        if message:
+            record["message"] = message
+        with self._lock:
+            self._append(record)
+
+    def end_batch(self) -> None:
+        """Record that the batch ran to completion and close the file."""
+        with self._lock:
+            self._append({"type": "end", "batch_id": self.batch_id, "at": time.time()})
+        self.close()
+
+    def close(self) -> None:
+        """Close the journal file (the batch stays resumable)."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def discard(self) -> None:
+        """Forget the journaled batch."""
+        self.close()
+        self.path.unlink(missing_ok=True)
+
+    def load_interrupted(self) -> Optional[InterruptedBatch]:
+        """Return the batch left unfinished by a previous run, if any."""
+        try:
+            lines = self.path.read_text(encoding="utf-8").splitlines()
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            logger.warning(f"Ignoring unreadable conversion journal {self.path}: {e}")
+            return None
+
+        batch = None
+        jobs: dict[int, JournalJob] = {}
+        for line in lines:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                # Torn write from the interrupted run: stop at the first bad line
+                break
+            kind = record.get("type")
+            if kind == "batch":
+                output_dir = record.get("output_dir")
+                stage_dir = record.get("stage_dir")
+                batch = InterruptedBatch(
+                    batch_id=record["batch_id"],
+                    started_at=record.get("started_at", 0.0),
+                    output_dir=Path(output_dir) if output_dir else None,
+                    stage_dir=Path(stage_dir) if stage_dir else None,
+                )
+                jobs = {}
+                for entry in record.get("jobs", []):
+                    output_path = entry.get("output_path")
+                    jobs[entry["job_id"]] = JournalJob(
+                        job_id=entry["job_id"],
+                        source_path=Path(entry["source_path"]),
+                        profile_id=entry.get("profile_id"),
+                        plan=entry.get("plan") or {},
+                        settings=entry.get("settings") or [],
+                        output_path=Path(output_path) if output_path else None,
+                        source=entry.get("source"),
+                    )
+            elif kind == "job" and record.get("job_id") in jobs:
+                job = jobs[record["job_id"]]
+                job.state = record.get("state", job.state)
+                job.message = record.get("message", "")
+            elif kind == "end":
+                batch = None
+
+        if batch is None:
+            return None
+        batch.jobs = list(jobs.values())
+        return batch if batch.remaining else None
+
+    @staticmethod
+    def remove_partial_outputs(batch: InterruptedBatch) -> list[Path]:
+        """Delete temporary files left by jobs that were running or failed.
+
+        Only the hidden ``.dr_cdj-partial`` files are removed, next to the
+        outputs and in the batch's staging directory. Outputs are
+        renamed into place atomically (see dr_cdj.staging), so a file at
+        the final path is always complete. It may be the good output of an
+        earlier run, which a failed or interrupted job never replaced, and
+        it is never touched.
+
+        Returns:
+            The deleted paths.
+        """
+        removed = []
+        for job in batch.remaining:
+            output = job.output_path
+            if job.state == PENDING or output is None:
+                continue
+            for path in partial_paths(output, batch.stage_dir):
+                try:
+                    os.unlink(path)
+                    removed.append(path)
+                    logger.info(f"Removed partial output {path}")
+                except OSError as e:
+                    logger.warning(f"Could not remove partial output {path}: {e}")
+        return removed
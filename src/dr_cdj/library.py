@@ -0,0 +1,379 @@
+"""LibraryTable: compact columnar store of analysis results for large libraries.
+
+A list of CompatibilityResult costs roughly 650-750 bytes per track: two
+dict-backed dataclasses, a Path object and private copies of strings that
+are the same for thousands of tracks (folder, codec, file name parts).
+LibraryTable keeps one typed ``array`` per field instead (~180 bytes):
+
+* folders, codecs, formats, messages and conversion plans are stored once
+  in a pool and referenced by a small integer code;
+* numbers live unboxed in ``array`` columns (0 / NaN stand for "unknown");
+* the status is a one-byte enum code and the profile is stored per table.
+
+Rows are read through lightweight TrackRow views, which can rebuild the
+regular AudioMetadata / CompatibilityResult objects on demand. See
+``scripts/bench_library_memory.py`` for the bytes-per-track comparison.
+
+The table is a library API for now: the GUI and CLI still hold lists of
+CompatibilityResult.
+"""
+
+import math
+import sys
+from array import array
+from collections.abc import Hashable, Iterable, Iterator
+from pathlib import Path
+from typing import Optional
+
+from dr_cdj.analyzer import AudioMetadata
+from dr_cdj.compatibility import (
+    CompatibilityEngine,
+    CompatibilityResult,
+    CompatibilityStatus,
+    ConversionPlan,
+)
+
+# Status ↔ one-byte code (order is part of the in-memory format only)
+_STATUSES = tuple(CompatibilityStatus)
+_STATUS_CODES = {status: code for code, status in enumerate(_STATUSES)}
+
+# Bits of the flags column
+_LOSSY = 1
+_FLOAT = 2
+
+# Code meaning "no value" in pooled columns (e.g. no conversion plan)
+_NONE = 0
+
+
+class _Pool:
+    """Interning pool: value ↔ small integer code (code 0 is None)."""
+
+    __slots__ = ("values", "_codes")
+
+    def __init__(self):
+        """Initialize a pool holding only None."""
+        self.values: list = [None]
+        self._codes: dict = {None: _NONE}
+
+    def code(self, value: Optional[Hashable]) -> int:
+        """Return the code of ``value``, adding it to the pool if new."""
+        code = self._codes.get(value)
+        if code is None:
+            if isinstance(value, str):
+                value = sys.intern(value)
+            code = self._codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+
+class TrackRow:
+    """Read-only view of one row of a LibraryTable."""
+
+    __slots__ = ("_table", "index")
+
+    def __init__(self, table: "LibraryTable", index: int):
+        """Bind the view to row ``index`` of ``table``."""
+        self._table = table
+        self.index = index
+
+    @property
+    def filepath(self) -> Path:
+        """Path of the track (built on access)."""
+        return self._table.filepath(self.index)
+
+    @property
+    def filename(self) -> str:
+        """File name of the track."""
+        return self._table._names[self.index]
+
+    @property
+    def codec(self) -> str:
+        """Codec name as reported by the analyzer."""
+        return self._table._pool.values[self._table._codec[self.index]]
+
+    @property
+    def format_name(self) -> str:
+        """Container format name."""
+        return self._table._pool.values[self._table._format[self.index]]
+
+    @property
+    def sample_rate(self) -> Optional[int]:
+        """Sample rate in Hz, or None if unknown."""
+        return self._table._sample_rate[self.index] or None
+
+    @property
+    def bit_depth(self) -> Optional[int]:
+        """Bit depth, or None if unknown (lossy)."""
+        return self._table._bit_depth[self.index] or None
+
+    @property
+    def duration(self) -> Optional[float]:
+        """Duration in seconds, or None if unknown."""
+        value = self._table._duration[self.index]
+        return None if math.isnan(value) else value
+
+    @property
+    def status(self) -> CompatibilityStatus:
+        """Compatibility status."""
+        return _STATUSES[self._table._status[self.index]]
+
+    @property
+    def message(self) -> str:
+        """Verdict message."""
+        return self._table._pool.values[self._table._message[self.index]]
+
+    @property
+    def conversion_plan(self) -> Optional[ConversionPlan]:
+        """Shared conversion plan, or None."""
+        return self._table._pool.values[self._table._plan[self.index]]
+
+    @property
+    def needs_conversion(self) -> bool:
+        """True if the file needs conversion."""
+        return self.status in (
+            CompatibilityStatus.CONVERTIBLE_LOSSLESS,
+            CompatibilityStatus.CONVERTIBLE_LOSSY,
+        )
+
+    def metadata(self) -> AudioMetadata:
+        """Rebuild the AudioMetadata of this row."""
+        return self._table.metadata(self.index)
+
+    def result(self) -> CompatibilityResult:
+        """Rebuild the CompatibilityResult of this row."""
+        return self._table.result(self.index)
+
+    def __repr__(self) -> str:
+        """Return a short description of the row."""
+        return f"TrackRow({self.index}, {self.filename!r}, {self.status.value})"
+
+
+class LibraryTable:
+    """Columnar table of compatibility results for one profile.
+
+    Appending converts a CompatibilityResult into column values; the object
+    itself is not kept. Rows with the same plan share one (frozen)
+    ConversionPlan object.
+
+    Not thread-safe: fill it from one thread (e.g. the UI queue drain).
+    """
+
+    def __init__(self, profile_id: str, profile_name: str):
+        """Initialize an empty table.
+
+        Args:
+            profile_id: Profile the verdicts were computed for.
+            profile_name: Display name of that profile.
+        """
+        self.profile_id = profile_id
+        self.profile_name = profile_name
+        self._pool = _Pool()
+        self._folders = _Pool()
+        self._names: list[str] = []
+        self._folder = array("I")
+        self._codec = array("I")
+        self._format = array("I")
+        self._sample_rate = array("I")
+        self._bit_depth = array("B")
+        self._channels = array("B")
+        self._bitrate = array("I")
+        self._duration = array("d")
+        self._flags = array("B")
+        self._status = array("B")
+        self._message = array("I")
+        self._plan = array("I")
+
+    @classmethod
+    def from_results(cls, results: Iterable[CompatibilityResult]) -> "LibraryTable":
+        """Build a table from results of a single profile."""
+        table = None
+        for result in results:
+            if table is None:
+                table = cls(result.profile_id, result.profile_name)
+            table.append(result)
+        return table if table is not None else cls("", "")
+
+    def __len__(self) -> int:
+        """Return the number of rows."""
+        return len(self._names)
+
+    def __getitem__(self, index: int) -> TrackRow:
+        """Return a view of row ``index`` (negative indexes count from the end)."""
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("LibraryTable index out of range")
+        return TrackRow(self, index)
+
+    def __iter__(self) -> Iterator[TrackRow]:
+        """Iterate over row views in order."""
+        return (TrackRow(self, i) for i in range(len(self)))
+
+    @staticmethod
+    def _plan_key(plan: Optional[ConversionPlan]) -> Optional[tuple]:
+        if plan is None:
+            return None
+        return (plan.output_format, plan.target_sample_rate, plan.target_bit_depth, plan.reason)
+
+    def _plan_code(self, plan: Optional[ConversionPlan]) -> int:
+        key = self._plan_key(plan)
+        if key is None:
+            return _NONE
+        code = self._pool._codes.get(("plan",) + key)
+        if code is None:
+            # One shared ConversionPlan per distinct plan
+            code = self._pool.code(("plan",) + key)
+            self._pool.values[code] = ConversionPlan(*key)
+        return code
+
+    def append(self, result: CompatibilityResult) -> int:
+        """Add a result and return its row index.
+
+        Raises:
+            ValueError: If the result is for another profile.
+        """
+        if result.profile_id != self.profile_id:
+            raise ValueError(
+                f"Result for profile {result.profile_id!r} in a {self.profile_id!r} table"
+            )
+        metadata = result.metadata
+        path = Path(result.filepath)
+        self._folder.append(self._folders.code(str(path.parent)))
+        self._names.append(path.name)
+        self._codec.append(self._pool.code(metadata.codec))
+        self._format.append(self._pool.code(metadata.format_name))
+        self._sample_rate.append(metadata.sample_rate or 0)
+        self._bit_depth.append(min(metadata.bit_depth or 0, 255))
+        self._channels.append(min(metadata.channels or 0, 255))
+        self._bitrate.append(metadata.bitrate or 0)
+        self._duration.append(metadata.duration if metadata.duration is not None else math.nan)
+        self._flags.append(
+            (_LOSSY if metadata.is_lossy else 0) | (_FLOAT if metadata.is_float else 0)
+        )
+        self._status.append(_STATUS_CODES[result.status])
+        self._message.append(self._pool.code(result.message))
+        self._plan.append(self._plan_code(result.conversion_plan))
+        return len(self._names) - 1
+
+    def extend(self, results: Iterable[CompatibilityResult]) -> None:
+        """Add several results."""
+        for result in results:
+            self.append(result)
+
+    def set_verdict(self, index: int, result: CompatibilityResult) -> bool:
+        """Replace the verdict of a row (status, message, plan).
+
+        Args:
+            index: Row index.
+            result: New verdict for the same track, for the table's profile.
+
+        Returns:
+            True if the verdict changed.
+
+        Raises:
+            ValueError: If the result is for another profile (use recheck
+                to switch the whole table to another profile).
+        """
+        if result.profile_id != self.profile_id:
+            raise ValueError(
+                f"Result for profile {result.profile_id!r} in a {self.profile_id!r} table"
+            )
+        status = _STATUS_CODES[result.status]
+        message = self._pool.code(result.message)
+        plan = self._plan_code(result.conversion_plan)
+        changed = (
+            self._status[index] != status
+            or self._message[index] != message
+            or self._plan[index] != plan
+        )
+        self._status[index] = status
+        self._message[index] = message
+        self._plan[index] = plan
+        return changed
+
+    def recheck(self, engine: CompatibilityEngine) -> set[int]:
+        """Re-evaluate every row for the engine's profile and switch the table to it.
+
+        Rows sharing codec, extension, sample rate, bit depth and flags get
+        the same verdict, which is computed once per distinct combination.
+        Analysis errors keep their verdict.
+
+        Args:
+            engine: Engine set to the new profile.
+
+        Returns:
+            Indices of the rows whose status, message or plan changed.
+        """
+        error = _STATUS_CODES[CompatibilityStatus.ERROR]
+        verdicts: dict[tuple, tuple[int, int, int]] = {}
+        changed = set()
+        for index in range(len(self)):
+            if self._status[index] == error:
+                continue
+            key = (
+                self._codec[index],
+                Path(self._names[index]).suffix.lower(),
+                self._sample_rate[index],
+                self._bit_depth[index],
+                self._flags[index],
+            )
+            verdict = verdicts.get(key)
+            if verdict is None:
+                result = engine.check(self.metadata(index))
+                verdict = verdicts[key] = (
+                    _STATUS_CODES[result.status],
+                    self._pool.code(result.message),
+                    self._plan_code(result.conversion_plan),
+                )
+            status, message, plan = verdict
+            if (self._status[index], self._message[index], self._plan[index]) != verdict:
+                changed.add(index)
+                self._status[index] = status
+                self._message[index] = message
+                self._plan[index] = plan
+        self.profile_id = engine.profile_id
+        self.profile_name = engine.profile.name
+        return changed
+
+    def filepath(self, index: int) -> Path:
+        """Return the path of a row."""
+        return Path(self._folders.values[self._folder[index]], self._names[index])
+
+    def metadata(self, index: int) -> AudioMetadata:
+        """Rebuild the AudioMetadata of a row."""
+        values = self._pool.values
+        flags = self._flags[index]
+        duration = self._duration[index]
+        return AudioMetadata(
+            filepath=self.filepath(index),
+            filename=self._names[index],
+            format_name=values[self._format[index]],
+            codec=values[self._codec[index]],
+            sample_rate=self._sample_rate[index] or None,
+            bit_depth=self._bit_depth[index] or None,
+            channels=self._channels[index],
+            bitrate=self._bitrate[index] or None,
+            duration=None if math.isnan(duration) else duration,
+            is_lossy=bool(flags & _LOSSY),
+            is_float=bool(flags & _FLOAT),
+        )
+
+    def result(self, index: int) -> CompatibilityResult:
+        """Rebuild the CompatibilityResult of a row."""
+        metadata = self.metadata(index)
+        return CompatibilityResult(
+            filepath=metadata.filepath,
+            metadata=metadata,
+            status=_STATUSES[self._status[index]],
+            message=self._pool.values[self._message[index]],
+            profile_id=self.profile_id,
+            profile_name=self.profile_name,
+            conversion_plan=self._pool.values[self._plan[index]],
+        )
+
+    def status_counts(self) -> dict[CompatibilityStatus, int]:
+        """Return the number of rows per status."""
+        counts = [0] * len(_STATUSES)
+        for code in self._status:
+            counts[code] += 1
+        return {status: counts[code] for code, status in enumerate(_STATUSES) if counts[code]}
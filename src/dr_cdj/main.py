@@ -13,22 +13,32 @@ import logging
 import tempfile
 from pathlib import Path
 
+from dr_cdj.startup import StartupProfiler
+
 # =============================================================================
 # Setup Logging
 # =============================================================================
 log_dir = Path(tempfile.gettempdir()) / "Dr-CDJ-Logs"
-log_dir.mkdir(exist_ok=True)
 log_file = log_dir / "app.log"
 
-logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(log_file),
-    ]
-)
 logger = logging.getLogger(__name__)
 
+
+def setup_logging():
+    """Configure DEBUG logging to the application log file.
+
+    Called by main() rather than at import time, so importing this module
+    (e.g. for the CLI or in tests) has no side effects.
+    """
+    log_dir.mkdir(exist_ok=True)
+    logging.basicConfig(
+        level=logging.DEBUG,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.FileHandler(log_file),
+        ]
+    )
+
 # =============================================================================
 # Error Handling
 # =============================================================================
@@ -248,8 +258,26 @@ def show_ffmpeg_error():
 # =============================================================================
 # Main Entry Point
 # =============================================================================
+# First arguments that select the command-line interface instead of the GUI
+CLI_ARGS = ("scan", "convert", "-h", "--help")
+
+
 def main():
-    """Main entry point with comprehensive error handling."""
+    """Main entry point with comprehensive error handling.
+
+    With a subcommand (``dr-cdj scan ...`` / ``dr-cdj convert ...``) runs the
+    headless CLI instead of the GUI; GUI libraries are never imported then.
+    """
+    if len(sys.argv) > 1 and sys.argv[1] in CLI_ARGS:
+        from dr_cdj.cli import run
+
+        sys.exit(run(sys.argv[1:]))
+
+    # Opt-in phase timings (DR_CDJ_PROFILE_STARTUP=1 or a JSON report path)
+    profiler = StartupProfiler.from_environment(log_dir / "startup_profile.json")
+    with profiler.phase("logging"):
+        setup_logging()
+
     try:
         # Log startup info
         logger.info("="*50)
@@ -263,15 +291,18 @@ def main():
         
         # Setup FFmpeg (bundled → local, system, or download)
         logger.info("Setting up FFmpeg...")
-        if not setup_ffmpeg():
+        with profiler.phase("binary_resolution"):
+            ffmpeg_ready = setup_ffmpeg()
+        if not ffmpeg_ready:
             show_ffmpeg_error()
             sys.exit(1)
         
         # Import GUI dependencies
         logger.info("Loading GUI...")
         try:
-            import customtkinter as ctk
-            from tkinterdnd2 import TkinterDnD
+            with profiler.phase("gui_library_imports"):
+                import customtkinter as ctk
+                from tkinterdnd2 import TkinterDnD
         except ImportError as e:
             logger.error(f"Missing GUI dependency: {e}")
             show_error_dialog(
@@ -284,7 +315,8 @@ def main():
         
         # Import and start main application
         try:
-            from dr_cdj.gui import DrCDJApp
+            with profiler.phase("app_imports"):
+                from dr_cdj.gui import DrCDJApp
         except Exception as e:
             logger.exception("Error importing main GUI")
             show_error_dialog(
@@ -296,7 +328,11 @@ def main():
         # Run the application
         logger.info("Starting main application...")
         try:
-            app = DrCDJApp()
+            with profiler.phase("window_creation"):
+                app = DrCDJApp()
+            if profiler.enabled:
+                # Idle callbacks run after the pending redraws of the first frame
+                app.root.after_idle(lambda: (profiler.mark("first_paint"), profiler.report()))
             app.run()
         except Exception as e:
             logger.exception("Runtime error")
@@ -0,0 +1,145 @@
+"""ConversionManifest: Records finished conversions so unchanged jobs can be skipped."""
+
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = ".dr_cdj_manifest.json"
+
+# Bump when the ffmpeg arguments produced for the same settings change, so
+# outputs written by an older converter are redone instead of reused.
+SETTINGS_VERSION = 1
+
+# Manifest file format version
+_FORMAT_VERSION = 1
+
+
+def file_fingerprint(path: Path) -> Optional[dict]:
+    """Return size and modification time (ns) of a file, or None if missing."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return {"size": st.st_size, "mtime_ns": st.st_mtime_ns}
+
+
+class ConversionManifest:
+    """Sidecar JSON file listing the outputs of one output directory.
+
+    Each entry is keyed by output file name and stores the fingerprint of
+    the source it was made from, the normalized conversion settings and the
+    fingerprint of the output as written. A job is up to date when all three
+    still match, so touching the source, changing target settings or
+    editing/replacing the output all trigger a new conversion.
+
+    Safe to use from several conversion threads.
+    """
+
+    def __init__(self, output_dir: Path):
+        """Load the manifest of ``output_dir`` (missing or unreadable → empty).
+
+        Args:
+            output_dir: Directory containing converted files.
+        """
+        self.output_dir = Path(output_dir)
+        self.path = self.output_dir / MANIFEST_NAME
+        self._lock = threading.Lock()
+        self._entries: dict[str, dict] = {}
+        self._load()
+
+    def _load(self) -> None:
+        """Read entries from disk."""
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable conversion manifest {self.path}: {e}")
+            return
+
+        if isinstance(data, dict) and data.get("version") == _FORMAT_VERSION:
+            entries = data.get("entries")
+            if isinstance(entries, dict):
+                self._entries = entries
+
+    def _save(self) -> None:
+        """Write entries atomically (lock held)."""
+        tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        try:
+            tmp.write_text(
+                json.dumps({"version": _FORMAT_VERSION, "entries": self._entries}, indent=1),
+                encoding="utf-8",
+            )
+            os.replace(tmp, self.path)
+        except OSError as e:
+            logger.warning(f"Could not write conversion manifest {self.path}: {e}")
+            tmp.unlink(missing_ok=True)
+
+    @staticmethod
+    def _source_key(source_path: Path) -> Optional[dict]:
+        """Return the fingerprint stored for a source file."""
+        fingerprint = file_fingerprint(source_path)
+        if fingerprint is None:
+            return None
+        return {"path": str(Path(source_path).resolve()), **fingerprint}
+
+    def is_up_to_date(self, source_path: Path, output_path: Path, settings: tuple) -> bool:
+        """True if ``output_path`` was produced from the unchanged source with these settings.
+
+        Args:
+            source_path: Source audio file.
+            output_path: Expected converted file.
+            settings: Normalized conversion settings.
+
+        Returns:
+            True if the conversion can be skipped.
+        """
+        with self._lock:
+            entry = self._entries.get(Path(output_path).name)
+        if entry is None:
+            return False
+
+        return (
+            entry.get("settings") == [SETTINGS_VERSION, *settings]
+            and entry.get("source") == self._source_key(source_path)
+            and entry.get("output") == file_fingerprint(output_path)
+        )
+
+    def record(self, source_path: Path, output_path: Path, settings: tuple) -> None:
+        """Remember a successful conversion.
+
+        Args:
+            source_path: Source audio file.
+            output_path: Converted file, already written and verified.
+            settings: Normalized conversion settings.
+        """
+        source = self._source_key(source_path)
+        output = file_fingerprint(output_path)
+        if source is None or output is None:
+            return
+
+        with self._lock:
+            self._entries[Path(output_path).name] = {
+                "source": source,
+                "settings": [SETTINGS_VERSION, *settings],
+                "output": output,
+                "converted_at": time.time(),
+            }
+            self._save()
+
+    def forget(self, output_path: Path) -> None:
+        """Drop the entry for an output (e.g. before overwriting it)."""
+        with self._lock:
+            if self._entries.pop(Path(output_path).name, None) is not None:
+                self._save()
+
+    def __len__(self) -> int:
+        """Return number of recorded outputs."""
+        with self._lock:
+            return len(self._entries)
@@ -0,0 +1,332 @@
+"""In-process PCM engine: bit depth and endianness conversion without ffmpeg.
+
+Handles the WAV/AIFF → WAV/AIFF cases that need no resampling (e.g. 32-bit
+float WAV → 24-bit WAV, 24-bit WAV → AIFF, 16-bit AIFF → WAV). The source
+data chunk is memory-mapped and converted in chunks with vectorized NumPy
+code; precision is reduced with TPDF dither, widened exactly.
+
+NumPy is optional (``pip install dr-cdj[fast]``); without it
+:func:`can_convert` is always False and the converter uses ffmpeg.
+"""
+
+import importlib.util
+import logging
+import struct
+from collections.abc import Callable
+from pathlib import Path
+from typing import BinaryIO, Optional
+
+from dr_cdj.headers import StreamInfo, probe_header
+
+logger = logging.getLogger(__name__)
+
+# NumPy is only imported by the first conversion (see _load_numpy): importing
+# it costs more than the rest of the package and slows down every launch
+HAS_NUMPY = importlib.util.find_spec("numpy") is not None
+np = None
+
+# Frames converted per chunk (~1.5 MB of 24-bit stereo)
+CHUNK_FRAMES = 1 << 18
+
+# Source codecs the engine can read: codec name → (bits, big endian, float)
+_SOURCE_CODECS = {
+    "pcm_s16le": (16, False, False),
+    "pcm_s24le": (24, False, False),
+    "pcm_s32le": (32, False, False),
+    "pcm_f32le": (32, False, True),
+    "pcm_f64le": (64, False, True),
+    "pcm_s16be": (16, True, False),
+    "pcm_s24be": (24, True, False),
+    "pcm_s32be": (32, True, False),
+    "pcm_f32be": (32, True, True),
+    "pcm_f64be": (64, True, True),
+}
+
+# Metadata chunks copied verbatim to an output of the same container; only
+# ID3 blobs are portable between WAV ("id3 ") and AIFF ("ID3 ").
+_STRUCTURAL_CHUNKS = {b"fmt ", b"data", b"fact", b"COMM", b"SSND", b"FVER", b"PAD ", b"JUNK"}
+_ID3_CHUNKS = {b"id3 ", b"ID3 "}
+
+_KSDATAFORMAT_SUBTYPE_PCM = bytes.fromhex("0100000000001000800000aa00389b71")
+
+ProgressCallback = Callable[[float, float, int], None]
+
+
+def _load_numpy() -> None:
+    """Import NumPy into the module namespace on first use."""
+    global np
+    if np is None:
+        import numpy
+
+        np = numpy
+
+
+def can_convert(
+    source_path: Path, target_depth: int, output_format: str, needs_resample: bool
+) -> bool:
+    """True if the engine can produce this output (and keep the source tags).
+
+    Args:
+        source_path: Source audio file.
+        target_depth: Target bit depth.
+        output_format: Target container.
+        needs_resample: Whether the sample rate changes.
+    """
+    if not HAS_NUMPY or needs_resample:
+        return False
+    if output_format not in ("WAV", "AIFF") or target_depth not in (16, 24):
+        return False
+
+    info = probe_header(source_path)
+    if info is None or info.codec_name not in _SOURCE_CODECS or not info.data_size:
+        return False
+    if not info.channels or not info.sample_rate:
+        return False
+    if info.format_name not in ("wav", "aiff"):
+        return False
+
+    # Tags must survive: same container, or only portable ID3 chunks
+    same_container = (info.format_name == "wav") == (output_format == "WAV")
+    if not same_container:
+        return all(chunk_id in _ID3_CHUNKS for chunk_id, _ in _metadata_chunks(source_path))
+    return True
+
+
+def convert(
+    source_path: Path,
+    output_path: Path,
+    target_depth: int,
+    output_format: str,
+    progress_callback: Optional[ProgressCallback] = None,
+    seed: int = 0,
+) -> None:
+    """Convert a WAV/AIFF file to WAV/AIFF at ``target_depth`` without resampling.
+
+    Args:
+        source_path: Source WAV/AIFF file (checked with can_convert).
+        output_path: Destination file (overwritten).
+        target_depth: 16 or 24.
+        output_format: "WAV" or "AIFF".
+        progress_callback: Called as (fraction, seconds of audio written,
+            bytes written) after each chunk.
+        seed: Dither noise seed (fixed, so conversions are reproducible).
+
+    Raises:
+        RuntimeError: Unsupported source or missing NumPy.
+        OSError: I/O errors.
+    """
+    if not HAS_NUMPY:
+        raise RuntimeError("NumPy is not installed")
+    _load_numpy()
+
+    info = probe_header(source_path)
+    if info is None or info.codec_name not in _SOURCE_CODECS or not info.data_size:
+        raise RuntimeError(f"Unsupported source for the PCM engine: {source_path.name}")
+
+    bits, big_endian, is_float = _SOURCE_CODECS[info.codec_name]
+    source_width = bits // 8
+    frames = info.data_size // (source_width * info.channels)
+    target_width = target_depth // 8
+    data_size = frames * info.channels * target_width
+
+    metadata = _portable_metadata(source_path, info, output_format)
+    rng = np.random.default_rng(seed)
+    source = np.memmap(
+        source_path,
+        dtype=np.uint8,
+        mode="r",
+        offset=info.data_offset,
+        shape=(frames * info.channels * source_width,),
+    )
+
+    try:
+        with open(output_path, "wb") as out:
+            if output_format == "AIFF":
+                _write_aiff_header(
+                    out, info.channels, info.sample_rate, target_depth, frames, data_size, metadata
+                )
+            else:
+                _write_wav_header(
+                    out, info.channels, info.sample_rate, target_depth, data_size, metadata
+                )
+
+            chunk_bytes = CHUNK_FRAMES * info.channels * source_width
+            written_frames = 0
+            for start in range(0, len(source), chunk_bytes):
+                raw = np.asarray(source[start : start + chunk_bytes])
+                samples = _decode(raw, bits, big_endian, is_float)
+                encoded = _requantize(samples, bits, is_float, target_depth, rng)
+                out.write(_encode(encoded, target_depth, big_endian=output_format == "AIFF"))
+
+                written_frames += len(raw) // (source_width * info.channels)
+                if progress_callback:
+                    progress_callback(
+                        written_frames / frames if frames else 1.0,
+                        written_frames / info.sample_rate,
+                        out.tell(),
+                    )
+
+            if output_format == "AIFF" and data_size & 1:
+                out.write(b"\0")
+    except BaseException:
+        output_path.unlink(missing_ok=True)
+        raise
+    finally:
+        del source
+
+
+# =============================================================================
+# Sample conversion
+# =============================================================================
+def _decode(raw, bits: int, big_endian: bool, is_float: bool):
+    """Decode raw bytes to float64 (float sources) or left-justified int32."""
+    order = ">" if big_endian else "<"
+    if is_float:
+        return raw.view(f"{order}f{bits // 8}").astype(np.float64)
+    if bits == 24:
+        triplets = raw.reshape(-1, 3)
+        padded = np.zeros((len(triplets), 4), dtype=np.uint8)
+        if big_endian:
+            padded[:, :3] = triplets
+            return padded.view(">i4").ravel().astype(np.int32)
+        padded[:, 1:] = triplets
+        return padded.view("<i4").ravel()
+    samples = raw.view(f"{order}i{bits // 8}").astype(np.int32)
+    return samples << (32 - bits) if bits < 32 else samples
+
+
+def _requantize(samples, bits: int, is_float: bool, target_depth: int, rng):
+    """Convert decoded samples to ``target_depth`` integers (int32 array).
+
+    Widening an integer source is an exact shift. Narrowing (or converting
+    from float) adds TPDF dither of ±1 LSB at the target depth, then rounds
+    and clips.
+    """
+    if not is_float and bits <= target_depth:
+        return samples >> (32 - target_depth)
+
+    full_scale = float(1 << (target_depth - 1))
+    if is_float:
+        scaled = samples * full_scale
+    else:
+        scaled = samples.astype(np.float64) / float(1 << (32 - target_depth))
+    scaled += rng.random(len(scaled)) - rng.random(len(scaled))
+    np.rint(scaled, out=scaled)
+    np.clip(scaled, -full_scale, full_scale - 1, out=scaled)
+    return scaled.astype(np.int32)
+
+
+def _encode(samples, target_depth: int, big_endian: bool) -> bytes:
+    """Pack int32 samples holding ``target_depth``-bit values into bytes."""
+    if target_depth == 16:
+        return samples.astype(">i2" if big_endian else "<i2").tobytes()
+    if big_endian:
+        return samples.astype(">i4").view(np.uint8).reshape(-1, 4)[:, 1:].tobytes()
+    return samples.astype("<i4").view(np.uint8).reshape(-1, 4)[:, :3].tobytes()
+
+
+# =============================================================================
+# Containers
+# =============================================================================
+def _metadata_chunks(source_path: Path) -> list[tuple[bytes, bytes]]:
+    """Return (id, body) of the non-structural chunks of a RIFF/FORM file."""
+    chunks = []
+    with open(source_path, "rb") as f:
+        head = f.read(12)
+        if head[:4] in (b"RIFF", b"RF64"):
+            fmt = "<I"
+        elif head[:4] == b"FORM":
+            fmt = ">I"
+        else:
+            return chunks
+        while True:
+            header = f.read(8)
+            if len(header) < 8:
+                break
+            chunk_id, size = header[:4], struct.unpack(fmt, header[4:])[0]
+            if chunk_id in (b"data", b"SSND"):
+                # Audio payload: skip without reading it
+                f.seek(size + (size & 1), 1)
+                continue
+            body = f.read(size)
+            if size & 1:
+                f.read(1)
+            if chunk_id not in _STRUCTURAL_CHUNKS and chunk_id != b"ds64":
+                chunks.append((chunk_id, body))
+    return chunks
+
+
+def _portable_metadata(
+    source_path: Path, info: StreamInfo, output_format: str
+) -> list[tuple[bytes, bytes]]:
+    """Return metadata chunks to write into the output container."""
+    chunks = _metadata_chunks(source_path)
+    if (info.format_name == "wav") == (output_format == "WAV"):
+        return chunks
+    renamed = b"id3 " if output_format == "WAV" else b"ID3 "
+    return [(renamed, body) for chunk_id, body in chunks if chunk_id in _ID3_CHUNKS]
+
+
+def _chunk(chunk_id: bytes, body: bytes, big_endian: bool) -> bytes:
+    """Serialize one chunk with its pad byte."""
+    size = struct.pack(">I" if big_endian else "<I", len(body))
+    return chunk_id + size + body + (b"\0" if len(body) & 1 else b"")
+
+
+def _write_wav_header(
+    out: BinaryIO,
+    channels: int,
+    sample_rate: int,
+    depth: int,
+    data_size: int,
+    metadata: list[tuple[bytes, bytes]],
+) -> None:
+    """Write RIFF/WAVE header, metadata chunks and the data chunk header.
+
+    Uses WAVE_FORMAT_EXTENSIBLE in the same cases as ffmpeg (more than 16
+    bits, more than 2 channels or above 48 kHz).
+    """
+    block_align = channels * depth // 8
+    fmt = struct.pack(
+        "<HIIHH", channels, sample_rate, sample_rate * block_align, block_align, depth
+    )
+    if depth > 16 or channels > 2 or sample_rate > 48000:
+        mask = {1: 0x4, 2: 0x3}.get(channels, 0)
+        fmt = struct.pack("<H", 0xFFFE) + fmt
+        fmt += struct.pack("<HHI", 22, depth, mask) + _KSDATAFORMAT_SUBTYPE_PCM
+    else:
+        fmt = struct.pack("<H", 1) + fmt
+
+    body = _chunk(b"fmt ", fmt, False)
+    body += b"".join(_chunk(chunk_id, data, False) for chunk_id, data in metadata)
+    riff_size = 4 + len(body) + 8 + data_size + (data_size & 1)
+    if riff_size > 0xFFFFFFFF:
+        raise RuntimeError("Output too large for WAV")
+    out.write(b"RIFF" + struct.pack("<I", riff_size) + b"WAVE" + body)
+    out.write(b"data" + struct.pack("<I", data_size))
+
+
+def _write_aiff_header(
+    out: BinaryIO,
+    channels: int,
+    sample_rate: int,
+    depth: int,
+    frames: int,
+    data_size: int,
+    metadata: list[tuple[bytes, bytes]],
+) -> None:
+    """Write FORM/AIFF header, COMM, metadata chunks and the SSND chunk header."""
+    comm = struct.pack(">hIh", channels, frames, depth) + _int_to_extended(sample_rate)
+    body = _chunk(b"COMM", comm, True)
+    body += b"".join(_chunk(chunk_id, data, True) for chunk_id, data in metadata)
+    ssnd_size = 8 + data_size
+    form_size = 4 + len(body) + 8 + ssnd_size + (ssnd_size & 1)
+    out.write(b"FORM" + struct.pack(">I", form_size) + b"AIFF" + body)
+    out.write(b"SSND" + struct.pack(">III", ssnd_size, 0, 0))
+
+
+def _int_to_extended(value: int) -> bytes:
+    """Encode a positive integer as an 80-bit IEEE 754 extended float (AIFF rate)."""
+    exponent = value.bit_length() - 1
+    mantissa = value << (63 - exponent)
+    return struct.pack(">HQ", exponent + 16383, mantissa)
@@ -0,0 +1,87 @@
+"""Cost model and longest-first scheduling for conversion batches."""
+
+import heapq
+from collections.abc import Iterable, Sequence
+
+from dr_cdj.analyzer import AudioMetadata
+
+# Samples (sample rate × channels × seconds) ffmpeg pushes through per second
+# for a plain PCM rewrite on one core. Only scales the predictions; the
+# ordering does not depend on it. Factors below were measured the same way.
+BASE_SAMPLES_PER_SECOND = 140_000_000
+
+# Relative decode cost by source codec (PCM = 1.0)
+CODEC_COST = {
+    "FLAC": 2.5,
+    "ALAC": 2.5,
+    "MP3": 2.0,
+    "AAC": 2.0,
+    "VORBIS": 2.0,
+    "OPUS": 2.5,
+    "WMAV2": 2.0,
+    "WMAPRO": 2.5,
+}
+
+# Extra cost of the soxr (precision 28) resampler, relative to a PCM rewrite
+RESAMPLE_COST = 4.0
+
+# Extra cost of encoding FLAC output
+FLAC_ENCODE_COST = 0.8
+
+# Assumed duration (s) when the analyzer could not determine it
+UNKNOWN_DURATION = 300.0
+
+
+def estimate_cost(metadata: AudioMetadata, needs_resample: bool, output_format: str) -> float:
+    """Estimate the wall time (seconds) of one conversion on one core.
+
+    Args:
+        metadata: Source metadata.
+        needs_resample: Whether the sample rate changes.
+        output_format: Target container (WAV, AIFF, FLAC).
+
+    Returns:
+        Predicted seconds.
+    """
+    duration = metadata.duration or UNKNOWN_DURATION
+    channels = metadata.channels or 2
+    sample_rate = metadata.sample_rate or 44100
+
+    factor = CODEC_COST.get(metadata.codec.upper(), 1.0)
+    if needs_resample:
+        factor += RESAMPLE_COST
+    if output_format == "FLAC":
+        factor += FLAC_ENCODE_COST
+
+    return duration * channels * sample_rate * factor / BASE_SAMPLES_PER_SECOND
+
+
+def longest_first(items: Iterable, costs: Sequence[float]) -> list:
+    """Return items sorted by decreasing cost (stable for equal costs).
+
+    Greedy longest-processing-time-first keeps a long job from being
+    started last and running alone at the tail of the batch.
+    """
+    paired = list(zip(items, costs, strict=True))
+    paired.sort(key=lambda pair: pair[1], reverse=True)
+    return [item for item, _ in paired]
+
+
+def predict_makespan(costs: Iterable[float], workers: int) -> float:
+    """Predict batch wall time when ``costs`` are run in order on ``workers`` slots.
+
+    Simulates a pool that hands each job, in order, to the first worker
+    that becomes free.
+
+    Args:
+        costs: Per-job predicted seconds, in submission order.
+        workers: Number of parallel workers.
+
+    Returns:
+        Predicted seconds until the last job finishes.
+    """
+    finish_times = [0.0] * max(workers, 1)
+    for cost in costs:
+        start = heapq.heappop(finish_times)
+        heapq.heappush(finish_times, start + cost)
+    return max(finish_times)
@@ -0,0 +1,124 @@
+"""Atomic output writes: temporary names, optional local staging, rename into place."""
+
+import logging
+import os
+import uuid
+from pathlib import Path
+from typing import Optional
+
+from dr_cdj.config import STAGING_CHUNK_SIZE
+
+logger = logging.getLogger(__name__)
+
+# Marker in the names of outputs still being written
+PARTIAL_MARKER = ".dr_cdj-partial"
+
+
+def temp_path_for(output_path: Path, stage_dir: Optional[Path] = None) -> Path:
+    """Return a unique temporary path to write ``output_path`` to.
+
+    The name is hidden and keeps the extension, so ffmpeg still picks the
+    right muxer. Without ``stage_dir`` it lives next to the output, on the
+    same filesystem, so it can be renamed into place atomically.
+
+    Args:
+        output_path: Final output path.
+        stage_dir: Local staging directory, if outputs are staged.
+    """
+    directory = Path(stage_dir) if stage_dir else output_path.parent
+    directory.mkdir(parents=True, exist_ok=True)
+    token = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+    return directory / f".{output_path.stem}{PARTIAL_MARKER}-{token}{output_path.suffix}"
+
+
+def partial_paths(output_path: Path, stage_dir: Optional[Path] = None) -> list[Path]:
+    """Return leftover temporary files of ``output_path``.
+
+    Names are compared as plain strings, not glob patterns: track names
+    often contain ``[`` and ``]``.
+
+    Args:
+        output_path: Final output path; its directory is searched.
+        stage_dir: Local staging directory to search as well, if outputs
+            were staged.
+    """
+    prefix = f".{output_path.stem}{PARTIAL_MARKER}-"
+    directories = [output_path.parent]
+    if stage_dir:
+        directories.append(Path(stage_dir))
+    found = []
+    for directory in directories:
+        try:
+            with os.scandir(directory) as entries:
+                found.extend(
+                    Path(entry.path)
+                    for entry in entries
+                    if entry.name.startswith(prefix) and entry.name.endswith(output_path.suffix)
+                )
+        except OSError:
+            continue
+    return sorted(found)
+
+
+def _fsync_dir(directory: Path) -> None:
+    """Flush a directory entry to disk (no-op where directories cannot be opened)."""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _fsync_file(path: Path) -> None:
+    """Flush a written file to disk."""
+    with open(path, "rb+") as f:
+        os.fsync(f.fileno())
+
+
+def copy_chunked(source: Path, destination: Path, chunk_size: int = STAGING_CHUNK_SIZE) -> None:
+    """Copy a file with large sequential writes (gentle on USB sticks and SD cards)."""
+    with open(source, "rb") as src, open(destination, "wb") as dst:
+        while True:
+            chunk = src.read(chunk_size)
+            if not chunk:
+                break
+            dst.write(chunk)
+
+
+def commit(temp_path: Path, output_path: Path, fsync: bool = True) -> None:
+    """Move a verified temporary file to its final path.
+
+    A staged file (on another filesystem) is first copied next to the
+    output under a temporary name. The final step is always an atomic
+    rename, so ``output_path`` is either the previous file or the complete
+    new one, never a truncated write.
+
+    Args:
+        temp_path: Written and verified temporary file.
+        output_path: Final output path (replaced if it exists).
+        fsync: Flush data and directory entry to disk before returning.
+
+    Raises:
+        OSError: If the file cannot be moved (the temporary file is removed).
+    """
+    local_temp = temp_path
+    try:
+        if temp_path.parent.resolve() != output_path.parent.resolve():
+            local_temp = temp_path_for(output_path)
+            copy_chunked(temp_path, local_temp)
+        if fsync:
+            _fsync_file(local_temp)
+        os.replace(local_temp, output_path)
+        if fsync:
+            _fsync_dir(output_path.parent)
+    except OSError:
+        local_temp.unlink(missing_ok=True)
+        raise
+    finally:
+        if local_temp != temp_path:
+            temp_path.unlink(missing_ok=True)
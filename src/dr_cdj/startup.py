@@ -0,0 +1,130 @@
+"""Opt-in startup profiler: phase timings of an application launch.
+
+Enabled with the ``DR_CDJ_PROFILE_STARTUP`` environment variable (``1`` or
+the path of the JSON report to write). Phases are logged as they complete
+and the whole report is written as JSON once the first window is painted::
+
+    DR_CDJ_PROFILE_STARTUP=1 dr-cdj
+    DR_CDJ_PROFILE_STARTUP=~/startup.json dr-cdj
+
+When disabled, every method is a cheap no-op.
+"""
+
+import json
+import logging
+import os
+import sys
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+PROFILE_ENV_VAR = "DR_CDJ_PROFILE_STARTUP"
+
+
+class StartupProfiler:
+    """Record the duration of named startup phases.
+
+    Times are measured with ``time.perf_counter`` from the creation of the
+    profiler (as early as possible in ``main``).
+    """
+
+    def __init__(self, enabled: bool = False, report_path: Optional[Path] = None):
+        """Initialize the profiler.
+
+        Args:
+            enabled: Record phases (False: all methods do nothing).
+            report_path: Where report() writes the JSON file; if None the
+                report is only logged.
+        """
+        self.enabled = enabled
+        self.report_path = report_path
+        self._start = time.perf_counter()
+        self._last_mark = 0.0
+        self.phases: list[dict] = []
+        self._reported = False
+
+    @classmethod
+    def from_environment(cls, default_report_path: Optional[Path] = None) -> "StartupProfiler":
+        """Create a profiler configured by ``DR_CDJ_PROFILE_STARTUP``.
+
+        Args:
+            default_report_path: JSON path used when the variable is ``1``.
+        """
+        value = os.environ.get(PROFILE_ENV_VAR, "").strip()
+        if not value or value.lower() in ("0", "false", "no"):
+            return cls(enabled=False)
+        if value.lower() in ("1", "true", "yes"):
+            return cls(enabled=True, report_path=default_report_path)
+        return cls(enabled=True, report_path=Path(value).expanduser())
+
+    def elapsed(self) -> float:
+        """Seconds since the profiler was created."""
+        return time.perf_counter() - self._start
+
+    def _add(self, name: str, start: float, end: float) -> None:
+        self.phases.append(
+            {
+                "phase": name,
+                "start_ms": round(start * 1000, 2),
+                "duration_ms": round((end - start) * 1000, 2),
+            }
+        )
+        logger.info(f"Startup phase '{name}': {(end - start) * 1000:.1f} ms")
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time the enclosed block as phase ``name`` (recorded even if it raises)."""
+        if not self.enabled:
+            yield
+            return
+        start = self.elapsed()
+        try:
+            yield
+        finally:
+            end = self.elapsed()
+            self._last_mark = end
+            self._add(name, start, end)
+
+    def mark(self, name: str) -> None:
+        """Record phase ``name`` as the time since the previous phase ended."""
+        if not self.enabled:
+            return
+        now = self.elapsed()
+        self._add(name, self._last_mark, now)
+        self._last_mark = now
+
+    def to_dict(self) -> dict:
+        """Return the report (phases, total time and environment)."""
+        return {
+            "total_ms": round(self.elapsed() * 1000, 2),
+            "phases": list(self.phases),
+            "python": sys.version.split()[0],
+            "platform": sys.platform,
+            "frozen": bool(getattr(sys, "frozen", False)),
+            "modules_loaded": len(sys.modules),
+        }
+
+    def report(self) -> Optional[dict]:
+        """Log the report and write it as JSON (once).
+
+        Returns:
+            The report dict, or None if profiling is disabled or already
+            reported.
+        """
+        if not self.enabled or self._reported:
+            return None
+        self._reported = True
+        data = self.to_dict()
+        logger.info(f"Startup completed in {data['total_ms']:.1f} ms")
+        if self.report_path is not None:
+            try:
+                self.report_path.parent.mkdir(parents=True, exist_ok=True)
+                self.report_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+                logger.info(f"Startup profile written to {self.report_path}")
+            except OSError as e:
+                logger.warning(f"Could not write startup profile {self.report_path}: {e}")
+        return data
@@ -1,15 +1,186 @@
 """Utility functions for Dr. CDJ."""
 
+import json
+import logging
 import os
 import sys
 import shutil
 import subprocess
+import threading
+import time
 from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# Verified binaries, persisted across launches (see probe_binary)
+BINARY_CACHE_PATH = Path.home() / ".dr_cdj" / "binaries.json"
+
+# Bump when the recorded fields change: older entries are re-verified
+_BINARY_CACHE_VERSION = 1
+
+# In-process memo: (resolved path, size, mtime_ns) -> binary info
+_binary_memo: dict[tuple[str, int, int], dict] = {}
+# In-process memo of get_resource_path: (filename, env override) -> path
+_resource_memo: dict[tuple[str, Optional[str]], str] = {}
+_memo_lock = threading.Lock()
+
+
+def _binary_key(path: str) -> Optional[tuple[str, int, int]]:
+    """Return (resolved path, size, mtime_ns) of an executable file, or None."""
+    try:
+        resolved = Path(path).resolve(strict=True)
+        st = resolved.stat()
+    except (OSError, RuntimeError):
+        return None
+    if not resolved.is_file():
+        return None
+    return str(resolved), st.st_size, st.st_mtime_ns
+
+
+def _load_binary_cache() -> dict:
+    """Read the persisted binary cache (missing or unreadable → empty)."""
+    try:
+        data = json.loads(BINARY_CACHE_PATH.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != _BINARY_CACHE_VERSION:
+        return {}
+    binaries = data.get("binaries")
+    return binaries if isinstance(binaries, dict) else {}
+
+
+def _save_binary_info(info: dict) -> None:
+    """Add one verified binary to the persisted cache (atomic rewrite)."""
+    binaries = _load_binary_cache()
+    binaries[info["path"]] = info
+    tmp = BINARY_CACHE_PATH.with_name(f"{BINARY_CACHE_PATH.name}.{os.getpid()}.tmp")
+    try:
+        BINARY_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp.write_text(
+            json.dumps({"version": _BINARY_CACHE_VERSION, "binaries": binaries}, indent=1),
+            encoding="utf-8",
+        )
+        os.replace(tmp, BINARY_CACHE_PATH)
+    except OSError as e:
+        logger.debug(f"Could not write binary cache {BINARY_CACHE_PATH}: {e}")
+        tmp.unlink(missing_ok=True)
+
+
+def _parse_version_output(output: str) -> tuple[str, dict]:
+    """Extract version string and capability flags from ``-version`` output."""
+    first_line = output.splitlines()[0] if output else ""
+    parts = first_line.split()
+    version = parts[2] if len(parts) > 2 and parts[1] == "version" else ""
+    capabilities = {"soxr": "--enable-libsoxr" in output}
+    return version, capabilities
+
+
+def cached_binary_info(path: str) -> Optional[dict]:
+    """Return the recorded information of an already verified binary.
+
+    Looks in the in-process memo, then in the persisted cache. Never spawns
+    the binary. Entries are keyed by resolved path and only match while
+    size and modification time are unchanged, so an updated or replaced
+    binary is verified again.
+
+    Args:
+        path: Path to the binary.
+
+    Returns:
+        Recorded info dict, or None if the binary was not verified yet.
+    """
+    key = _binary_key(path)
+    if key is None:
+        return None
+
+    with _memo_lock:
+        info = _binary_memo.get(key)
+    if info is not None:
+        return info
+
+    resolved, size, mtime_ns = key
+    cached = _load_binary_cache().get(resolved)
+    if cached and cached.get("size") == size and cached.get("mtime_ns") == mtime_ns:
+        with _memo_lock:
+            _binary_memo[key] = cached
+        return cached
+    return None
+
+
+def record_binary(path: str, version_output: str) -> Optional[dict]:
+    """Remember a binary whose ``-version`` run succeeded.
+
+    Args:
+        path: Path to the binary.
+        version_output: Standard output of ``<binary> -version``.
+
+    Returns:
+        Info dict with path, size, mtime_ns, version and capabilities (e.g.
+        ``{"soxr": True}``), or None if ``path`` is not a file.
+    """
+    key = _binary_key(path)
+    if key is None:
+        return None
+
+    output = version_output if isinstance(version_output, str) else ""
+    version, capabilities = _parse_version_output(output)
+    resolved, size, mtime_ns = key
+    info = {
+        "path": resolved,
+        "size": size,
+        "mtime_ns": mtime_ns,
+        "version": version,
+        "capabilities": capabilities,
+        "verified_at": time.time(),
+    }
+    if version:
+        # Only remember real -version output (not a stub that merely exits 0)
+        with _memo_lock:
+            _binary_memo[key] = info
+        _save_binary_info(info)
+    return info
+
+
+def probe_binary(path: str) -> Optional[dict]:
+    """Return information about a working ffmpeg/ffprobe binary, or None.
+
+    ``-version`` is only run when the binary has not been verified before,
+    in this process or in a previous launch (``~/.dr_cdj/binaries.json``).
+
+    Args:
+        path: Path to the binary.
+
+    Returns:
+        Info dict (see record_binary), or None if the binary is missing or
+        broken.
+    """
+    info = cached_binary_info(path)
+    if info is not None:
+        return info
+    if _binary_key(path) is None:
+        return None
+
+    try:
+        result = subprocess.run([path, "-version"], capture_output=True, text=True, timeout=5)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    if result.returncode != 0:
+        return None
+    return record_binary(path, result.stdout)
+
+
+def binary_capabilities(path: str) -> dict:
+    """Return the capability flags recorded for a verified binary ({} if unknown)."""
+    info = cached_binary_info(path)
+    return info.get("capabilities", {}) if info else {}
 
 
 def verify_ffmpeg(path: str) -> bool:
     """Verify FFmpeg binary is working.
     
+    Results are cached per binary version (see probe_binary).
+    
     Args:
         path: Path to ffmpeg binary
         
@@ -18,16 +189,7 @@ def verify_ffmpeg(path: str) -> bool:
     """
     if not path or path in ("ffmpeg", "ffprobe"):
         return False
-    
-    try:
-        result = subprocess.run(
-            [path, "-version"],
-            capture_output=True,
-            timeout=5
-        )
-        return result.returncode == 0
-    except:
-        return False
+    return probe_binary(path) is not None
 
 
 def get_resource_path(filename: str) -> str:
@@ -42,11 +204,27 @@ def get_resource_path(filename: str) -> str:
     Args:
         filename: File name (e.g., "ffmpeg", "ffprobe")
         
+    The result is memoized for the process (binary checks themselves are
+    cached across launches, see probe_binary).
+    
     Returns:
         Full path to file or just filename if not found.
     """
-    # 1. Environment variables (highest priority)
     env_var = f"DR_CDJ_{filename.upper()}_PATH"
+    memo_key = (filename, os.environ.get(env_var))
+    with _memo_lock:
+        path = _resource_memo.get(memo_key)
+    if path is None:
+        path = _find_resource(filename, env_var)
+        if path != filename:
+            with _memo_lock:
+                _resource_memo[memo_key] = path
+    return path
+
+
+def _find_resource(filename: str, env_var: str) -> str:
+    """Search the locations listed in get_resource_path (uncached)."""
+    # 1. Environment variables (highest priority)
     if env_var in os.environ:
         path = Path(os.environ[env_var])
         if path.exists() and verify_ffmpeg(str(path)):
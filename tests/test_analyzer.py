@@ -1,5 +1,8 @@
 """Test per AudioAnalyzer."""
 
+import threading
+import time
+
 import pytest
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -106,6 +109,103 @@ class TestAudioAnalyzer:
         assert metadata.bit_depth == 32
 
 
+class TestAnalyzeBatch:
+    """Test per l'analisi batch parallela."""
+
+    @pytest.fixture
+    def analyzer(self):
+        """Analyzer con ffprobe simulato."""
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0)
+            return AudioAnalyzer()
+
+    @staticmethod
+    def _fake_analyze(filepath):
+        filepath = Path(filepath)
+        if "broken" in filepath.name:
+            raise RuntimeError("ffprobe: Invalid data found")
+        if "slow" in filepath.name:
+            raise RuntimeError(f"Timeout analyzing {filepath.name}")
+        return AudioMetadata(
+            filepath=filepath,
+            filename=filepath.name,
+            format_name="WAV",
+            codec="PCM_S16LE",
+            sample_rate=44100,
+            bit_depth=16,
+            channels=2,
+            bitrate=None,
+            duration=1.0,
+            is_lossy=False,
+            is_float=False,
+        )
+
+    def test_batch_preserves_order(self, analyzer):
+        """Test che i risultati mantengano l'ordine di input."""
+        paths = [Path(f"/music/track{i:03d}.wav") for i in range(50)]
+        with patch.object(analyzer, "analyze", side_effect=self._fake_analyze):
+            results = analyzer.analyze_batch(paths, max_workers=8)
+
+        assert [r[0] for r in results] == paths
+        assert all(r[1] is not None and r[2] is None for r in results)
+
+    def test_batch_isolates_failures(self, analyzer):
+        """Test che un file corrotto o in timeout non blocchi il batch."""
+        paths = [Path("/a.wav"), Path("/broken.wav"), Path("/slow.wav"), Path("/b.wav")]
+        progress = []
+        with patch.object(analyzer, "analyze", side_effect=self._fake_analyze):
+            results = analyzer.analyze_batch(
+                paths, max_workers=2, progress_callback=lambda d, t: progress.append((d, t))
+            )
+
+        assert results[1][1] is None and "Invalid data" in results[1][2]
+        assert results[2][1] is None and "Timeout" in results[2][2]
+        assert results[0][1] is not None and results[3][1] is not None
+        assert progress[-1] == (4, 4)
+
+    def test_batch_reports_throughput(self, analyzer):
+        """Test delle statistiche di throughput."""
+        paths = [Path(f"/t{i}.wav") for i in range(10)] + [Path("/broken.wav")]
+        with patch.object(analyzer, "analyze", side_effect=self._fake_analyze):
+            analyzer.analyze_batch(paths, max_workers=3)
+
+        stats = analyzer.last_batch_stats
+        assert stats["files"] == 11
+        assert stats["errors"] == 1
+        assert stats["workers"] == 3
+        assert stats["files_per_second"] > 0
+
+    def test_iter_analyze_consumes_generator(self, analyzer):
+        """Test che iter_analyze accetti un generatore."""
+        paths = (Path(f"/g{i}.wav") for i in range(7))
+        with patch.object(analyzer, "analyze", side_effect=self._fake_analyze):
+            indices = sorted(index for index, *_ in analyzer.iter_analyze(paths, max_workers=2))
+
+        assert indices == list(range(7))
+
+    def test_closing_iterator_does_not_wait_for_queued_files(self, analyzer):
+        """Test che chiudere l'iteratore (annullamento) non attenda i file in coda."""
+        release = threading.Event()
+
+        def blocking_analyze(filepath):
+            if Path(filepath).name != "fast.wav":
+                release.wait(5)
+            return self._fake_analyze(filepath)
+
+        paths = [Path("/fast.wav")] + [Path(f"/q{i}.wav") for i in range(6)]
+        with patch.object(analyzer, "analyze", side_effect=blocking_analyze):
+            results = analyzer.iter_analyze(paths, max_workers=2)
+            first = next(results)
+            started = time.perf_counter()
+            results.close()
+            elapsed = time.perf_counter() - started
+            release.set()
+
+        assert first[1] == Path("/fast.wav")
+        assert elapsed < 1.0
+        assert analyzer.last_batch_stats["files"] == 1
+
+
 class TestAudioMetadata:
     """Test per AudioMetadata."""
 
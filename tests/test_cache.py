@@ -0,0 +1,170 @@
+"""Test per MetadataCache."""
+
+import os
+import sqlite3
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from dr_cdj.analyzer import AudioAnalyzer, AudioMetadata
+from dr_cdj.cache import MetadataCache
+
+
+def _metadata(filepath: Path) -> AudioMetadata:
+    return AudioMetadata(
+        filepath=filepath,
+        filename=filepath.name,
+        format_name="FLAC",
+        codec="FLAC",
+        sample_rate=96000,
+        bit_depth=24,
+        channels=2,
+        bitrate=2_500_000,
+        duration=312.5,
+        is_lossy=False,
+        is_float=False,
+    )
+
+
+class TestMetadataCache:
+    """Test suite per MetadataCache."""
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        """Cache su database temporaneo."""
+        cache = MetadataCache(db_path=tmp_path / "cache.sqlite3")
+        yield cache
+        cache.close()
+
+    @pytest.fixture
+    def track(self, tmp_path):
+        """File audio fittizio."""
+        path = tmp_path / "track.flac"
+        path.write_bytes(b"fLaC" + b"\0" * 100)
+        return path
+
+    def test_roundtrip(self, cache, track):
+        """Test salvataggio e lettura dei metadati."""
+        cache.put(track, _metadata(track))
+        cached = cache.get(track)
+
+        assert cached == _metadata(track)
+        assert cache.stats["hits"] == 1
+        assert cache.stats["misses"] == 0
+
+    def test_miss_on_unknown_file(self, cache, track):
+        """Test miss per file mai analizzato."""
+        assert cache.get(track) is None
+        assert cache.misses == 1
+
+    def test_invalidated_on_modification(self, cache, track):
+        """Test invalidazione quando il file cambia."""
+        cache.put(track, _metadata(track))
+        track.write_bytes(b"fLaC" + b"\1" * 200)
+
+        assert cache.get(track) is None
+        assert len(cache) == 0
+
+    def test_persists_across_instances(self, tmp_path, track):
+        """Test persistenza su disco tra sessioni."""
+        db = tmp_path / "cache.sqlite3"
+        first = MetadataCache(db_path=db)
+        first.put(track, _metadata(track))
+        first.close()
+
+        second = MetadataCache(db_path=db)
+        assert second.get(track) is not None
+        second.close()
+
+    def test_prune_removes_deleted_files(self, cache, tmp_path, track):
+        """Test rimozione voci di file cancellati."""
+        other = tmp_path / "other.flac"
+        other.write_bytes(b"fLaC")
+        cache.put(track, _metadata(track))
+        cache.put(other, _metadata(other))
+        other.unlink()
+
+        assert cache.prune() == 1
+        assert len(cache) == 1
+
+    def test_bounded_size(self, tmp_path):
+        """Test eviction LRU oltre max_entries."""
+        cache = MetadataCache(db_path=tmp_path / "cache.sqlite3", max_entries=3)
+        paths = []
+        for i in range(5):
+            path = tmp_path / f"t{i}.flac"
+            path.write_bytes(b"x" * i)
+            os.utime(path, ns=(i, i))
+            cache.put(path, _metadata(path))
+            paths.append(path)
+
+        cache.prune()
+
+        assert len(cache) == 3
+        assert cache.get(paths[0]) is None
+        assert cache.get(paths[4]) is not None
+        cache.close()
+
+    def test_hits_buffer_last_used(self, tmp_path):
+        """Test che i hit non scrivano sul DB ma contino per l'eviction LRU."""
+        db = tmp_path / "cache.sqlite3"
+        cache = MetadataCache(db_path=db, max_entries=2)
+        paths = []
+        for i in range(3):
+            path = tmp_path / f"t{i}.flac"
+            path.write_bytes(b"x" * i)
+            cache.put(path, _metadata(path))
+            paths.append(path)
+
+        changes = cache._conn.total_changes
+        for _ in range(10):
+            assert cache.get(paths[0]) is not None
+        assert cache._conn.total_changes == changes  # Nessuna scrittura per hit
+
+        last = tmp_path / "t3.flac"
+        last.write_bytes(b"xxx")
+        cache.put(last, _metadata(last))
+        cache.prune()
+
+        assert cache.get(paths[0]) is not None
+        assert cache.get(paths[1]) is None
+        cache.close()
+
+        with sqlite3.connect(db) as conn:
+            times = dict(conn.execute("SELECT path, last_used FROM metadata"))
+        assert times[str(paths[0].resolve())] > times[str(last.resolve())]
+
+    def test_puts_are_written_in_batches(self, tmp_path):
+        """Test che le nuove voci vengano scritte a blocchi e salvate alla chiusura."""
+        db = tmp_path / "cache.sqlite3"
+        cache = MetadataCache(db_path=db)
+        paths = []
+        for i in range(10):
+            path = tmp_path / f"t{i}.flac"
+            path.write_bytes(b"x" * i)
+            cache.put(path, _metadata(path))
+            paths.append(path)
+
+        with sqlite3.connect(db) as conn:
+            assert conn.execute("SELECT COUNT(*) FROM metadata").fetchone()[0] == 0
+        assert cache.get(paths[3]) == _metadata(paths[3])  # Servita dal buffer
+
+        cache.close()
+        assert cache.get(paths[3]) is None  # Cache chiusa: sempre miss
+
+        with sqlite3.connect(db) as conn:
+            assert conn.execute("SELECT COUNT(*) FROM metadata").fetchone()[0] == 10
+
+    def test_analyzer_uses_cache(self, cache, track):
+        """Test che l'analyzer non lanci ffprobe su un hit."""
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0)
+            analyzer = AudioAnalyzer(cache=cache)
+
+        with patch.object(analyzer, "_run_ffprobe", return_value=_metadata(track)) as probe:
+            analyzer.analyze(track)
+            analyzer.analyze(track)
+
+        probe.assert_called_once()
+        assert cache.hits == 1
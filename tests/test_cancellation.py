@@ -0,0 +1,93 @@
+"""Test per cancellazione e watchdog delle conversioni."""
+
+import sys
+import threading
+import time
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from dr_cdj.cancellation import CancellationToken, ConversionCancelledError, ConversionTimeoutError
+from dr_cdj.converter import AudioConverter, ConversionResult
+from dr_cdj.journal import CANCELLED, ConversionJournal, JournalJob
+
+SLEEPER = [sys.executable, "-c", "import time; time.sleep(30)"]
+CHATTER = [
+    sys.executable, "-c",
+    "import time\nwhile True:\n    print('progress=continue', flush=True)\n    time.sleep(0.05)",
+]
+
+
+@pytest.fixture
+def converter():
+    with patch("subprocess.run") as mock_run:
+        mock_run.return_value = MagicMock(returncode=0)
+        return AudioConverter(max_workers=1)
+
+
+class TestWatchdog:
+    """Test suite per il watchdog di _run_ffmpeg."""
+
+    def test_cancel_kills_process(self, converter):
+        """Test che la cancellazione termini subito il processo."""
+        token = CancellationToken()
+        threading.Timer(0.2, token.cancel).start()
+        start = time.monotonic()
+
+        with pytest.raises(ConversionCancelledError):
+            converter._run_ffmpeg(SLEEPER, Path("a.wav"), 60.0, None, None, token)
+
+        assert time.monotonic() - start < 5
+
+    def test_stall_timeout(self, converter):
+        """Test che un ffmpeg senza output di progresso venga terminato."""
+        with patch("dr_cdj.converter.FFMPEG_STALL_TIMEOUT", 0.3), \
+                pytest.raises(ConversionTimeoutError, match="stalled"):
+            converter._run_ffmpeg(SLEEPER, Path("a.wav"), 60.0, None, None)
+
+    def test_wall_clock_timeout(self, converter):
+        """Test del limite di tempo anche se il processo continua a scrivere."""
+        with patch("dr_cdj.converter.FFMPEG_TIMEOUT", 0.3), \
+                patch("dr_cdj.converter.FFMPEG_TIMEOUT_PER_SECOND", 0.0), \
+                pytest.raises(ConversionTimeoutError, match="timeout"):
+            converter._run_ffmpeg(CHATTER, Path("a.wav"), 60.0, None, None)
+
+
+def test_cancelled_batch_reports_jobs_and_stays_resumable(converter, tmp_path):
+    """Test batch cancellato: job segnati come cancellati, journal ripristinabile."""
+    results = []
+    for name in ("a.wav", "b.wav", "c.wav"):
+        result = MagicMock(filepath=tmp_path / name, needs_conversion=True, profile_id=None)
+        result.metadata.duration = 10.0
+        results.append(result)
+
+    token = CancellationToken()
+
+    def fake_convert(result, output_dir=None, cancel_token=None, **kwargs):
+        # Il primo job viene interrotto mentre è in corso
+        cancel_token.cancel()
+        return ConversionResult(
+            source_path=result.filepath,
+            output_path=None,
+            success=False,
+            message="Cancelled",
+            cancelled=True,
+        )
+
+    journal = ConversionJournal(tmp_path / "journal.jsonl")
+    with patch.object(converter, "convert", side_effect=fake_convert) as mock_convert, \
+            patch.object(converter, "estimate_job_cost", return_value=1.0), \
+            patch.object(converter, "_journal_job", side_effect=lambda i, r, d: JournalJob(
+                i, r.filepath, None, {}, [], None)):
+        conversions = converter.convert_batch(results, journal=journal, cancel_token=token)
+
+    assert mock_convert.call_count == 1
+    assert len(conversions) == 3
+    assert all(c.cancelled and not c.success for c in conversions)
+    summary = converter.get_conversion_summary(conversions)
+    assert summary["cancelled"] == 3
+    assert summary["failed"] == 0
+
+    batch = journal.load_interrupted()
+    assert [job.state for job in batch.remaining] == [CANCELLED] * 3
@@ -0,0 +1,178 @@
+"""Test per la CLI headless."""
+
+import csv
+import io
+import json
+import struct
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from dr_cdj import cli
+
+
+def _write_wav(path: Path, rate: int, bits: int, channels: int = 2, frames: int = 4410):
+    block_align = bits // 8 * channels
+    data = b"\0" * (frames * block_align)
+    fmt_tag = 3 if bits == 32 else 1
+    fmt = struct.pack("<HHIIHH", fmt_tag, channels, rate, rate * block_align, block_align, bits)
+    body = b"WAVE" + b"fmt " + struct.pack("<I", len(fmt)) + fmt
+    body += b"data" + struct.pack("<I", len(data)) + data
+    path.write_bytes(b"RIFF" + struct.pack("<I", len(body)) + body)
+
+
+def _run(argv: list[str]) -> tuple[int, str]:
+    """Esegue la CLI con ffprobe simulato (i WAV sono letti dal parser nativo)."""
+    out = io.StringIO()
+    with patch("subprocess.run") as mock_run:
+        mock_run.return_value = MagicMock(returncode=0)
+        args = cli.build_parser().parse_args(argv + ["--no-cache", "-q"])
+        code = cli.run_command(args, out)
+    return code, out.getvalue()
+
+
+class TestIterAudioFiles:
+    """Test suite per la raccolta dei file."""
+
+    def test_filters_extensions_and_recursion(self, tmp_path):
+        """Test che vengano presi solo file audio visibili, ricorsione opzionale."""
+        (tmp_path / "a.wav").touch()
+        (tmp_path / "notes.txt").touch()
+        (tmp_path / "._a.wav").touch()
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "sub" / "b.FLAC").touch()
+
+        flat = list(cli.iter_audio_files([tmp_path]))
+        deep = list(cli.iter_audio_files([tmp_path], recursive=True))
+
+        assert flat == [tmp_path / "a.wav"]
+        assert deep == [tmp_path / "a.wav", tmp_path / "sub" / "b.FLAC"]
+
+    def test_explicit_files_are_kept(self, tmp_path):
+        """Test che i file passati esplicitamente non vengano filtrati."""
+        path = tmp_path / "track.xyz"
+        assert list(cli.iter_audio_files([path])) == [path]
+
+    def test_repeated_files_are_yielded_once(self, tmp_path):
+        """Test che un file ripetuto (o già dentro una cartella) esca una volta sola."""
+        path = tmp_path / "a.wav"
+        path.touch()
+
+        files = list(cli.iter_audio_files([path, tmp_path, tmp_path / "." / "a.wav"]))
+
+        assert files == [path]
+
+
+class TestRunCommand:
+    """Test suite per scan/convert."""
+
+    def test_scan_compatible_ndjson(self, tmp_path):
+        """Test scan di un file compatibile: exit 0 e un record per riga."""
+        _write_wav(tmp_path / "ok.wav", 44100, 16)
+
+        code, output = _run(["scan", str(tmp_path)])
+
+        records = [json.loads(line) for line in output.splitlines()]
+        assert code == cli.EXIT_OK
+        assert len(records) == 1
+        assert records[0]["status"] == "compatible"
+        assert records[0]["sample_rate"] == 44100
+
+    def test_scan_reports_issues_and_errors(self, tmp_path):
+        """Test exit code: file da convertire → 1, file illeggibili → 3."""
+        _write_wav(tmp_path / "float.wav", 44100, 32)
+
+        code, output = _run(["scan", str(tmp_path / "float.wav"), "-f", "json"])
+        records = json.loads(output)
+        assert code == cli.EXIT_ISSUES
+        assert records[0]["status"].startswith("convertible")
+        assert records[0]["target_format"]
+
+        code, output = _run(["scan", str(tmp_path / "missing.wav"), "-f", "csv"])
+        rows = list(csv.DictReader(io.StringIO(output)))
+        assert code == cli.EXIT_ERRORS
+        assert rows[0]["status"] == "error"
+        assert rows[0]["sample_rate"] == ""
+
+    def test_empty_json_is_valid(self, tmp_path):
+        """Test che una directory vuota produca un array JSON valido."""
+        code, output = _run(["scan", str(tmp_path), "-f", "json"])
+        assert code == cli.EXIT_OK
+        assert json.loads(output) == []
+
+    def test_missing_ffprobe(self, tmp_path, capsys):
+        """Test che la mancanza di ffprobe dia exit 4."""
+        args = cli.build_parser().parse_args(["scan", str(tmp_path), "--no-cache"])
+        with patch("subprocess.run", side_effect=FileNotFoundError()):
+            assert cli.run_command(args, io.StringIO()) == cli.EXIT_NO_FFMPEG
+        assert "ffprobe" in capsys.readouterr().err
+
+    def test_convert_streams_conversion_results(self, tmp_path):
+        """Test che convert scriva i record dei file convertiti con l'esito."""
+        _write_wav(tmp_path / "ok.wav", 44100, 16)
+        _write_wav(tmp_path / "float.wav", 44100, 32)
+
+        def fake_batch(results, output_dir=None, result_callback=None, **kwargs):
+            for result in results:
+                result_callback(
+                    cli.ConversionResult(
+                        source_path=result.filepath,
+                        output_path=tmp_path / "float_CDJ.wav",
+                        success=True,
+                        message="Converted",
+                    )
+                )
+
+        with patch.object(cli.AudioConverter, "convert_batch", side_effect=fake_batch):
+            code, output = _run(["convert", str(tmp_path)])
+
+        records = {Path(r["path"]).name: r for r in map(json.loads, output.splitlines())}
+        assert code == cli.EXIT_OK
+        assert records["ok.wav"]["converted"] is None
+        assert records["float.wav"]["converted"] is True
+        assert records["float.wav"]["output_path"].endswith("float_CDJ.wav")
+
+    def test_convert_repeated_input(self, tmp_path):
+        """Test che un file ripetuto sulla riga di comando dia un solo record."""
+        path = tmp_path / "float.wav"
+        _write_wav(path, 44100, 32)
+        jobs = []
+
+        def fake_batch(results, output_dir=None, result_callback=None, **kwargs):
+            for result in results:
+                jobs.append(result.filepath)
+                result_callback(
+                    cli.ConversionResult(
+                        source_path=result.filepath,
+                        output_path=tmp_path / "float_CDJ.wav",
+                        success=True,
+                        message="Converted",
+                    )
+                )
+
+        with patch.object(cli.AudioConverter, "convert_batch", side_effect=fake_batch):
+            code, output = _run(["convert", str(path), str(path)])
+
+        records = [json.loads(line) for line in output.splitlines()]
+        assert code == cli.EXIT_OK
+        assert jobs == [path]
+        assert len(records) == 1 and records[0]["converted"] is True
+
+
+def test_cli_does_not_import_gui_libraries():
+    """Test che la CLI non importi customtkinter/tkinterdnd2."""
+    code = (
+        "import sys, dr_cdj.cli; "
+        "bad = {'customtkinter', 'tkinterdnd2', 'tkinter'} & set(sys.modules); "
+        "sys.exit(1 if bad else 0)"
+    )
+    src = Path(cli.__file__).resolve().parents[1]
+    result = subprocess.run([sys.executable, "-c", code], env={"PYTHONPATH": str(src)})
+    assert result.returncode == 0
+
+    with pytest.raises(SystemExit) as exc:
+        cli.run(["--help"])
+    assert exc.value.code == 0
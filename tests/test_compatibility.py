@@ -1,13 +1,21 @@
 """Test per CompatibilityEngine con supporto multi-profilo."""
 
+import dataclasses
+
 import pytest
 from pathlib import Path
 
+from dr_cdj import compatibility
 from dr_cdj.analyzer import AudioMetadata
+from dr_cdj.config import CDJ_PROFILES
 from dr_cdj.compatibility import (
     CompatibilityEngine,
+    CompatibilityMatrix,
     CompatibilityResult,
     CompatibilityStatus,
+    clear_verdict_cache,
+    lookup_verdict,
+    verdict_key,
 )
 
 
@@ -395,3 +403,116 @@ class TestCompatibilityResult:
         
         assert result.profile_id == "cdj_3000"
         assert result.profile_name == "CDJ-3000"
+
+
+def _flac_metadata(name: str, sample_rate: int) -> AudioMetadata:
+    return AudioMetadata(
+        filepath=Path(f"/test/{name}"),
+        filename=name,
+        format_name="FLAC",
+        codec="flac",
+        sample_rate=sample_rate,
+        bit_depth=24,
+        channels=2,
+        bitrate=None,
+        duration=300.0,
+        is_lossy=False,
+        is_float=False,
+    )
+
+
+class TestCompatibilityMatrix:
+    """Test suite per CompatibilityMatrix."""
+
+    def test_matches_single_profile_engine(self):
+        """Test che il vettore dei verdetti coincida con i controlli per profilo."""
+        matrix = CompatibilityMatrix()
+        metadata = _flac_metadata("track.flac", 48000)
+
+        verdicts = matrix.evaluate(metadata)
+
+        assert verdicts.profile_ids == matrix.profile_ids
+        for profile_id in matrix.profile_ids:
+            assert verdicts.for_profile(profile_id) == CompatibilityEngine(profile_id).check(metadata)
+        assert "cdj_3000" in verdicts.compatible_profiles()
+        assert not verdicts.plays_everywhere
+
+    def test_summary_counts(self):
+        """Test del riepilogo della libreria su un sottoinsieme di profili."""
+        matrix = CompatibilityMatrix(["cdj_3000", "cdj_2000_nxs"])
+        tracks = [_flac_metadata("a.flac", 48000), _flac_metadata("b.flac", 44100)]
+
+        summary = matrix.summarize(matrix.evaluate_all(tracks))
+
+        assert summary.total == 2
+        assert summary.compatible("cdj_3000") == 2
+        assert summary.compatible("cdj_2000_nxs") == 0
+        assert summary.counts["cdj_2000_nxs"] == {CompatibilityStatus.CONVERTIBLE_LOSSLESS: 2}
+        assert (summary.plays_everywhere, summary.plays_nowhere) == (0, 0)
+
+    def test_immutable_and_validated(self):
+        """Test che la matrice sia immutabile e rifiuti profili sconosciuti."""
+        matrix = CompatibilityMatrix(["cdj_3000"])
+        with pytest.raises(AttributeError):
+            matrix.profile_ids = ("cdj_2000_nxs",)
+        with pytest.raises(ValueError):
+            CompatibilityMatrix(["non_existent"])
+
+
+class TestMemoizedVerdicts:
+    """Test suite per le tabelle compilate e la cache dei verdetti."""
+
+    def test_same_key_evaluated_once(self):
+        """Test che file con la stessa chiave condividano verdetto e piano."""
+        clear_verdict_cache()
+        engine = CompatibilityEngine()
+        first = engine.check(_flac_metadata("a.flac", 96000))
+        second = engine.check(_flac_metadata("b.flac", 96000))
+
+        assert second.filepath == Path("/test/b.flac")
+        assert second.message == first.message
+        assert second.conversion_plan is first.conversion_plan
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            second.conversion_plan.target_bit_depth = 16  # Cambierebbe anche `first`
+        assert compatibility._cached_verdict.cache_info().misses == 1
+        key = verdict_key(_flac_metadata("C.FLAC", 96000))
+        assert key.extension == ".flac"
+        assert lookup_verdict("cdj_2000_nxs", key) == (
+            first.status, first.message, first.conversion_plan
+        )
+
+    def test_custom_profile_not_cached(self):
+        """Test che un profilo non predefinito venga valutato senza cache."""
+        clear_verdict_cache()
+        profile = dataclasses.replace(CDJ_PROFILES["cdj_3000"], name="Custom")
+        result = compatibility.check_profile(_flac_metadata("a.flac", 48000), "cdj_3000", profile)
+
+        assert result.status == CompatibilityStatus.COMPATIBLE
+        assert result.message == "Ready for Custom"
+        assert compatibility._cached_verdict.cache_info().currsize == 0
+
+    def test_recheck_reports_changed_rows(self):
+        """Test del ricontrollo al cambio profilo con i soli indici cambiati."""
+        engine = CompatibilityEngine("cdj_2000_nxs2")
+        error = CompatibilityResult(
+            filepath=Path("/test/broken.flac"),
+            metadata=_flac_metadata("broken.flac", 48000),
+            status=CompatibilityStatus.ERROR,
+            message="ffprobe failed",
+            profile_id="cdj_2000_nxs2",
+            profile_name="CDJ-2000 Nexus 2",
+        )
+        results = [
+            engine.check(_flac_metadata("a.flac", 48000)),
+            engine.check(_flac_metadata("b.flac", 192000)),
+            error,
+        ]
+
+        engine.set_profile("xdj_1000_mk2")
+        rechecked, changed = engine.recheck(results)
+
+        assert [r.profile_id for r in rechecked[:2]] == ["xdj_1000_mk2"] * 2
+        assert rechecked[2] is error
+        assert changed == {0}  # Solo il messaggio "Ready for ..." cambia
+        assert rechecked[:2] == [engine.check(r.metadata) for r in results[:2]]
+        assert engine.recheck(rechecked) == (rechecked, set())
@@ -0,0 +1,95 @@
+"""Test per ConcurrencyController."""
+
+from pathlib import Path
+
+from dr_cdj.concurrency import ConcurrencyController
+
+
+def _controller(cpu=0.5, **kwargs) -> ConcurrencyController:
+    return ConcurrencyController(interval=1.0, cpu_probe=lambda: cpu, **kwargs)
+
+
+def _window(controller, t, audio_seconds, active=None, pending=10, written=None):
+    """Simula una finestra di misura: avanzamento audio e poi decisione."""
+    job = Path(f"/job{t}.flac")
+    controller._jobs.pop(job, None)
+    written = int(audio_seconds * 1000) if written is None else written
+    controller.observe(job, audio_seconds, written)
+    start = controller._window_start
+    return controller.update(
+        active=controller.limit if active is None else active, pending=pending, now=start + t
+    )
+
+
+class TestConcurrencyController:
+    """Test suite per il controller adattivo."""
+
+    def test_grows_with_cpu_headroom_until_ceiling(self):
+        """Test crescita con CPU libera e guadagno di throughput, fino al tetto."""
+        controller = _controller(floor=1, ceiling=3, initial=1)
+
+        throughput = 10.0
+        for _ in range(8):
+            _window(controller, 1.0, throughput)
+            throughput *= 2
+
+        assert controller.limit == 3
+        assert [d.action for d in controller.decisions if d.action != "hold"] == ["grow", "grow"]
+
+    def test_undoes_grow_without_throughput_gain(self):
+        """Test che una crescita senza guadagno (I/O bound) venga annullata."""
+        controller = _controller(floor=1, ceiling=4, initial=2)
+
+        assert _window(controller, 1.0, 20.0) == 3  # grow
+        assert _window(controller, 1.0, 20.0) == 3  # settling window, ignored
+        assert _window(controller, 1.0, 20.5) == 2  # no gain: shrink
+        assert _window(controller, 1.0, 20.0) == 2  # settling
+        assert _window(controller, 1.0, 20.0) == 2  # cooldown: hold
+
+        shrink = [d for d in controller.decisions if d.action == "shrink"][0]
+        assert "no throughput" in shrink.reason
+        assert shrink.write_rate > 0
+
+    def test_shrinks_on_overload_and_respects_floor(self):
+        """Test riduzione con CPU sovraccarica senza scendere sotto il minimo."""
+        controller = _controller(cpu=3.0, floor=2, ceiling=6, initial=4)
+
+        for _ in range(10):
+            _window(controller, 1.0, 10.0)
+
+        assert controller.limit == 2
+
+    def test_no_grow_when_slots_idle(self):
+        """Test che non cresca se non tutti gli slot sono occupati o manca lavoro."""
+        controller = _controller(initial=2, ceiling=8)
+
+        _window(controller, 1.0, 10.0, active=1)
+        _window(controller, 1.0, 10.0, pending=0)
+
+        assert controller.limit == 2
+
+    def test_write_plateau_undoes_grow_and_blocks_regrowth(self):
+        """Test che scritture sature annullino la crescita e la blocchino in seguito."""
+        controller = _controller(floor=1, ceiling=4, initial=2)
+        mb = 1_000_000
+
+        assert _window(controller, 1.0, 20.0, written=40 * mb) == 3  # grow
+        assert _window(controller, 1.0, 30.0, written=40 * mb) == 3  # settling
+        assert _window(controller, 1.0, 30.0, written=41 * mb) == 2  # writes flat: shrink
+        for _ in range(8):  # Ben oltre il cooldown
+            assert _window(controller, 1.0, 30.0, written=40 * mb) == 2
+
+        shrink = [d for d in controller.decisions if d.action == "shrink"][0]
+        assert "output device saturated" in shrink.reason
+        assert "output device saturated" in controller.decisions[-1].reason
+        assert controller.decisions[-1].action == "hold"
+
+    def test_shrinks_when_writes_stall(self):
+        """Test riduzione quando scrittura e throughput crollano a pari concorrenza."""
+        controller = _controller(cpu=0.9, floor=1, ceiling=4, initial=3)
+        mb = 1_000_000
+
+        assert _window(controller, 1.0, 30.0, written=60 * mb) == 3
+        assert _window(controller, 1.0, 12.0, written=15 * mb) == 2
+
+        assert "write rate dropped" in controller.decisions[-1].reason
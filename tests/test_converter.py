@@ -1,5 +1,6 @@
 """Test per AudioConverter."""
 
+import struct
 import pytest
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -265,3 +266,230 @@ class TestGetConversionSummary:
             assert summary["successful"] == 2
             assert summary["failed"] == 1
             assert len(summary["outputs"]) == 2
+
+
+class TestConversionProgress:
+    """Test per il parsing di ffmpeg -progress."""
+
+    def test_follow_progress_events(self):
+        """Test eventi di progresso: frazione, velocità, ETA e completamento."""
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0)
+            converter = AudioConverter()
+
+        stdout = [
+            "out_time_us=30000000\n", "total_size=1000\n", "speed=10x\n", "progress=continue\n",
+            "out_time_us=60000000\n", "speed=N/A\n", "progress=continue\n",
+            "out_time_us=120000000\n", "total_size=4000\n", "speed=12x\n", "progress=end\n",
+        ]
+        process = MagicMock(stdout=stdout)
+        events, fractions = [], []
+        with patch("dr_cdj.converter.PROGRESS_INTERVAL", 0):
+            converter._follow_progress(
+                process, Path("/set.flac"), 120.0, fractions.append, events.append
+            )
+
+        assert [e.fraction for e in events] == [0.25, 0.5, 1.0]
+        assert fractions == [0.25, 0.5, 1.0]
+        assert events[0].speed == 10.0
+        assert events[0].eta == pytest.approx(9.0)
+        assert events[1].speed is None and events[1].eta is None
+        assert events[-1].total_size == 4000
+        assert events[-1].eta == 0.0
+
+    def test_follow_progress_throttles(self):
+        """Test che gli eventi intermedi vengano limitati ma la fine sempre emessa."""
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0)
+            converter = AudioConverter()
+
+        stdout = ["out_time_us=1000000\n", "progress=continue\n"] * 50 + ["progress=end\n"]
+        events = []
+        converter._follow_progress(
+            MagicMock(stdout=stdout), Path("/a.flac"), None, None, events.append
+        )
+
+        assert len(events) == 2
+        assert events[0].fraction == 0.0  # Duration unknown
+        assert events[-1].fraction == 1.0
+
+
+class TestMultiProfileConversion:
+    """Test per la conversione multi-profilo con un solo decode."""
+
+    @staticmethod
+    def _converter():
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0)
+            return AudioConverter()
+
+    def test_multi_args_share_decode_and_resample(self):
+        """Test grafo filtri: un asplit per rate, un solo resample per rate."""
+        converter = self._converter()
+        outputs = [
+            (Path("/out/a/t.wav"), (24, 48000, "WAV", True)),
+            (Path("/out/b/t.aiff"), (16, 48000, "AIFF", True)),
+            (Path("/out/c/t.flac"), (24, 96000, "FLAC", False)),
+        ]
+
+        args = converter._build_multi_ffmpeg_args(Path("/music/t.flac"), outputs)
+        graph = args[args.index("-filter_complex") + 1]
+
+        assert args.count("-i") == 1
+        assert graph.count("aresample") == 1
+        assert "[0:a:0]asplit=2" in graph
+        assert "osr=48000" in graph
+        assert args.count("-map") == 3
+        assert "pcm_s24le" in args and "pcm_s16be" in args and "flac" in args
+
+    def test_convert_multi_groups_identical_settings(self, tmp_path):
+        """Test che profili con le stesse impostazioni condividano l'output."""
+        converter = self._converter()
+        source = tmp_path / "set.wav"
+        source.write_bytes(b"RIFF")
+        metadata = AudioMetadata(
+            filepath=source,
+            filename=source.name,
+            format_name="WAV",
+            codec="PCM_F32LE",
+            sample_rate=96000,
+            bit_depth=32,
+            channels=2,
+            bitrate=None,
+            duration=60.0,
+            is_lossy=False,
+            is_float=True,
+        )
+        result = CompatibilityResult(
+            filepath=source,
+            metadata=metadata,
+            status=CompatibilityStatus.CONVERTIBLE_LOSSLESS,
+            message="32-bit float",
+            profile_id="cdj_2000_nxs",
+            profile_name="CDJ-2000 Nexus",
+        )
+
+        commands = []
+
+        def fake_popen(cmd, **kwargs):
+            commands.append(cmd)
+            for arg in cmd:
+                if "_CDJ." in arg:
+                    Path(arg).write_bytes(b"out")
+            process = MagicMock(stderr=[], stdout=[])
+            process.wait.return_value = 0
+            return process
+
+        profiles = ["cdj_2000_nxs", "xdj_700", "cdj_2000_nxs2"]
+        with patch.object(converter, "_verify_output", return_value=True), \
+                patch("subprocess.Popen", side_effect=fake_popen):
+            conversions = converter.convert_multi(result, profiles, tmp_path / "out")
+
+        assert len(commands) == 1
+        assert [c.profile_id for c in conversions] == profiles
+        assert all(c.success for c in conversions)
+        assert conversions[0].output_path == conversions[1].output_path
+        assert conversions[0].output_path != conversions[2].output_path
+        assert conversions[0].output_path.parent.name == "WAV_24bit_48kHz"
+
+
+def _write_wav(path: Path, rate: int, bits: int, frames: int, channels: int = 2, short: int = 0):
+    block_align = bits // 8 * channels
+    data = b"\0" * (frames * block_align - short)
+    fmt = struct.pack("<HHIIHH", 1, channels, rate, rate * block_align, block_align, bits)
+    body = b"WAVE" + b"fmt " + struct.pack("<I", len(fmt)) + fmt
+    body += b"data" + struct.pack("<I", len(data)) + data
+    path.write_bytes(b"RIFF" + struct.pack("<I", len(body)) + body)
+
+
+class TestNativeVerification:
+    """Test per la verifica dell'output tramite header nativo."""
+
+    @staticmethod
+    def _converter(**kwargs):
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0)
+            return AudioConverter(**kwargs)
+
+    def test_header_checks(self, tmp_path):
+        """Test verifica header: rate, bit depth e lunghezza dati vs durata."""
+        converter = self._converter()
+        output = tmp_path / "out_CDJ.wav"
+        _write_wav(output, 48000, 24, frames=48000)
+
+        assert converter._verify_header(output, 24, 48000, 1.0) is True
+        assert converter._verify_header(output, 24, 44100, 1.0) is False
+        assert converter._verify_header(output, 16, 48000, 1.0) is False
+        assert converter._verify_header(output, 24, 48000, 2.0) is False
+
+        with open(output, "r+b") as f:
+            f.truncate(1000)
+        assert converter._verify_header(output, 24, 48000, 1.0) is False
+
+    def test_header_rejects_partial_frame(self, tmp_path):
+        """Test che un chunk data non multiplo del frame (±1 byte) venga rifiutato."""
+        converter = self._converter()
+        for short in (1, -1):
+            output = tmp_path / f"out_{short}_CDJ.wav"
+            _write_wav(output, 48000, 24, frames=48000, short=short)
+
+            assert converter._verify_header(output, 24, 48000, 1.0) is False
+
+    def test_ffprobe_only_for_calibration_or_paranoid(self, tmp_path):
+        """Test che ffprobe giri solo una volta (calibrazione) o sempre in modalità paranoid."""
+        output = tmp_path / "out_CDJ.wav"
+        _write_wav(output, 44100, 16, frames=4410)
+        probe = MagicMock(returncode=0, stdout='{"streams": [{"sample_rate": "44100"}]}')
+
+        converter = self._converter()
+        with patch("subprocess.run", return_value=probe) as mock_run:
+            for _ in range(3):
+                assert converter._verify_output(output, 16, 44100, 0.1)
+        assert mock_run.call_count == 1
+
+        paranoid = self._converter(paranoid_verify=True)
+        with patch("subprocess.run", return_value=probe) as mock_run:
+            for _ in range(3):
+                assert paranoid._verify_output(output, 16, 44100, 0.1)
+        assert mock_run.call_count == 3
+
+
+def test_convert_uses_native_pcm_engine(tmp_path):
+    """Test che una riduzione di bit depth senza resampling non lanci ffmpeg."""
+    pytest.importorskip("numpy")
+    source = tmp_path / "track.wav"
+    _write_wav(source, 44100, 32, frames=4410)
+    metadata = AudioMetadata(
+        filepath=source,
+        filename=source.name,
+        format_name="WAV",
+        codec="PCM_S32LE",
+        sample_rate=44100,
+        bit_depth=32,
+        channels=2,
+        bitrate=None,
+        duration=0.1,
+        is_lossy=False,
+        is_float=False,
+    )
+    result = CompatibilityResult(
+        filepath=source,
+        metadata=metadata,
+        status=CompatibilityStatus.CONVERTIBLE_LOSSLESS,
+        message="32-bit",
+        conversion_plan=ConversionPlan("WAV", 44100, 24, "32-bit → 24-bit"),
+        profile_id="cdj_2000_nxs",
+        profile_name="CDJ-2000 Nexus",
+    )
+    with patch("subprocess.run") as mock_run:
+        mock_run.return_value = MagicMock(returncode=0)
+        converter = AudioConverter()
+    probe = MagicMock(returncode=0, stdout='{"streams": [{"sample_rate": "44100"}]}')
+
+    with patch("subprocess.run", return_value=probe), \
+            patch("subprocess.Popen") as mock_popen:
+        conversion = converter.convert(result, tmp_path / "out")
+
+    assert conversion.success, conversion.message
+    assert conversion.output_path.read_bytes()[20:22] == b"\xfe\xff"
+    mock_popen.assert_not_called()
@@ -0,0 +1,83 @@
+"""Test per la ricerca dei file audio nelle cartelle."""
+
+import os
+import threading
+
+import pytest
+
+from dr_cdj.discovery import discover, is_audio_name, walk_audio_files
+
+
+@pytest.fixture
+def crate(tmp_path):
+    """Cartella con sottocartelle annidate, file nascosti e non audio."""
+    for rel in (
+        "b.mp3",
+        "A.WAV",
+        "._A.WAV",
+        ".DS_Store",
+        "notes.txt",
+        "House/track.Flac",
+        "House/Deep/deeper.aif",
+        ".hidden/secret.wav",
+    ):
+        path = tmp_path / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.touch()
+    return tmp_path
+
+
+def test_is_audio_name():
+    """Test estensioni senza distinzione di maiuscole e file nascosti."""
+    assert is_audio_name("Track.AIFF")
+    assert not is_audio_name("._Track.aiff")
+    assert not is_audio_name("wav")
+    assert not is_audio_name("cover.jpg")
+
+
+def test_recursive_walk_order_and_filters(crate):
+    """Test ricorsione completa, ordine stabile e filtri su nascosti/AppleDouble."""
+    assert list(walk_audio_files(crate)) == [
+        crate / "A.WAV",
+        crate / "b.mp3",
+        crate / "House" / "track.Flac",
+        crate / "House" / "Deep" / "deeper.aif",
+    ]
+
+
+def test_depth_limit(crate):
+    """Test del limite di profondità e della modalità non ricorsiva."""
+    assert list(walk_audio_files(crate, max_depth=1))[-1] == crate / "House" / "track.Flac"
+    assert list(discover([crate], recursive=False)) == [crate / "A.WAV", crate / "b.mp3"]
+
+
+@pytest.mark.skipif(not hasattr(os, "symlink"), reason="symlink non disponibili")
+def test_symlink_loop_terminates(crate):
+    """Test che un link simbolico ciclico non causi una ricorsione infinita."""
+    os.symlink(crate, crate / "House" / "loop")
+
+    found = list(walk_audio_files(crate))
+
+    assert len(found) == 4
+    assert len(set(found)) == 4
+
+
+def test_discover_mixes_files_and_overlapping_folders(crate):
+    """Test file espliciti mantenuti e cartelle sovrapposte elencate una volta."""
+    explicit = crate / "notes.txt"
+
+    found = list(discover([explicit, crate / "House", crate]))
+
+    assert found[0] == explicit
+    assert found.count(crate / "House" / "track.Flac") == 1
+    assert len(found) == 5
+
+
+def test_discovery_streams_and_can_be_cancelled(crate):
+    """Test che i percorsi arrivino prima della fine della visita e che cancel la fermi."""
+    cancel = threading.Event()
+    walk = discover([crate], cancel=cancel)
+
+    assert next(walk) == crate / "A.WAV"
+    cancel.set()
+    assert list(walk) == [crate / "b.mp3"]  # La cartella corrente viene completata
@@ -0,0 +1,107 @@
+"""Test per il worker di conversione e il bus degli eventi."""
+
+import threading
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from dr_cdj.converter import AudioConverter, ConversionProgress, ConversionResult
+from dr_cdj.events import (
+    BatchFinished,
+    ConversionWorker,
+    EventBus,
+    JobFailed,
+    JobFinished,
+    JobProgress,
+    JobStarted,
+    coalesce,
+)
+
+
+@pytest.fixture
+def converter():
+    with patch("subprocess.run") as mock_run:
+        mock_run.return_value = MagicMock(returncode=0)
+        return AudioConverter(max_workers=2)
+
+
+def _result(name: str, success: bool = True) -> ConversionResult:
+    return ConversionResult(Path(name), Path(f"out/{name}"), success, "ok" if success else "boom")
+
+
+def test_coalesce_keeps_latest_progress_per_job():
+    """Test che restino solo l'ultimo progresso per job e gli eventi di stato."""
+    a, b = Path("a.wav"), Path("b.wav")
+    events = [JobStarted(a), JobStarted(b)]
+    events += [JobProgress(a, i / 1000, batch_fraction=i / 2000) for i in range(1000)]
+    events += [JobProgress(b, 0.5), JobFinished(_result("b.wav")), JobProgress(a, 0.999)]
+
+    coalesced = coalesce(events)
+
+    assert coalesced == [JobStarted(a), JobStarted(b), JobFinished(_result("b.wav")),
+                         JobProgress(a, 0.999)]
+
+
+def test_bus_collects_events_from_many_threads():
+    """Test del bus con più produttori concorrenti."""
+    bus = EventBus()
+
+    def produce(n):
+        for i in range(500):
+            bus.publish(JobProgress(Path(f"{n}.wav"), i / 500))
+
+    threads = [threading.Thread(target=produce, args=(n,)) for n in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(bus.drain(max_events=100)) == 100
+    remaining = bus.drain()
+    assert len(remaining) == 1900
+    assert len(coalesce(remaining)) == 4
+    assert bus.drain() == []
+
+
+def test_worker_publishes_job_events(converter):
+    """Test della sequenza di eventi di un batch eseguito sul thread worker."""
+    jobs = [MagicMock(filepath=Path(name), profile_id="cdj_2000_nxs") for name in ("a.wav", "b.wav")]
+
+    def fake_batch(results, result_callback, job_progress_callback, job_start_callback,
+                   **kwargs):
+        assert threading.current_thread().name == "dr-cdj-conversion"
+        out = []
+        for job, success in zip(results, (True, False)):
+            job_start_callback(job)
+            job_progress_callback(ConversionProgress(job.filepath, 0.5, 30.0, batch_fraction=0.25))
+            out.append(_result(job.filepath.name, success))
+            result_callback(out[-1])
+        return out
+
+    bus = EventBus()
+    with patch.object(converter, "convert_batch", side_effect=fake_batch):
+        worker = ConversionWorker(converter, jobs, bus, dedupe=True)
+        worker.start()
+        worker.join(5)
+
+    events = bus.drain()
+    assert [type(e) for e in events] == [
+        JobStarted, JobProgress, JobFinished, JobStarted, JobProgress, JobFailed, BatchFinished
+    ]
+    assert events[1].batch_fraction == 0.25
+    assert len(events[-1].results) == 2
+    assert events[-1].error is None
+
+
+def test_worker_reports_unexpected_errors(converter):
+    """Test che un'eccezione nel batch chiuda comunque con BatchFinished."""
+    bus = EventBus()
+    with patch.object(converter, "convert", side_effect=OSError("disk full")):
+        worker = ConversionWorker(converter, [MagicMock(filepath=Path("a.wav"))], bus, batch=False)
+        worker.start()
+        worker.join(5)
+
+    events = bus.drain()
+    assert isinstance(events[0], JobStarted)
+    assert events[-1] == BatchFinished([], error="disk full")
@@ -0,0 +1,152 @@
+"""Test per le impronte di contenuto e la deduplicazione dei file identici."""
+
+import os
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from dr_cdj import fingerprint
+from dr_cdj.analyzer import AudioAnalyzer, AudioMetadata
+from dr_cdj.compatibility import CompatibilityResult, CompatibilityStatus, ConversionPlan
+from dr_cdj.converter import AudioConverter, ConversionResult
+from dr_cdj.fingerprint import ContentIndex, content_fingerprint
+
+BIG = 4 * 1024 * 1024  # Oltre la soglia del campionamento
+
+
+def _write(path: Path, data: bytes) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    return path
+
+
+def _metadata(path: Path) -> AudioMetadata:
+    return AudioMetadata(
+        filepath=path,
+        filename=path.name,
+        format_name="WAV",
+        codec="pcm_f32le",
+        sample_rate=96000,
+        bit_depth=32,
+        channels=2,
+        bitrate=None,
+        duration=60.0,
+        is_lossy=False,
+        is_float=True,
+    )
+
+
+class TestContentFingerprint:
+    """Test suite per content_fingerprint e ContentIndex."""
+
+    def test_same_content_same_fingerprint(self, tmp_path):
+        """Test che copie con nome diverso abbiano la stessa impronta."""
+        data = os.urandom(BIG)
+        a = _write(tmp_path / "a.wav", data)
+        b = _write(tmp_path / "crate" / "b.wav", data)
+        changed = _write(tmp_path / "c.wav", data[:-1] + b"\0")
+
+        assert content_fingerprint(a) == content_fingerprint(b)
+        assert content_fingerprint(a).split(":")[1] == "s"
+        assert content_fingerprint(a, full=True).split(":")[1] == "f"
+        # L'ultimo blocco è sempre campionato
+        assert content_fingerprint(a) != content_fingerprint(changed)
+        assert content_fingerprint(tmp_path / "missing.wav") is None
+
+    def test_index_hashes_only_on_size_collision(self, tmp_path):
+        """Test che i file senza altri della stessa dimensione non vengano letti."""
+        a = _write(tmp_path / "a.wav", b"x" * 100)
+        b = _write(tmp_path / "b.wav", b"y" * 200)
+        copy = _write(tmp_path / "copy.wav", b"x" * 100)
+        other = _write(tmp_path / "other.wav", b"z" * 100)
+        index = ContentIndex()
+
+        with patch.object(fingerprint, "content_fingerprint", wraps=content_fingerprint) as spy:
+            assert index.add(a) is None
+            assert index.add(b) is None
+            assert spy.call_count == 0
+            assert index.add(copy) == a
+            assert index.add(other) is None
+        assert index.duplicates == 1
+
+    @pytest.mark.skipif(not hasattr(os, "link"), reason="hardlink non disponibili")
+    def test_index_recognizes_hardlinks_without_hashing(self, tmp_path):
+        """Test di file collegati (stesso inode) riconosciuti senza leggerli."""
+        a = _write(tmp_path / "a.wav", b"x" * 100)
+        os.link(a, tmp_path / "link.wav")
+        index = ContentIndex()
+
+        with patch.object(fingerprint, "content_fingerprint") as spy:
+            index.add(a)
+            assert index.add(tmp_path / "link.wav") == a
+        spy.assert_not_called()
+
+
+def test_iter_analyze_probes_each_content_once(tmp_path):
+    """Test che l'analisi giri una volta per contenuto e le copie ne ereditino i metadati."""
+    with patch("subprocess.run") as mock_run:
+        mock_run.return_value = MagicMock(returncode=0)
+        analyzer = AudioAnalyzer()
+    paths = [
+        _write(tmp_path / "a.wav", b"track"),
+        _write(tmp_path / "crate1" / "a copy.wav", b"track"),
+        _write(tmp_path / "b.wav", b"other"),
+    ]
+
+    def fake_analyze(path):
+        return path, _metadata(path), None
+
+    with patch.object(analyzer, "_analyze_safe", side_effect=fake_analyze) as mock_analyze:
+        results = sorted(analyzer.iter_analyze(paths, dedupe=True))
+
+    assert mock_analyze.call_count == 2
+    assert [(i, p) for i, p, _, _ in results] == list(enumerate(paths))
+    assert results[1][2].filepath == paths[1]
+    assert results[1][2].filename == "a copy.wav"
+    assert analyzer.last_batch_stats["duplicates"] == 1
+
+
+@pytest.mark.parametrize("link", [False, True])
+def test_convert_batch_reuses_output_of_identical_source(tmp_path, link):
+    """Test che una copia non venga riconvertita ma riceva l'output dell'originale."""
+    with patch("subprocess.run") as mock_run:
+        mock_run.return_value = MagicMock(returncode=0)
+        converter = AudioConverter(max_workers=1, native_pcm=False, fsync=False)
+    out_dir = tmp_path / "out"
+    out_dir.mkdir()
+    results = []
+    for rel in ("a.wav", "crate/b.wav"):
+        source = _write(tmp_path / rel, b"identical")
+        results.append(
+            CompatibilityResult(
+                filepath=source,
+                metadata=_metadata(source),
+                status=CompatibilityStatus.CONVERTIBLE_LOSSLESS,
+                message="32-bit float",
+                conversion_plan=ConversionPlan("WAV", 48000, 24, "float → 24 bit"),
+                profile_id="cdj_2000_nxs",
+                profile_name="CDJ-2000 Nexus",
+            )
+        )
+
+    def fake_convert(result, output_dir=None, **kwargs):
+        output = output_dir / f"{result.filepath.stem}_CDJ.wav"
+        output.write_bytes(b"converted")
+        return ConversionResult(result.filepath, output, True, "Converted")
+
+    with patch.object(converter, "convert", side_effect=fake_convert) as mock_convert:
+        conversions = converter.convert_batch(
+            results, out_dir, dedupe=True, link_duplicates=link
+        )
+
+    assert mock_convert.call_count == 1
+    original, copy = conversions
+    assert copy.success and copy.duplicate_of == original.source_path
+    assert copy.output_path.read_bytes() == b"converted"
+    assert (copy.output_path.stat().st_nlink == 2) is link
+    assert converter.last_batch_stats["duplicates"] == 1
+    assert sorted(p.name for p in out_dir.iterdir() if p.suffix == ".wav") == [
+        "a_CDJ.wav", "b_CDJ.wav"
+    ]
+
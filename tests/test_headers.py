@@ -0,0 +1,174 @@
+"""Test per i parser nativi degli header audio."""
+
+import struct
+import wave
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from dr_cdj.analyzer import AudioAnalyzer
+from dr_cdj.headers import probe_header
+
+
+def _write_wav(path: Path, rate: int, bits: int, channels: int, frames: int, fmt_tag: int = 1):
+    block_align = bits // 8 * channels
+    data = b"\0" * (frames * block_align)
+    fmt = struct.pack("<HHIIHH", fmt_tag, channels, rate, rate * block_align, block_align, bits)
+    body = b"WAVE" + b"fmt " + struct.pack("<I", len(fmt)) + fmt
+    body += b"data" + struct.pack("<I", len(data)) + data
+    path.write_bytes(b"RIFF" + struct.pack("<I", len(body)) + body)
+
+
+def _extended(value: int) -> bytes:
+    exponent = value.bit_length() - 1
+    mantissa = value << (63 - exponent)
+    return struct.pack(">HQ", exponent + 16383, mantissa)
+
+
+def _write_aiff(path: Path, rate: int, bits: int, channels: int, frames: int):
+    data = b"\0" * (frames * channels * bits // 8)
+    comm = struct.pack(">hIh", channels, frames, bits) + _extended(rate)
+    ssnd = struct.pack(">II", 0, 0) + data
+    body = b"AIFF" + b"COMM" + struct.pack(">I", len(comm)) + comm
+    body += b"SSND" + struct.pack(">I", len(ssnd)) + ssnd
+    path.write_bytes(b"FORM" + struct.pack(">I", len(body)) + body)
+
+
+def _write_flac(path: Path, rate: int, bits: int, channels: int, frames: int):
+    packed = (rate << 44) | ((channels - 1) << 41) | ((bits - 1) << 36) | frames
+    streaminfo = struct.pack(">HH", 4096, 4096) + b"\0" * 6 + packed.to_bytes(8, "big")
+    streaminfo += b"\0" * 16
+    header = bytes([0x80]) + len(streaminfo).to_bytes(3, "big")
+    path.write_bytes(b"fLaC" + header + streaminfo + b"\0" * 1000)
+
+
+def _write_mp3_cbr(path: Path, frames: int):
+    # MPEG-1 Layer III, 320 kbit/s, 44.1 kHz, joint stereo, no padding
+    header = bytes([0xFF, 0xFB, 0xE0, 0x44])
+    frame_length = 144 * 320000 // 44100
+    frame = header + b"\0" * (frame_length - 4)
+    path.write_bytes(frame * frames)
+
+
+class TestProbeHeader:
+    """Test suite per probe_header."""
+
+    def test_wav_16bit(self, tmp_path):
+        """Test WAV 16-bit scritto dal modulo wave."""
+        path = tmp_path / "track.wav"
+        with wave.open(str(path), "wb") as w:
+            w.setnchannels(2)
+            w.setsampwidth(2)
+            w.setframerate(44100)
+            w.writeframes(b"\0" * 44100 * 4)
+
+        info = probe_header(path)
+
+        assert info.codec_name == "pcm_s16le"
+        assert info.sample_rate == 44100
+        assert info.bit_depth == 16
+        assert info.channels == 2
+        assert info.duration == pytest.approx(1.0)
+        assert info.data_size == 44100 * 4
+
+    def test_wav_float32(self, tmp_path):
+        """Test WAV 32-bit float."""
+        path = tmp_path / "float.wav"
+        _write_wav(path, 96000, 32, 2, 9600, fmt_tag=3)
+
+        info = probe_header(path)
+
+        assert info.codec_name == "pcm_f32le"
+        assert info.is_float is True
+        assert info.duration == pytest.approx(0.1)
+
+    def test_aiff_24bit(self, tmp_path):
+        """Test AIFF 24-bit big-endian."""
+        path = tmp_path / "track.aiff"
+        _write_aiff(path, 48000, 24, 2, 4800)
+
+        info = probe_header(path)
+
+        assert info.codec_name == "pcm_s24be"
+        assert info.sample_rate == 48000
+        assert info.bit_depth == 24
+        assert info.total_frames == 4800
+        assert info.data_size == 4800 * 6
+
+    def test_flac_streaminfo(self, tmp_path):
+        """Test FLAC STREAMINFO."""
+        path = tmp_path / "track.flac"
+        _write_flac(path, 96000, 24, 2, 96000 * 3)
+
+        info = probe_header(path)
+
+        assert info.codec_name == "flac"
+        assert info.sample_rate == 96000
+        assert info.bit_depth == 24
+        assert info.duration == pytest.approx(3.0)
+
+    def test_mp3_cbr(self, tmp_path):
+        """Test MP3 CBR senza tag Xing."""
+        path = tmp_path / "track.mp3"
+        _write_mp3_cbr(path, 100)
+
+        info = probe_header(path)
+
+        assert info.codec_name == "mp3"
+        assert info.sample_rate == 44100
+        assert info.bit_rate == 320000
+        assert info.duration == pytest.approx(100 * 1152 / 44100, rel=0.01)
+
+    def test_malformed_returns_none(self, tmp_path):
+        """Test che file troncati o sconosciuti restituiscano None."""
+        truncated = tmp_path / "broken.wav"
+        truncated.write_bytes(b"RIFF\0\0\0\0WAVEfmt ")
+        ogg = tmp_path / "track.ogg"
+        ogg.write_bytes(b"OggS" + b"\0" * 100)
+
+        assert probe_header(truncated) is None
+        assert probe_header(ogg) is None
+
+
+class TestNativeAnalyzer:
+    """Test del fast-path nativo in AudioAnalyzer."""
+
+    @pytest.fixture
+    def analyzer(self):
+        """Analyzer con ffprobe simulato."""
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0)
+            return AudioAnalyzer()
+
+    def test_matches_ffprobe_parsing(self, analyzer, tmp_path):
+        """Test che il parser nativo produca gli stessi metadati di ffprobe."""
+        path = tmp_path / "hires.wav"
+        _write_wav(path, 96000, 24, 2, 96000)
+        ffprobe_json = {
+            "format": {"format_name": "wav", "duration": "1.000000"},
+            "streams": [{
+                "codec_type": "audio",
+                "codec_name": "pcm_s24le",
+                "sample_fmt": "s32",
+                "sample_rate": "96000",
+                "channels": 2,
+                "bits_per_sample": 24,
+                "bit_rate": "4608000",
+            }],
+        }
+
+        with patch.object(analyzer, "_run_ffprobe") as probe:
+            native = analyzer.analyze(path)
+            probe.assert_not_called()
+
+        assert native == analyzer._parse_metadata(path, ffprobe_json)
+
+    def test_falls_back_to_ffprobe(self, analyzer, tmp_path):
+        """Test fallback su ffprobe per formati non gestiti."""
+        path = tmp_path / "track.ogg"
+        path.write_bytes(b"OggS" + b"\0" * 100)
+
+        with patch.object(analyzer, "_run_ffprobe", return_value="probed") as probe:
+            assert analyzer.analyze(path) == "probed"
+            probe.assert_called_once()
@@ -0,0 +1,196 @@
+"""Test per il journal delle conversioni batch."""
+
+import json
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from dr_cdj.converter import AudioConverter, ConversionResult
+from dr_cdj.journal import (
+    CACHED,
+    DONE,
+    FAILED,
+    PENDING,
+    RUNNING,
+    ConversionJournal,
+    JournalJob,
+)
+from dr_cdj.manifest import ConversionManifest
+from dr_cdj.staging import partial_paths, temp_path_for
+
+SETTINGS = [24, 48000, "WAV", False]
+
+
+def _jobs(tmp_path: Path, count: int) -> list[JournalJob]:
+    jobs = []
+    for job_id in range(count):
+        source = tmp_path / f"track{job_id}.wav"
+        source.write_bytes(b"source")
+        jobs.append(
+            JournalJob(
+                job_id=job_id,
+                source_path=source,
+                profile_id="cdj_2000_nxs",
+                plan={"output_format": "WAV"},
+                settings=SETTINGS,
+                output_path=tmp_path / "out" / f"track{job_id}_CDJ.wav",
+            )
+        )
+    return jobs
+
+
+class TestConversionJournal:
+    """Test suite per ConversionJournal."""
+
+    def test_completed_batch_is_not_resumable(self, tmp_path):
+        """Test che un batch chiuso con end_batch non venga proposto."""
+        journal = ConversionJournal(tmp_path / "journal.jsonl")
+        journal.start_batch(_jobs(tmp_path, 2))
+        journal.mark(0, RUNNING)
+        journal.mark(0, DONE)
+        journal.mark(1, RUNNING)
+        journal.mark(1, CACHED)
+        journal.end_batch()
+
+        assert ConversionJournal(tmp_path / "journal.jsonl").load_interrupted() is None
+
+    def test_interrupted_batch_requeues_unfinished_jobs(self, tmp_path):
+        """Test ripresa: solo job pending/running/failed, riga troncata ignorata."""
+        path = tmp_path / "journal.jsonl"
+        journal = ConversionJournal(path)
+        journal.start_batch(_jobs(tmp_path, 4), tmp_path / "out")
+        journal.mark(0, RUNNING)
+        journal.mark(0, DONE)
+        journal.mark(1, RUNNING)
+        journal.mark(1, FAILED, "ffmpeg error")
+        journal.mark(2, RUNNING)
+        journal.close()
+        with open(path, "a") as f:
+            f.write('{"type": "job", "job_id": 2, "sta')
+
+        batch = ConversionJournal(path).load_interrupted()
+
+        assert batch.output_dir == tmp_path / "out"
+        assert batch.finished == 1
+        assert [(j.job_id, j.state) for j in batch.remaining] == [
+            (1, FAILED),
+            (2, RUNNING),
+            (3, PENDING),
+        ]
+        assert batch.remaining[0].message == "ffmpeg error"
+
+    def test_remove_partial_outputs(self, tmp_path):
+        """Test che vengano rimossi solo i file temporanei, mai l'output finale."""
+        path = tmp_path / "journal.jsonl"
+        jobs = _jobs(tmp_path, 3)
+        partials = []
+        for job in jobs:
+            temp = temp_path_for(job.output_path)
+            temp.write_bytes(b"partial")
+            partials.append(temp)
+
+        journal = ConversionJournal(path)
+        journal.start_batch(jobs)
+        journal.mark(0, RUNNING)
+        journal.mark(1, RUNNING)
+        journal.mark(1, FAILED, "ffmpeg error")
+        journal.close()
+
+        batch = journal.load_interrupted()
+        removed = ConversionJournal.remove_partial_outputs(batch)
+
+        assert removed == partials[:2]
+        assert partials[2].exists()  # Job mai avviato: non è un file di questo batch
+
+    def test_good_output_survives_failed_job_and_resume(self, tmp_path):
+        """Test che un output valido di una run precedente sopravviva a fallimento e ripresa."""
+        path = tmp_path / "journal.jsonl"
+        jobs = _jobs(tmp_path, 2)
+        manifest = ConversionManifest(tmp_path / "out")
+        for job in jobs:
+            job.output_path.parent.mkdir(exist_ok=True)
+            job.output_path.write_bytes(b"good output")
+            manifest.record(job.source_path, job.output_path, tuple(SETTINGS))
+            # Come in _convert: la voce del manifest viene dimenticata all'avvio del job
+            manifest.forget(job.output_path)
+            temp_path_for(job.output_path).write_bytes(b"half written")
+
+        journal = ConversionJournal(path)
+        journal.start_batch(jobs)
+        journal.mark(0, RUNNING)
+        journal.mark(0, FAILED, "ffmpeg error")
+        journal.mark(1, RUNNING)  # Interrotto
+        journal.close()
+
+        batch = ConversionJournal(path).load_interrupted()
+        ConversionJournal.remove_partial_outputs(batch)
+
+        for job in jobs:
+            assert job.output_path.read_bytes() == b"good output"
+            assert partial_paths(job.output_path) == []
+
+    def test_remove_partial_outputs_bracketed_name_and_stage_dir(self, tmp_path):
+        """Test con nomi tra parentesi quadre e temporanei nella cartella di staging."""
+        path = tmp_path / "journal.jsonl"
+        stage_dir = tmp_path / "stage"
+        source = tmp_path / "b [Remix].wav"
+        source.write_bytes(b"source")
+        output = tmp_path / "out" / "b [Remix]_CDJ.wav"
+        job = JournalJob(0, source, "cdj_2000_nxs", {}, SETTINGS, output)
+        partials = sorted([temp_path_for(output), temp_path_for(output, stage_dir)])
+        for temp in partials:
+            temp.write_bytes(b"partial")
+        other = temp_path_for(tmp_path / "out" / "b_CDJ.wav")
+        other.write_bytes(b"partial")
+
+        journal = ConversionJournal(path)
+        journal.start_batch([job], stage_dir=stage_dir)
+        journal.mark(0, RUNNING)
+        journal.close()
+
+        batch = journal.load_interrupted()
+        assert batch.stage_dir == stage_dir
+        assert sorted(ConversionJournal.remove_partial_outputs(batch)) == partials
+        assert not any(temp.exists() for temp in partials)
+        assert other.exists()
+
+
+def test_convert_batch_writes_journal(tmp_path):
+    """Test che convert_batch registri inizio, esito e fine di ogni job."""
+    with patch("subprocess.run") as mock_run:
+        mock_run.return_value = MagicMock(returncode=0)
+        converter = AudioConverter(max_workers=1)
+
+    results = []
+    for name, duration in (("a.wav", 10.0), ("b.wav", 20.0)):
+        source = tmp_path / name
+        source.write_bytes(b"source")
+        result = MagicMock(filepath=source, needs_conversion=True, profile_id="cdj_2000_nxs")
+        result.metadata.duration = duration
+        results.append(result)
+
+    def fake_convert(result, output_dir=None, **kwargs):
+        return ConversionResult(
+            source_path=result.filepath,
+            output_path=None,
+            success=result.filepath.name == "a.wav",
+            message="boom",
+        )
+
+    journal = ConversionJournal(tmp_path / "journal.jsonl")
+    with patch.object(converter, "convert", side_effect=fake_convert), \
+            patch.object(converter, "estimate_job_cost", side_effect=lambda r: r.metadata.duration), \
+            patch.object(converter, "_journal_job", side_effect=lambda i, r, d: JournalJob(
+                i, r.filepath, r.profile_id, {}, SETTINGS, None)):
+        converter.convert_batch(results, journal=journal)
+
+    records = [json.loads(line) for line in journal.path.read_text().splitlines()]
+    assert records[0]["type"] == "batch"
+    # Il più lungo (b.wav) parte per primo
+    assert [job["source_path"] for job in records[0]["jobs"]] == [
+        str(tmp_path / "b.wav"), str(tmp_path / "a.wav")
+    ]
+    assert [(r["job_id"], r["state"]) for r in records[1:-1]] == [
+        (0, RUNNING), (0, FAILED), (1, RUNNING), (1, DONE)
+    ]
+    assert records[-1]["type"] == "end"
+    assert journal.load_interrupted() is None
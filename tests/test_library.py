@@ -0,0 +1,123 @@
+"""Test per la tabella colonnare LibraryTable."""
+
+import gc
+import tracemalloc
+from pathlib import Path
+
+import pytest
+
+from dr_cdj.analyzer import AudioMetadata
+from dr_cdj.compatibility import CompatibilityEngine, CompatibilityStatus
+from dr_cdj.library import LibraryTable
+
+KINDS = [
+    ("MP3", "mp3", ".mp3", 44100, None, True, False),
+    ("WAV", "pcm_s24le", ".wav", 48000, 24, False, False),
+    ("WAV", "pcm_f32le", ".wav", 96000, 32, False, True),
+    ("FLAC", "flac", ".flac", 44100, 16, False, False),
+]
+
+
+def _metadata(count: int) -> list[AudioMetadata]:
+    tracks = []
+    for i in range(count):
+        fmt, codec, suffix, rate, depth, lossy, is_float = KINDS[i % len(KINDS)]
+        path = Path(f"/music/crate {i // 100}") / f"{i:05d} - Artist - Title{suffix}"
+        tracks.append(
+            AudioMetadata(
+                filepath=path,
+                filename=path.name,
+                format_name=fmt,
+                codec=codec,
+                sample_rate=rate,
+                bit_depth=depth,
+                channels=2,
+                bitrate=320000 if lossy else None,
+                duration=None if i == 0 else 180.0 + i,
+                is_lossy=lossy,
+                is_float=is_float,
+            )
+        )
+    return tracks
+
+
+def test_rows_round_trip():
+    """Test che le righe ricostruiscano risultati identici agli originali."""
+    engine = CompatibilityEngine()
+    results = [engine.check(m) for m in _metadata(20)]
+
+    table = LibraryTable.from_results(results)
+
+    assert len(table) == 20
+    assert [table.result(i) for i in range(20)] == results
+    row = table[2]
+    assert row.filepath == results[2].filepath
+    assert row.status == results[2].status and row.needs_conversion
+    assert row.conversion_plan is table[6].conversion_plan  # Piani condivisi
+    assert table[0].duration is None
+
+
+def test_set_verdict_and_counts():
+    """Test dell'aggiornamento del verdetto e del conteggio per stato."""
+    engine = CompatibilityEngine()
+    results = [engine.check(m) for m in _metadata(8)]
+    table = LibraryTable.from_results(results)
+
+    assert not table.set_verdict(0, results[0])
+    assert table.set_verdict(0, results[2])
+    assert table[0].status == CompatibilityStatus.CONVERTIBLE_LOSSLESS
+    expected = 1 + sum(r.status == CompatibilityStatus.CONVERTIBLE_LOSSLESS for r in results)
+    assert table.status_counts()[CompatibilityStatus.CONVERTIBLE_LOSSLESS] == expected
+
+    other = CompatibilityEngine("xdj_1000_mk2")
+    with pytest.raises(ValueError):
+        table.append(other.check(results[0].metadata))
+    with pytest.raises(ValueError):
+        table.set_verdict(0, other.check(results[0].metadata))
+
+
+def test_recheck_switches_profile():
+    """Test che recheck rivaluti le righe e riporti il nuovo profilo."""
+    engine = CompatibilityEngine()
+    metadata = _metadata(24)
+    table = LibraryTable.from_results([engine.check(m) for m in metadata])
+
+    other = CompatibilityEngine("xdj_1000_mk2")
+    changed = table.recheck(other)
+
+    expected = [other.check(m) for m in metadata]
+    assert [table.result(i) for i in range(len(table))] == expected
+    assert table.result(0).profile_id == "xdj_1000_mk2"
+    assert table.result(0).profile_name == other.profile.name
+    before = [engine.check(m) for m in metadata]
+    assert changed == {
+        i
+        for i, (old, new) in enumerate(zip(before, expected, strict=True))
+        if (old.status, old.message, old.conversion_plan)
+        != (new.status, new.message, new.conversion_plan)
+    }
+    assert table[3].status == CompatibilityStatus.COMPATIBLE  # FLAC nativo sull'XDJ
+    assert not table.recheck(other)
+
+
+def test_table_uses_much_less_memory_than_objects():
+    """Test che la tabella occupi molto meno degli oggetti CompatibilityResult."""
+    engine = CompatibilityEngine()
+
+    def measure(build):
+        gc.collect()
+        tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+        built = build()
+        gc.collect()
+        used = tracemalloc.get_traced_memory()[0] - before
+        tracemalloc.stop()
+        return built, used
+
+    results, objects_bytes = measure(lambda: [engine.check(m) for m in _metadata(3000)])
+    table, table_bytes = measure(
+        lambda: LibraryTable.from_results(engine.check(m) for m in _metadata(3000))
+    )
+
+    assert len(table) == len(results)
+    assert table_bytes * 3 < objects_bytes
@@ -0,0 +1,115 @@
+"""Test per ConversionManifest e per la conversione incrementale."""
+
+import os
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from dr_cdj.analyzer import AudioMetadata
+from dr_cdj.compatibility import CompatibilityResult, CompatibilityStatus, ConversionPlan
+from dr_cdj.converter import AudioConverter
+from dr_cdj.manifest import MANIFEST_NAME, ConversionManifest
+
+SETTINGS = (24, 48000, "WAV", True)
+
+
+def _touch(path: Path, data: bytes = b"data", mtime_ns: int | None = None) -> Path:
+    path.write_bytes(data)
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+    return path
+
+
+class TestConversionManifest:
+    """Test suite per ConversionManifest."""
+
+    def test_roundtrip_and_persistence(self, tmp_path):
+        """Test che un output registrato risulti aggiornato anche dopo il reload."""
+        source = _touch(tmp_path / "a.flac")
+        output = _touch(tmp_path / "a_CDJ.wav")
+
+        ConversionManifest(tmp_path).record(source, output, SETTINGS)
+
+        manifest = ConversionManifest(tmp_path)
+        assert (tmp_path / MANIFEST_NAME).exists()
+        assert len(manifest) == 1
+        assert manifest.is_up_to_date(source, output, SETTINGS)
+
+    def test_invalidation(self, tmp_path):
+        """Test che sorgente, impostazioni o output modificati invalidino la voce."""
+        source = _touch(tmp_path / "a.flac", mtime_ns=1_000_000_000)
+        output = _touch(tmp_path / "a_CDJ.wav", mtime_ns=1_000_000_000)
+        manifest = ConversionManifest(tmp_path)
+        manifest.record(source, output, SETTINGS)
+
+        assert not manifest.is_up_to_date(source, output, (16, 44100, "WAV", False))
+
+        _touch(output, b"edited!!", mtime_ns=2_000_000_000)
+        assert not manifest.is_up_to_date(source, output, SETTINGS)
+
+        manifest.record(source, output, SETTINGS)
+        _touch(source, b"new source", mtime_ns=3_000_000_000)
+        assert not manifest.is_up_to_date(source, output, SETTINGS)
+
+        output.unlink()
+        assert not manifest.is_up_to_date(source, output, SETTINGS)
+
+    def test_corrupt_manifest_is_ignored(self, tmp_path):
+        """Test che un manifest illeggibile venga trattato come vuoto."""
+        (tmp_path / MANIFEST_NAME).write_text("{not json")
+        assert len(ConversionManifest(tmp_path)) == 0
+
+
+class TestIncrementalConversion:
+    """Test suite per lo skip delle conversioni già fatte."""
+
+    @staticmethod
+    def _result(source: Path) -> CompatibilityResult:
+        metadata = AudioMetadata(
+            filepath=source,
+            filename=source.name,
+            format_name="FLAC",
+            codec="FLAC",
+            sample_rate=96000,
+            bit_depth=24,
+            channels=2,
+            bitrate=None,
+            duration=10.0,
+            is_lossy=False,
+            is_float=False,
+        )
+        return CompatibilityResult(
+            filepath=source,
+            metadata=metadata,
+            status=CompatibilityStatus.CONVERTIBLE_LOSSLESS,
+            message="FLAC → WAV",
+            profile_id="cdj_2000_nxs",
+            profile_name="CDJ-2000 Nexus",
+            conversion_plan=ConversionPlan("WAV", 48000, 24, "test"),
+        )
+
+    @staticmethod
+    def _fake_popen(cmd, **kwargs):
+        Path(cmd[-1]).write_bytes(b"converted")
+        process = MagicMock(stderr=[])
+        process.wait.return_value = 0
+        return process
+
+    def test_second_run_is_a_cache_hit(self, tmp_path):
+        """Test che la seconda conversione venga saltata, e rifatta con force."""
+        source = _touch(tmp_path / "set.flac")
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0)
+            converter = AudioConverter()
+
+        with patch.object(converter, "_verify_output", return_value=True), \
+                patch("subprocess.Popen", side_effect=self._fake_popen) as mock_popen:
+            first = converter.convert(self._result(source))
+            second = converter.convert(self._result(source))
+            forced = converter.convert(self._result(source), force=True)
+
+        assert first.success and not first.cached
+        assert second.success and second.cached
+        assert second.output_path == first.output_path
+        assert forced.success and not forced.cached
+        assert mock_popen.call_count == 2
+        assert converter.get_conversion_summary([first, second, forced])["cached"] == 1
@@ -0,0 +1,178 @@
+"""Test per il motore PCM nativo (conversioni di bit depth/endianness)."""
+
+import shutil
+import struct
+import subprocess
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from dr_cdj import pcm  # noqa: E402
+from dr_cdj.headers import probe_header  # noqa: E402
+
+
+def _write_wav(path: Path, samples, rate: int = 44100, float_data: bool = False,
+               extra: bytes = b""):
+    """Scrive un WAV da un array (frames, canali) int16/int32 o float32."""
+    channels = samples.shape[1]
+    bits = samples.dtype.itemsize * 8
+    block_align = samples.dtype.itemsize * channels
+    data = samples.astype(samples.dtype.newbyteorder("<")).tobytes()
+    fmt = struct.pack("<HHIIHH", 3 if float_data else 1, channels, rate,
+                      rate * block_align, block_align, bits)
+    body = b"WAVE" + b"fmt " + struct.pack("<I", len(fmt)) + fmt + extra
+    body += b"data" + struct.pack("<I", len(data)) + data
+    path.write_bytes(b"RIFF" + struct.pack("<I", len(body)) + body)
+
+
+def _read_pcm(path: Path):
+    """Legge i campioni interi (allineati a destra) di un WAV/AIFF 16/24 bit."""
+    info = probe_header(path)
+    bits = info.bit_depth
+    raw = np.fromfile(path, dtype=np.uint8, count=info.data_size, offset=info.data_offset)
+    big_endian = info.codec_name.endswith("be")
+    if bits == 16:
+        return raw.view(">i2" if big_endian else "<i2").astype(np.int32)
+    triplets = raw.reshape(-1, 3).astype(np.int32)
+    if big_endian:
+        triplets = triplets[:, ::-1]
+    values = triplets[:, 0] | (triplets[:, 1] << 8) | (triplets[:, 2] << 16)
+    return np.where(values >= 1 << 23, values - (1 << 24), values)
+
+
+def _as_int24(samples):
+    """Restituisce un array di tipo 'V3' con i campioni int32 come PCM 24 bit LE."""
+    raw = samples.astype("<i4").view(np.uint8).reshape(-1, 4)[:, :3]
+    return np.ascontiguousarray(raw).view("V3").reshape(samples.shape)
+
+
+def _signal(frames: int = 30000):
+    t = np.arange(frames) / 44100
+    return np.stack([np.sin(2 * np.pi * 440 * t), 0.5 * np.cos(2 * np.pi * 97 * t)], axis=1)
+
+
+class TestConversion:
+    """Test suite per le conversioni."""
+
+    def test_widening_is_exact(self, tmp_path):
+        """Test 16 bit WAV → 24 bit AIFF: nessun dither, valori identici × 256."""
+        source = (_signal() * 30000).astype(np.int16)
+        _write_wav(tmp_path / "in.wav", source)
+
+        pcm.convert(tmp_path / "in.wav", tmp_path / "out.aiff", 24, "AIFF")
+
+        info = probe_header(tmp_path / "out.aiff")
+        assert info.codec_name == "pcm_s24be"
+        assert info.sample_rate == 44100 and info.channels == 2
+        assert info.total_frames == len(source)
+        assert np.array_equal(_read_pcm(tmp_path / "out.aiff"), source.ravel().astype(np.int32) << 8)
+
+    def test_float_to_24bit_within_dither(self, tmp_path):
+        """Test float32 → 24 bit WAV entro l'ampiezza del dither TPDF."""
+        source = (_signal() * 0.9).astype(np.float32)
+        _write_wav(tmp_path / "in.wav", source, float_data=True)
+        progress = []
+
+        pcm.convert(tmp_path / "in.wav", tmp_path / "out.wav", 24, "WAV",
+                    lambda *event: progress.append(event))
+
+        expected = source.ravel().astype(np.float64) * (1 << 23)
+        diff = np.abs(_read_pcm(tmp_path / "out.wav") - expected)
+        assert probe_header(tmp_path / "out.wav").codec_name == "pcm_s24le"
+        assert diff.max() <= 2
+        assert progress[-1][0] == 1.0
+
+    def test_tpdf_noise_floor(self, tmp_path):
+        """Test del rumore di requantizzazione TPDF 24 → 16 bit: RMS 0.5 LSB, media nulla."""
+        rng = np.random.default_rng(7)
+        # Segnale a basso livello con parte frazionaria (in LSB a 16 bit) casuale
+        source = (_signal(60000) * 4 * 256 + rng.uniform(-128, 128, (60000, 2))).astype(np.int32)
+        _write_wav(tmp_path / "in.wav", _as_int24(source))
+
+        pcm.convert(tmp_path / "in.wav", tmp_path / "out.wav", 16, "WAV")
+
+        exact = source.ravel() / 256.0
+        error = _read_pcm(tmp_path / "out.wav") - exact
+        # Arrotondamento (1/12) + TPDF triangolare ±1 LSB (1/6) = 1/4 LSB²
+        assert abs(error.mean()) < 0.01
+        assert 0.47 < np.sqrt(np.mean(error**2)) < 0.53
+        assert np.abs(error).max() < 1.5
+        assert abs(np.corrcoef(error, exact)[0, 1]) < 0.02
+
+    def test_clipping_and_metadata_chunks(self, tmp_path):
+        """Test che i campioni fuori scala vengano limitati e i tag copiati."""
+        source = np.array([[2.0, -2.0], [0.0, 0.0]], dtype=np.float32)
+        tags = b"LIST" + struct.pack("<I", 12) + b"INFOINAM" + struct.pack("<I", 0)
+        _write_wav(tmp_path / "in.wav", source, float_data=True, extra=tags)
+
+        pcm.convert(tmp_path / "in.wav", tmp_path / "out.wav", 16, "WAV")
+
+        assert list(_read_pcm(tmp_path / "out.wav")[:2]) == [32767, -32768]
+        assert tags in (tmp_path / "out.wav").read_bytes()
+
+
+class TestCanConvert:
+    """Test suite per la selezione del motore."""
+
+    def test_eligibility(self, tmp_path):
+        """Test che servano PCM WAV/AIFF, nessun resampling e tag trasferibili."""
+        _write_wav(tmp_path / "in.wav", np.zeros((10, 2), dtype=np.int16))
+        tagged = tmp_path / "tagged.wav"
+        tags = b"LIST" + struct.pack("<I", 4) + b"INFO"
+        _write_wav(tagged, np.zeros((10, 2), dtype=np.int16), extra=tags)
+
+        assert pcm.can_convert(tmp_path / "in.wav", 24, "AIFF", False)
+        assert not pcm.can_convert(tmp_path / "in.wav", 24, "WAV", True)
+        assert not pcm.can_convert(tmp_path / "in.wav", 16, "FLAC", False)
+        # Il chunk LIST non ha equivalente in AIFF: meglio ffmpeg
+        assert pcm.can_convert(tagged, 24, "WAV", False)
+        assert not pcm.can_convert(tagged, 24, "AIFF", False)
+
+
+@pytest.mark.skipif(shutil.which("ffmpeg") is None, reason="ffmpeg non disponibile")
+@pytest.mark.parametrize("output_format,codec", [("WAV", "pcm_s24le"), ("AIFF", "pcm_s24be")])
+def test_matches_ffmpeg_reference(tmp_path, output_format, codec):
+    """Test che l'audio coincida con quello prodotto da ffmpeg (16 → 24 bit)."""
+    source = (_signal() * 30000).astype(np.int16)
+    _write_wav(tmp_path / "in.wav", source, rate=96000)
+    suffix = ".wav" if output_format == "WAV" else ".aiff"
+    ours, reference = tmp_path / f"ours{suffix}", tmp_path / f"ref{suffix}"
+
+    pcm.convert(tmp_path / "in.wav", ours, 24, output_format)
+    subprocess.run(
+        ["ffmpeg", "-y", "-loglevel", "error", "-i", str(tmp_path / "in.wav"),
+         "-c:a", codec, "-sample_fmt", "s32", str(reference)],
+        check=True,
+    )
+
+    ours_info, ref_info = probe_header(ours), probe_header(reference)
+    assert ours_info.codec_name == ref_info.codec_name
+    assert ours_info.sample_rate == ref_info.sample_rate
+    assert np.array_equal(_read_pcm(ours), _read_pcm(reference))
+
+
+@pytest.mark.skipif(shutil.which("ffmpeg") is None, reason="ffmpeg non disponibile")
+@pytest.mark.parametrize("case", ["float32_to_24", "24_to_16"])
+def test_lossy_paths_match_ffmpeg_within_dither(tmp_path, case):
+    """Test float32 → 24 e 24 → 16 bit contro ffmpeg: differenza massima ≤ 2 LSB."""
+    if case == "float32_to_24":
+        _write_wav(tmp_path / "in.wav", (_signal() * 0.9).astype(np.float32), float_data=True)
+        depth, codec = 24, "pcm_s24le"
+    else:
+        _write_wav(tmp_path / "in.wav", _as_int24((_signal() * 0.9 * (1 << 23)).astype(np.int32)))
+        depth, codec = 16, "pcm_s16le"
+    ours, reference = tmp_path / "ours.wav", tmp_path / "ref.wav"
+
+    pcm.convert(tmp_path / "in.wav", ours, depth, "WAV")
+    subprocess.run(
+        ["ffmpeg", "-y", "-loglevel", "error", "-i", str(tmp_path / "in.wav"),
+         "-c:a", codec, str(reference)],
+        check=True,
+    )
+
+    ours_samples, ref_samples = _read_pcm(ours), _read_pcm(reference)
+    assert probe_header(ours).codec_name == probe_header(reference).codec_name == codec
+    assert len(ours_samples) == len(ref_samples)
+    assert np.abs(ours_samples - ref_samples).max() <= 2
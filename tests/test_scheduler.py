@@ -0,0 +1,105 @@
+"""Test per il modello di costo e lo scheduling dei batch di conversione."""
+
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from dr_cdj.analyzer import AudioMetadata
+from dr_cdj.compatibility import CompatibilityResult, CompatibilityStatus, ConversionPlan
+from dr_cdj.converter import AudioConverter, ConversionResult
+from dr_cdj.scheduler import estimate_cost, longest_first, predict_makespan
+
+
+def _metadata(name: str, duration: float, codec: str = "FLAC", rate: int = 44100):
+    return AudioMetadata(
+        filepath=Path(f"/music/{name}"),
+        filename=name,
+        format_name=codec,
+        codec=codec,
+        sample_rate=rate,
+        bit_depth=24,
+        channels=2,
+        bitrate=None,
+        duration=duration,
+        is_lossy=False,
+        is_float=False,
+    )
+
+
+def _result(name: str, duration: float) -> CompatibilityResult:
+    metadata = _metadata(name, duration)
+    return CompatibilityResult(
+        filepath=metadata.filepath,
+        metadata=metadata,
+        status=CompatibilityStatus.CONVERTIBLE_LOSSLESS,
+        message="FLAC → WAV",
+        profile_id="cdj_2000_nxs",
+        profile_name="CDJ-2000 Nexus",
+        conversion_plan=ConversionPlan("WAV", 44100, 24, "test"),
+    )
+
+
+class TestCostModel:
+    """Test suite per estimate_cost e predict_makespan."""
+
+    def test_cost_grows_with_work(self):
+        """Test che durata, resample e codec aumentino il costo stimato."""
+        short = estimate_cost(_metadata("a", 60), False, "WAV")
+        long = estimate_cost(_metadata("b", 600), False, "WAV")
+        resampled = estimate_cost(_metadata("c", 60, rate=96000), True, "WAV")
+        pcm = estimate_cost(_metadata("d", 60, codec="PCM_S24LE"), False, "WAV")
+
+        assert long == pytest.approx(short * 10)
+        assert resampled > short
+        assert pcm < short
+
+    def test_longest_first_reduces_makespan(self):
+        """Test che LPT eviti la coda lunga di un job lungo inviato per ultimo."""
+        costs = [1.0] * 8 + [8.0]
+
+        assert predict_makespan(costs, 2) == pytest.approx(12.0)
+        assert predict_makespan(longest_first(costs, costs), 2) == pytest.approx(8.0)
+
+
+class TestBatchScheduling:
+    """Test suite per l'ordine di esecuzione di convert_batch."""
+
+    def test_batch_runs_longest_first_and_records_stats(self):
+        """Test ordine longest-first e statistiche previsto/reale."""
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0)
+            converter = AudioConverter(max_workers=1)
+
+        order = []
+
+        def fake_convert(result, output_dir=None, **kwargs):
+            order.append(result.filepath.name)
+            return ConversionResult(result.filepath, None, True, "OK", duration=0.01)
+
+        batch = [_result("short.flac", 60), _result("mix.flac", 5400), _result("mid.flac", 300)]
+        with patch.object(converter, "convert", side_effect=fake_convert):
+            converter.convert_batch(batch)
+
+        stats = converter.last_batch_stats
+        assert order == ["mix.flac", "mid.flac", "short.flac"]
+        assert stats["files"] == 3
+        assert stats["predicted_time"] > 0
+        assert stats["actual_time"] > 0
+        assert stats["job_mean_relative_error"] is not None
+
+    def test_adaptive_batch_completes(self):
+        """Test che un batch adattivo completi tutti i job e registri il limite finale."""
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0)
+            converter = AudioConverter(max_workers=1, adaptive=True, worker_ceiling=3)
+
+        def fake_convert(result, output_dir=None, **kwargs):
+            return ConversionResult(result.filepath, None, True, "OK", duration=0.01)
+
+        batch = [_result(f"t{i}.flac", 60 + i) for i in range(6)]
+        with patch.object(converter, "convert", side_effect=fake_convert):
+            conversions = converter.convert_batch(batch)
+
+        assert len(conversions) == 6
+        assert 1 <= converter.last_batch_stats["final_workers"] <= 3
@@ -0,0 +1,127 @@
+"""Test per le scritture atomiche degli output."""
+
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from dr_cdj import staging
+from dr_cdj.analyzer import AudioMetadata
+from dr_cdj.compatibility import CompatibilityResult, CompatibilityStatus, ConversionPlan
+from dr_cdj.converter import AudioConverter
+from dr_cdj.journal import ConversionJournal, JournalJob
+
+
+class TestStaging:
+    """Test suite per temp_path_for/commit."""
+
+    def test_temp_path_is_hidden_and_keeps_extension(self, tmp_path):
+        """Test che il nome temporaneo sia nascosto e mantenga l'estensione."""
+        output = tmp_path / "track_CDJ.aiff"
+        temp = staging.temp_path_for(output)
+
+        assert temp.parent == tmp_path
+        assert temp.name.startswith(".track_CDJ")
+        assert temp.suffix == ".aiff"
+        assert temp != staging.temp_path_for(output)
+
+        temp.write_bytes(b"partial")
+        assert staging.partial_paths(output) == [temp]
+
+    def test_commit_replaces_output(self, tmp_path):
+        """Test che commit sostituisca l'output esistente senza lasciare temporanei."""
+        output = tmp_path / "track_CDJ.wav"
+        output.write_bytes(b"old")
+        temp = staging.temp_path_for(output)
+        temp.write_bytes(b"new")
+
+        staging.commit(temp, output)
+
+        assert output.read_bytes() == b"new"
+        assert list(tmp_path.iterdir()) == [output]
+
+    def test_commit_from_stage_dir(self, tmp_path):
+        """Test di un output preparato in una directory locale e poi copiato a blocchi."""
+        stage, dest = tmp_path / "stage", tmp_path / "usb"
+        dest.mkdir()
+        output = dest / "track_CDJ.wav"
+        temp = staging.temp_path_for(output, stage)
+        temp.write_bytes(bytes(range(256)) * 100)
+
+        staging.commit(temp, output, fsync=False)
+
+        assert output.read_bytes() == bytes(range(256)) * 100
+        assert not temp.exists()
+        assert list(dest.iterdir()) == [output]
+
+
+def test_failed_conversion_keeps_previous_output(tmp_path):
+    """Test che un output non verificato non sostituisca quello esistente."""
+    with patch("subprocess.run") as mock_run:
+        mock_run.return_value = MagicMock(returncode=0)
+        converter = AudioConverter(native_pcm=False)
+
+    source = tmp_path / "track.flac"
+    source.write_bytes(b"source")
+    metadata = AudioMetadata(
+        filepath=source,
+        filename=source.name,
+        format_name="FLAC",
+        codec="FLAC",
+        sample_rate=96000,
+        bit_depth=24,
+        channels=2,
+        bitrate=None,
+        duration=60.0,
+        is_lossy=False,
+        is_float=False,
+    )
+    result = CompatibilityResult(
+        filepath=source,
+        metadata=metadata,
+        status=CompatibilityStatus.CONVERTIBLE_LOSSLESS,
+        message="96 kHz",
+        conversion_plan=ConversionPlan("WAV", 48000, 24, "96 kHz → 48 kHz"),
+        profile_id="cdj_2000_nxs",
+        profile_name="CDJ-2000 Nexus",
+    )
+    out_dir = tmp_path / "out"
+    out_dir.mkdir()
+    previous = out_dir / "track_CDJ.wav"
+    previous.write_bytes(b"previous")
+
+    def fake_ffmpeg(cmd, *args):
+        Path(cmd[-1]).write_bytes(b"truncated")
+        return 0, []
+
+    with patch.object(converter, "_run_ffmpeg", side_effect=fake_ffmpeg), \
+            patch.object(converter, "_verify_output", return_value=False):
+        conversion = converter.convert(result, out_dir, force=True)
+    assert not conversion.success
+    assert previous.read_bytes() == b"previous"
+    assert sorted(p.name for p in out_dir.iterdir() if p.suffix == ".wav") == ["track_CDJ.wav"]
+
+    with patch.object(converter, "_run_ffmpeg", side_effect=fake_ffmpeg), \
+            patch.object(converter, "_verify_output", return_value=True):
+        conversion = converter.convert(result, out_dir, force=True)
+    assert conversion.success
+    assert previous.read_bytes() == b"truncated"
+
+
+@pytest.mark.parametrize("state", ["running", "failed"])
+def test_resume_removes_leftover_temp_files(tmp_path, state):
+    """Test che la ripresa rimuova i file temporanei dei job interrotti."""
+    source = tmp_path / "track.wav"
+    source.write_bytes(b"source")
+    output = tmp_path / "out" / "track_CDJ.wav"
+    temp = staging.temp_path_for(output)
+    temp.write_bytes(b"partial")
+
+    journal = ConversionJournal(tmp_path / "journal.jsonl")
+    journal.start_batch([JournalJob(0, source, None, {}, [24, 48000, "WAV", False], output)])
+    journal.mark(0, state)
+    journal.close()
+
+    removed = ConversionJournal.remove_partial_outputs(journal.load_interrupted())
+    assert removed == [temp]
+    assert not temp.exists()
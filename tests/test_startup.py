@@ -0,0 +1,109 @@
+"""Test per il profiler di avvio e il tempo di import."""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from dr_cdj.startup import PROFILE_ENV_VAR, StartupProfiler
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+
+# Limite generoso: l'import misurato oggi richiede poche decine di ms
+IMPORT_BUDGET_SECONDS = 1.0
+
+
+def _run_python(code: str) -> dict:
+    """Esegue ``code`` in un interprete nuovo e restituisce il JSON stampato."""
+    env = dict(os.environ, PYTHONPATH=str(SRC_DIR))
+    env.pop(PROFILE_ENV_VAR, None)
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, env=env, check=True
+    ).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+class TestStartupProfiler:
+    """Test suite per StartupProfiler."""
+
+    def test_disabled_by_default(self, monkeypatch):
+        """Test che senza variabile d'ambiente il profiler non registri nulla."""
+        monkeypatch.delenv(PROFILE_ENV_VAR, raising=False)
+        profiler = StartupProfiler.from_environment(Path("unused.json"))
+
+        with profiler.phase("logging"):
+            pass
+        profiler.mark("first_paint")
+
+        assert not profiler.enabled
+        assert profiler.phases == []
+        assert profiler.report() is None
+
+    def test_report_written_as_json(self, tmp_path, monkeypatch):
+        """Test delle fasi registrate e del report JSON scritto una sola volta."""
+        report_path = tmp_path / "startup.json"
+        monkeypatch.setenv(PROFILE_ENV_VAR, str(report_path))
+        profiler = StartupProfiler.from_environment(tmp_path / "default.json")
+
+        with profiler.phase("logging"):
+            pass
+        with pytest.raises(ImportError):
+            with profiler.phase("gui_library_imports"):
+                raise ImportError("customtkinter")
+        profiler.mark("first_paint")
+
+        data = profiler.report()
+        assert [p["phase"] for p in data["phases"]] == [
+            "logging", "gui_library_imports", "first_paint"
+        ]
+        assert json.loads(report_path.read_text()) == data
+        assert profiler.report() is None
+        assert not (tmp_path / "default.json").exists()
+
+
+def test_package_import_is_lazy():
+    """Test che importare il pacchetto e l'entry point non carichi lo stack pesante."""
+    data = _run_python(
+        "import json, logging, sys, time\n"
+        "start = time.perf_counter()\n"
+        "import dr_cdj, dr_cdj.main\n"
+        "elapsed = time.perf_counter() - start\n"
+        "heavy = ['numpy', 'customtkinter', 'tkinter', 'dr_cdj.analyzer', 'dr_cdj.converter']\n"
+        "print(json.dumps({'elapsed': elapsed, 'handlers': len(logging.root.handlers),\n"
+        "                  'loaded': [m for m in heavy if m in sys.modules]}))\n"
+    )
+
+    assert data["loaded"] == []
+    assert data["handlers"] == 0  # Il logging su file parte solo da main()
+    assert data["elapsed"] < IMPORT_BUDGET_SECONDS
+
+
+def test_converter_import_defers_numpy():
+    """Test che NumPy venga importato solo alla prima conversione nativa."""
+    data = _run_python(
+        "import json, sys\n"
+        "import dr_cdj\n"
+        "from dr_cdj.converter import AudioConverter\n"
+        "print(json.dumps({'numpy': 'numpy' in sys.modules,\n"
+        "                  'analyzer': dr_cdj.AudioAnalyzer.__module__}))\n"
+    )
+
+    assert data == {"numpy": False, "analyzer": "dr_cdj.analyzer"}
+
+
+def test_gui_import_defers_backend():
+    """Test che importare la GUI non carichi lo stack di analisi e conversione."""
+    pytest.importorskip("customtkinter")
+    pytest.importorskip("tkinterdnd2")
+    data = _run_python(
+        "import json, sys\n"
+        "import dr_cdj.gui\n"
+        "backend = ['dr_cdj.analyzer', 'dr_cdj.cache', 'dr_cdj.compatibility',\n"
+        "           'dr_cdj.converter', 'dr_cdj.discovery', 'dr_cdj.events', 'dr_cdj.journal']\n"
+        "print(json.dumps([m for m in backend if m in sys.modules]))\n"
+    )
+
+    assert data == []
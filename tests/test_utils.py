@@ -0,0 +1,92 @@
+"""Test per la ricerca e la cache dei binari ffmpeg/ffprobe."""
+
+import json
+import os
+import stat
+from unittest.mock import patch
+
+import pytest
+
+from dr_cdj import utils
+
+VERSION_SCRIPT = """#!/bin/sh
+echo "ffmpeg version 7.0.2 Copyright (c) 2000-2024"
+echo "configuration: --enable-gpl {flags}"
+"""
+
+
+@pytest.fixture(autouse=True)
+def binary_cache(tmp_path, monkeypatch):
+    """Cache dei binari isolata per ogni test."""
+    cache_path = tmp_path / "binaries.json"
+    monkeypatch.setattr(utils, "BINARY_CACHE_PATH", cache_path)
+    monkeypatch.setattr(utils, "_binary_memo", {})
+    monkeypatch.setattr(utils, "_resource_memo", {})
+    return cache_path
+
+
+def _fake_ffmpeg(path, flags="--enable-libsoxr"):
+    path.write_text(VERSION_SCRIPT.format(flags=flags))
+    path.chmod(path.stat().st_mode | stat.S_IXUSR)
+    return path
+
+
+@pytest.mark.skipif(os.name != "posix", reason="richiede uno script shell")
+class TestBinaryCache:
+    """Test suite per probe_binary e la cache persistente."""
+
+    def test_verified_binary_is_not_spawned_again(self, tmp_path, binary_cache):
+        """Test che un binario già verificato in un avvio precedente non venga rieseguito."""
+        ffmpeg = _fake_ffmpeg(tmp_path / "ffmpeg")
+
+        info = utils.probe_binary(str(ffmpeg))
+        assert info["version"] == "7.0.2"
+        assert info["capabilities"] == {"soxr": True}
+        assert str(ffmpeg.resolve()) in json.loads(binary_cache.read_text())["binaries"]
+
+        # Nuovo "avvio": memo di processo vuoto, resta solo il file di cache
+        utils._binary_memo.clear()
+        with patch("subprocess.run") as mock_run:
+            assert utils.verify_ffmpeg(str(ffmpeg))
+            assert utils.binary_capabilities(str(ffmpeg)) == {"soxr": True}
+        mock_run.assert_not_called()
+
+    def test_changed_binary_is_verified_again(self, tmp_path):
+        """Test che un binario aggiornato (dimensione/mtime diversi) venga riverificato."""
+        ffmpeg = _fake_ffmpeg(tmp_path / "ffmpeg")
+        assert utils.probe_binary(str(ffmpeg))["capabilities"]["soxr"]
+
+        _fake_ffmpeg(ffmpeg, flags="--disable-everything")
+        os.utime(ffmpeg, ns=(0, 0))
+
+        assert utils.probe_binary(str(ffmpeg))["capabilities"] == {"soxr": False}
+
+    def test_unrecognized_output_is_not_cached(self, tmp_path, binary_cache):
+        """Test che un binario che non stampa una versione non venga memorizzato."""
+        stub = tmp_path / "ffmpeg"
+        stub.write_text("#!/bin/sh\nexit 0\n")
+        stub.chmod(stub.stat().st_mode | stat.S_IXUSR)
+
+        assert utils.verify_ffmpeg(str(stub))
+        assert utils.cached_binary_info(str(stub)) is None
+        assert not binary_cache.exists()
+
+    def test_missing_binary(self, tmp_path):
+        """Test binario inesistente o nome nudo."""
+        assert utils.probe_binary(str(tmp_path / "missing")) is None
+        assert not utils.verify_ffmpeg("ffmpeg")
+
+
+def test_resource_path_is_memoized(tmp_path, monkeypatch):
+    """Test che la ricerca del binario avvenga una sola volta per processo."""
+    monkeypatch.delenv("DR_CDJ_FFMPEG_PATH", raising=False)
+    with patch.object(utils, "_find_resource", return_value="/opt/ffmpeg") as mock_find:
+        assert utils.get_resource_path("ffmpeg") == "/opt/ffmpeg"
+        assert utils.get_resource_path("ffmpeg") == "/opt/ffmpeg"
+    mock_find.assert_called_once()
+
+    # Una variabile d'ambiente diversa invalida il memo
+    monkeypatch.setenv("DR_CDJ_FFMPEG_PATH", str(tmp_path / "ffmpeg"))
+    with patch.object(utils, "_find_resource", return_value="ffmpeg") as mock_find:
+        assert utils.get_resource_path("ffmpeg") == "ffmpeg"
+    mock_find.assert_called_once()